@@ -71,7 +71,12 @@ const problemSchema = new mongoose.Schema({
     },
     equivalents: [{
       type: String  // Equivalent forms: "2/3", "0.666...", "4/6"
-    }]
+    }],
+    // Grid-in key resolved offline by scripts/sprAnswers.py:
+    // { value, exact, tolerance, alternates: [{ value, exact, tolerance }] }
+    numeric: {
+      type: mongoose.Schema.Types.Mixed
+    }
   },
 
   // Answer type for input validation
@@ -159,6 +164,7 @@ problemSchema.methods.checkAnswer = function(userAnswer) {
   return compareAnswer(userAnswer, {
     value: this.answer?.value ?? this.answer,
     equivalents: this.answer?.equivalents || [],
+    numeric: this.answer?.numeric,
     answerType: this.answerType,
     options: this.options,
     correctOption: this.correctOption,
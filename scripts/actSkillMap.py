@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Maps each Fable ACT item's category code and fine `skill` label to our ids.
+
+ACT items carry a per-item fine-grained `skill` (e.g. "Quadratic equations"); the
+skillId is its kebab slug under an `act-` prefix, so the diagnostic and
+personalization work at the exact-skill level. Items with no `skill` fall back
+to their reporting category. Kept dependency-free (no matplotlib) so the
+classifier service can load it without the figure toolchain.
+
+Public API:
+    CAT                      -> { Fable category code: our category name }
+    slug(name)               -> "act-<kebab name>"
+    act_skill(skill, cat)    -> (skillId, displayName)
+"""
+
+import re
+
+# Fable category code -> our category name.
+CAT = {
+    "NQ":  "number-quantity",
+    "ALG": "algebra",
+    "FUN": "functions",
+    "GEO": "geometry",
+    "SP":  "statistics-probability",
+    "IES": "integrating-essential-skills",
+}
+
+
+def slug(name):
+    return "act-" + re.sub(r"-+", "-", re.sub(r"[^a-z0-9]+", "-", name.lower())).strip("-")
+
+
+def act_skill(skill, category_code):
+    """(skillId, displayName) for an item's `skill` label, else its category."""
+    name = skill or CAT.get(category_code, "unknown")
+    return slug(name), name
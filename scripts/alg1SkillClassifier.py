@@ -19,10 +19,18 @@ so gold-standard Fable tags can be swapped in later with no rework.
 
 Public API:
     classify(item, module, is_spiral) -> (skillId, displayName)
+    classify(item, module, is_spiral, trace=True) -> (skillId, displayName, trace)
+    infer_secondary(entries)          -> { key: [(skillId, confidence)] }  (batch, whole bank)
+    secondary_rules(module)           -> [(skillId, compiled, secondary)]  (fallback not a source)
+    rule_context(item, module, is_spiral) -> (rulesModule, text)  (what the rules see)
+    slug(name) -> kebab id for a per-item Fable `skill` label
     NAMES  -> { skillId: displayName }  (every id this classifier can emit)
 """
 
 import re
+import time
+
+import secondarySkills
 
 # (skillId, displayName, regex) — matched case-insensitively against the prompt.
 # Catalog ids (seeds/skills-algebra-1.json) are reused verbatim where they exist.
@@ -165,9 +173,16 @@ for _mod, _rules in RULES.items():
     for _sid, _name, _pat in _rules:
         NAMES[_sid] = _name
 
-# Secondary skills an item ALSO exercises (populate Problem.secondarySkillIds).
-# Kept intentionally small — only genuine multi-skill overlaps. Mastery credit
-# today is primary-only, but this documents the coverage and is future-proof.
+# RULES with each pattern compiled once; classify() and the secondary-skill stage
+# both run off this, so the two can never disagree about what a pattern matches.
+COMPILED = {mod: [(sid, name, re.compile(pat)) for sid, name, pat in rules]
+            for mod, rules in RULES.items()}
+
+# Hand-confirmed secondary skills an item ALSO exercises. Kept intentionally
+# small — only genuine multi-skill overlaps; these always win (confidence 1.0).
+# Everything else comes from infer_secondary(), which scores every module's rules
+# in batch. Mastery credit today is primary-only, but this documents the coverage
+# and is future-proof.
 SECONDARY = {
     3: [("identifying-functions", r"a function"),
         ("domain-and-range", r"state the domain")],
@@ -175,13 +190,9 @@ SECONDARY = {
 
 
 def secondary_skills(item, module, primary, is_spiral=False):
-    """Return extra skillIds the item exercises, excluding the primary."""
-    rules_module = module
-    if is_spiral:
-        sm = _spiral_module(item.get("spiral_source"))
-        if sm is not None:
-            rules_module = sm
-    text = str(item.get("prompt", [""])[0]).lower()
+    """Return the hand-confirmed extra skillIds the item exercises, excluding the primary."""
+    rules_module = _rules_module(item, module, is_spiral)
+    text = _text(item)
     out = []
     for sid, pat in SECONDARY.get(rules_module, []):
         if sid != primary and sid not in out and re.search(pat, text):
@@ -189,6 +200,59 @@ def secondary_skills(item, module, primary, is_spiral=False):
     return out
 
 
+def secondary_rules(module):
+    """A module's rules for secondarySkills.infer. The last rule is the module's
+    fallback: it counts toward pattern statistics but never proposes a skill."""
+    rules = COMPILED.get(module, [])
+    return [(sid, rx, n < len(rules) - 1) for n, (sid, _name, rx) in enumerate(rules)]
+
+
+def infer_secondary(entries):
+    """Batch secondary skills for a whole bank.
+
+    entries: iterable of (key, item, module, primary, is_spiral). Returns
+    ({key: [(skillId, confidence)]}, stats): the hand-confirmed SECONDARY overlaps
+    at confidence 1.0, then whatever scripts/secondarySkills.py infers from every
+    rule of the item's rules module.
+    """
+    entries = list(entries)
+    records = [(key, _text(it), primary, _rules_module(it, mod, sp))
+               for key, it, mod, primary, sp in entries]
+    inferred, stats = secondarySkills.infer(records, secondary_rules)
+    out = {}
+    for key, it, mod, primary, sp in entries:
+        picked = [(sid, 1.0) for sid in secondary_skills(it, mod, primary, is_spiral=sp)]
+        for sid, conf in inferred.get(key, []):
+            if sid not in [s for s, _c in picked] and len(picked) < secondarySkills.MAX_PER_ITEM:
+                picked.append((sid, conf))
+        out[key] = picked
+    return out, stats
+
+
+def rule_context(item, module, is_spiral=False):
+    """(rules module, matched text) for an item — what COMPILED[rules module] runs on."""
+    return _rules_module(item, module, is_spiral), _text(item)
+
+
+def _text(item):
+    """The version-independent text the rules match against (first version's prompt)."""
+    return str(item.get("prompt", [""])[0]).lower()
+
+
+def _rules_module(item, module, is_spiral):
+    """Spiral-review items are classified under their SOURCE module's rules."""
+    if is_spiral:
+        sm = _spiral_module(item.get("spiral_source"))
+        if sm is not None:
+            return sm
+    return module
+
+
+def slug(name):
+    """kebab-case a skill name (used only for a future per-item Fable `skill` field)."""
+    return re.sub(r"-+", "-", re.sub(r"[^a-z0-9]+", "-", str(name).lower())).strip("-")
+
+
 def _spiral_module(source):
     """Map a spiral_source string ('M2', 'Pre-Algebra', ...) to a rules module."""
     if not source:
@@ -200,16 +264,47 @@ def _spiral_module(source):
     return int(m.group(1)) if m else None
 
 
-def classify(item, module, is_spiral=False):
-    """Return (skillId, displayName) for an item's version-independent skill."""
-    rules_module = module
-    if is_spiral:
-        sm = _spiral_module(item.get("spiral_source"))
-        if sm is not None:
-            rules_module = sm
-    text = str(item.get("prompt", [""])[0]).lower()
-    for sid, name, pat in RULES.get(rules_module, []):
-        if re.search(pat, text):
+def classify(item, module, is_spiral=False, trace=False):
+    """Return (skillId, displayName) for an item's version-independent skill.
+
+    With trace=True, returns (skillId, displayName, trace) where trace records the
+    rules module, every rule tried in order, the first match (rule index, pattern,
+    span offsets into the lowercased prompt) and the time spent. The default path
+    does none of that bookkeeping.
+    """
+    if trace:
+        return _classify_traced(item, module, is_spiral)
+    text = _text(item)
+    for sid, name, rx in COMPILED.get(_rules_module(item, module, is_spiral), []):
+        if rx.search(text):
             return sid, name
-    # Fallback: coarse module skill (kept honest, reported by the ingester).
+    return _fallback(module)
+
+
+def _fallback(module):
+    # Coarse module skill (kept honest, reported by the ingester).
     return "alg1-m%d" % module, MODULE_TOPIC.get(module, "Module %d" % module)
+
+
+def _classify_traced(item, module, is_spiral):
+    t0 = time.perf_counter()
+    text = _text(item)
+    rules_module = _rules_module(item, module, is_spiral)
+    tried = []
+    match = None
+    hit = _fallback(module)
+    for i, (sid, name, rx) in enumerate(COMPILED.get(rules_module, [])):
+        tried.append(sid)
+        m = rx.search(text)
+        if m:
+            match = {"rule": i, "skillId": sid, "pattern": rx.pattern, "span": [m.start(), m.end()],
+                     "matched": m.group(0)}
+            hit = (sid, name)
+            break
+    return hit[0], hit[1], {
+        "rulesModule": rules_module,
+        "tried": tried,
+        "match": match,
+        "fallback": match is None,
+        "us": int((time.perf_counter() - t0) * 1e6),
+    }
@@ -14,23 +14,25 @@ Confidence:
   med   correct target but granularity differs (unified is broader/narrower) — confirm
   low   genuinely uncertain / no clean home — needs a human decision
 
-Every mapping's target and alternatives are validated against the taxonomy, so a
-typo can't slip into the crosswalk. Item counts come from the generated bank so
-the worksheet can rank the judgment calls by how many items they move.
+The build itself is scripts/crosswalkBuilder.py, the generic builder every bank
+uses. It validates each target and alternative against the taxonomy, takes item
+counts from the bank index, and writes the crosswalk and worksheet. This script
+only seeds MAP rows for legacy ids the crosswalk does not have yet; reviewed
+rows are never overwritten.
 
 Usage: python3 scripts/alg1UnifiedCrosswalk.py
 """
 
 import json
 import os
-from collections import Counter
+
+import bankIndex  # scripts/ is sys.path[0] when run as a script
+import crosswalkBuilder
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 ROOT = os.path.dirname(HERE)
 
-TAX = os.path.join(ROOT, "seeds", "unified-taxonomy", "math_taxonomy.json")
 NAMES = os.path.join(ROOT, "seeds", "alg1-skill-names.json")
-ITEMS = os.path.join(ROOT, "seeds", "alg1-items.generated.json")
 
 CROSSWALK_OUT = os.path.join(ROOT, "seeds", "unified-taxonomy", "alg1-crosswalk.json")
 REVIEW_OUT = os.path.join(ROOT, "docs", "ALG1_UNIFIED_REVIEW.md")
@@ -128,120 +130,25 @@ MAP = {
 
 
 def main():
-    tax = json.load(open(TAX))
-    names = json.load(open(NAMES))
-    items = json.load(open(ITEMS))
-    tax_name = {s["skill_id"]: s["name"] for s in tax["skills"]}
-    tax_ids = set(tax_name)
-    counts = Counter(i["skillId"] for i in items)
-
-    # ---- validate ----
-    problems = []
-    for legacy in names:
-        if legacy not in MAP:
-            problems.append("legacy skill not mapped: %s" % legacy)
-    for legacy, (uid, conf, alts, note) in MAP.items():
-        if legacy not in names:
-            problems.append("mapped a legacy id that isn't in the bank: %s" % legacy)
-        if uid not in tax_ids:
-            problems.append("%s -> unknown unified id %s" % (legacy, uid))
-        for a in alts:
-            if a not in tax_ids:
-                problems.append("%s alternative %s not in taxonomy" % (legacy, a))
-        if conf not in ("high", "med", "low"):
-            problems.append("%s bad confidence %r" % (legacy, conf))
-    if problems:
-        print("VALIDATION FAILED:")
-        for p in problems:
-            print("  x", p)
-        raise SystemExit(1)
-
-    # ---- build crosswalk ----
-    rows = []
-    for legacy, (uid, conf, alts, note) in MAP.items():
-        rows.append({
-            "legacyId": legacy,
-            "legacyName": names[legacy],
-            "unifiedId": uid,
-            "unifiedName": tax_name[uid],
-            "confidence": conf,
-            "itemCount": counts.get(legacy, 0),
-            "alternatives": [{"id": a, "name": tax_name[a]} for a in alts],
-            "note": note,
-            "approved": conf == "high",   # high are pre-approved; human confirms med/low
-        })
-
-    by_conf = Counter(r["confidence"] for r in rows)
-    items_needing_review = sum(r["itemCount"] for r in rows if r["confidence"] != "high")
-    distinct_targets = len({r["unifiedId"] for r in rows})
-
-    crosswalk = {
-        "source": "algebra-1",
-        "legacySkillCount": len(rows),
-        "distinctUnifiedTargets": distinct_targets,
-        "totalItems": sum(counts.values()),
-        "confidenceCounts": dict(by_conf),
-        "itemsNeedingReview": items_needing_review,
-        "rows": rows,
-    }
-    json.dump(crosswalk, open(CROSSWALK_OUT, "w"), indent=2, ensure_ascii=False)
-
-    # ---- human worksheet: med/low first, ranked by item leverage ----
-    def block(title, conf):
-        sel = sorted([r for r in rows if r["confidence"] == conf],
-                     key=lambda r: -r["itemCount"])
-        if not sel:
-            return []
-        out = ["", "## %s (%d skills, %d items)" % (title, len(sel), sum(r["itemCount"] for r in sel)), ""]
-        out.append("| ✔ | items | legacy skill | → proposed unified | alternatives | note |")
-        out.append("|---|------:|--------------|--------------------|--------------|------|")
-        for r in sel:
-            alts = ", ".join("`%s` %s" % (a["id"], a["name"]) for a in r["alternatives"]) or "—"
-            out.append("| ☐ | %d | `%s` %s | `%s` **%s** | %s | %s |" % (
-                r["itemCount"], r["legacyId"], r["legacyName"],
-                r["unifiedId"], r["unifiedName"], alts, r["note"] or ""))
-        return out
-
-    md = [
-        "# Algebra 1 → Map of Mathmatix — migration review",
-        "",
-        "First step of migrating the Algebra 1 bank onto the unified taxonomy "
-        "(`seeds/unified-taxonomy/math_taxonomy.json`). Auto-generated by "
-        "`scripts/alg1UnifiedCrosswalk.py`; the machine crosswalk is "
-        "`seeds/unified-taxonomy/alg1-crosswalk.json`.",
-        "",
-        "**Nothing has been re-tagged yet.** This is the review gate: confirm or "
-        "correct the judgment calls below, then the crosswalk is applied to the "
-        "798 items and re-seeded.",
-        "",
-        "## Summary",
-        "",
-        "- **%d** legacy Alg1 skills → **%d** distinct unified skills." % (len(rows), distinct_targets),
-        "- Confidence: **%d high** (pre-approved), **%d medium**, **%d low**."
-        % (by_conf.get("high", 0), by_conf.get("med", 0), by_conf.get("low", 0)),
-        "- **%d of %d items** sit under a medium/low mapping — that's where your review matters."
-        % (items_needing_review, sum(counts.values())),
-        "",
-        "### How to review",
-        "",
-        "For each row in the **medium** and **low** tables: tick ✔ if the proposed "
-        "unified skill is right, or write the id you'd prefer (alternatives listed). "
-        "The **high** table is included last for completeness — skim, don't sweat it. "
-        "I'll apply your edits to the crosswalk and run the re-tag + re-seed.",
-    ]
-    md += block("🔴 LOW confidence — needs a decision", "low")
-    md += block("🟡 MEDIUM confidence — quick confirm", "med")
-    md += block("🟢 HIGH confidence — pre-approved (skim)", "high")
-    md.append("")
-    open(REVIEW_OUT, "w").write("\n".join(md))
-
-    print("Alg1 -> unified crosswalk built.")
-    print("  %d legacy skills -> %d unified skills | %d total items"
-          % (len(rows), distinct_targets, sum(counts.values())))
-    print("  confidence: %d high / %d med / %d low  |  %d items under med/low (review)"
-          % (by_conf.get("high", 0), by_conf.get("med", 0), by_conf.get("low", 0), items_needing_review))
-    print("  wrote %s" % os.path.relpath(CROSSWALK_OUT, os.getcwd()))
-    print("  wrote %s" % os.path.relpath(REVIEW_OUT, os.getcwd()))
+    """Seed rows for legacy ids the crosswalk does not have yet, then rebuild it.
+
+    Rows already in the crosswalk are the reviewed mapping and always win — MAP
+    is the first-pass proposal, and several of its targets were since corrected
+    in review (order-of-operations now lands on MS.EQV.10, not MS.QNT.8).
+    Rebuilding from MAP would silently undo those decisions.
+    """
+    spec = json.load(open(CROSSWALK_OUT)) if os.path.exists(CROSSWALK_OUT) else {
+        "source": "algebra-1", "title": "Algebra 1", "banks": ["alg1-items"],
+        "names": os.path.relpath(NAMES, ROOT), "review": os.path.relpath(REVIEW_OUT, ROOT), "rows": []}
+    have = {r["legacyId"] for r in spec["rows"]}
+    new = [{"legacyId": legacy, "unifiedId": uid, "confidence": conf, "alternatives": alts, "note": note}
+           for legacy, (uid, conf, alts, note) in MAP.items() if legacy not in have]
+    if new:
+        spec["rows"] += new
+        json.dump(spec, open(CROSSWALK_OUT, "w"), indent=2, ensure_ascii=False)
+        print("  + %d row(s) from MAP not yet in the crosswalk" % len(new))
+    bankIndex.refresh()
+    crosswalkBuilder.run(CROSSWALK_OUT)
 
 
 if __name__ == "__main__":
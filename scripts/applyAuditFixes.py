@@ -9,7 +9,8 @@ SKILL_GRAPH_AUDIT_FINDINGS.json involve judgment about how strict the graph
 should be, and each new edge locks students behind more work — those stay
 unapplied until ruled on.
 
-Idempotent: re-running is a no-op. Prints a diff of what it changed.
+Idempotent: re-running is a no-op. Prints a diff of what it changed. The edited
+graph is validated (scripts/taxonomyGraph.py) before anything is written.
 
 Usage: python3 scripts/applyAuditFixes.py [--dry-run]
 """
@@ -18,6 +19,8 @@ import argparse
 import json
 import os
 
+import taxonomyGraph  # scripts/ is sys.path[0] when run as a script
+
 HERE = os.path.dirname(os.path.abspath(__file__))
 ROOT = os.path.dirname(HERE)
 TAX = os.path.join(ROOT, "seeds", "unified-taxonomy", "math_taxonomy.json")
@@ -81,11 +84,11 @@ def main():
     args = ap.parse_args()
 
     tax = json.load(open(TAX))
-    by_id = {s["skill_id"]: s for s in tax["skills"]}
+    graph = taxonomyGraph.SkillGraph.from_taxonomy(tax)
 
     changed = 0
     for skill_id, field, new, why in FIXES:
-        skill = by_id.get(skill_id)
+        skill = graph.get(skill_id)
         if skill is None:
             raise SystemExit("unknown skill in fix list: %s" % skill_id)
         old = skill.get(field) or []
@@ -94,9 +97,11 @@ def main():
             continue
         print("  ~ %-13s %-18s %s -> %s" % (skill_id, field, old, new))
         print("      %s" % why.replace("\n", "\n      "))
-        skill[field] = new
+        graph.set_edges(skill_id, field, new)
         changed += 1
 
+    print()
+    taxonomyGraph.check(graph, "after audit fixes")
     if args.dry_run:
         print("\ndry run -- %d change(s) not written" % changed)
         return
@@ -4,85 +4,26 @@ Correctness audit for the Fable Algebra 1 assessment bank
 (seeds/alg1-assessments/alg1_m*.json). Runs every per-version `verify` snippet
 (python/sympy) and reports pass/fail, so a wrong answer key can't slip in.
 
-Six snippets are KNOWN false-positives — the math is correct but the authored
-snippet trips on a Python-float-vs-int comparison (`f.subs(x, 2.0) == -3`) or on
-sympy structural `==` of a factored form. These are allowlisted below (each was
-hand-verified). The audit exits non-zero only if a NEW failure appears.
+Asserted equality is checked BY VALUE by default: each `==` in an `assert` is
+rewritten to numericEquiv.numeq, so every snippet passes or fails on its math.
+Six snippets only pass that way. Their math is correct, but as authored they
+trip on a Python-float-vs-int comparison (`f.subs(x, 2.0) == -3`) or on sympy
+structural `==` of a factored form. With --exact the snippets run as authored
+and those six are allowlisted in auditBanks.KNOWN_FALSE_POSITIVES (each was
+hand-verified). In either mode the audit exits non-zero only if a NEW failure
+appears.
+
+The walk, the allowlist and the report live in scripts/auditBanks.py (one engine
+for every bank); this is the Algebra 1 entry point, kept for `npm run alg1:audit`.
 
 Requires: sympy  (pip install sympy)
-Usage: python3 scripts/auditAlg1Items.py
+Usage: python3 scripts/auditAlg1Items.py [--jobs N] [--timeout SEC] [--mem-mb MB] [--force] [--exact] [--json PATH] [--junit PATH]
+  (options as in scripts/auditBanks.py)
 """
 
-import json
-import os
-import io
 import sys
-import contextlib
-
-HERE = os.path.dirname(os.path.abspath(__file__))
-ROOT = os.path.dirname(HERE)
-SRC = os.path.join(ROOT, "seeds", "alg1-assessments")
-MODULES = [1, 2, 3, 4, 5, 6, 7, 10, 11]
-
-# Known snippet-level false-positives (answer hand-verified correct):
-#   M11 test n=9  (vertex): snippet uses float division 2.0 then compares Float == int
-#   M11 test spiral n=19 (factoring): sympy structural `==` on factored output
-KNOWN_FALSE_POSITIVES = {
-    "M11/test/items/n9/v1", "M11/test/items/n9/v2", "M11/test/items/n9/v3",
-    "M11/test/spiral/n19/v1", "M11/test/spiral/n19/v2", "M11/test/spiral/n19/v3",
-}
-
-
-def run_snippet(code):
-    g = {}
-    with contextlib.redirect_stdout(io.StringIO()):
-        exec(code, g)
-
-
-def main():
-    total = passed = skipped = 0
-    new_fail = []
-    known_fail = []
-
-    for mod in MODULES:
-        data = json.load(open(os.path.join(SRC, "alg1_m%d.json" % mod)))
-        for section in ("quiz", "test"):
-            for grp in ("items", "spiral"):
-                for it in data.get(section, {}).get(grp, []):
-                    for vi, snip in enumerate(it.get("verify") or []):
-                        loc = "M%d/%s/%s/n%d/v%d" % (mod, section, grp, it["n"], vi + 1)
-                        if not snip:
-                            skipped += 1
-                            continue
-                        total += 1
-                        try:
-                            run_snippet(snip)
-                            passed += 1
-                        except Exception as e:
-                            entry = (loc, "%s: %s" % (type(e).__name__, str(e)[:70]))
-                            if loc in KNOWN_FALSE_POSITIVES:
-                                known_fail.append(entry)
-                            else:
-                                new_fail.append(entry)
-
-    print("Algebra 1 verify audit")
-    print("  snippets run: %d | passed: %d | null-skipped: %d" % (total, passed, skipped))
-    print("  known false-positives (allowlisted, math verified): %d" % len(known_fail))
-    for loc, msg in known_fail:
-        print("    ~ %s  %s" % (loc, msg))
-    unexpectedly_ok = KNOWN_FALSE_POSITIVES - {loc for loc, _ in known_fail}
-    if unexpectedly_ok:
-        print("  note: allowlisted snippets that now PASS (safe to drop from allowlist): %s"
-              % ", ".join(sorted(unexpectedly_ok)))
-
-    if new_fail:
-        print("\n  NEW FAILURES (%d) — investigate before shipping:" % len(new_fail))
-        for loc, msg in new_fail:
-            print("    ✗ %s  %s" % (loc, msg))
-        sys.exit(1)
-
-    print("\n  OK — no new failures. Bank is correctness-clean.")
 
+import auditBanks  # scripts/ is sys.path[0] when run as a script
 
 if __name__ == "__main__":
-    main()
+    auditBanks.main(["alg1"] + sys.argv[1:])
@@ -0,0 +1,589 @@
+#!/usr/bin/env python3
+"""
+One correctness audit for every Fable bank that carries machine `verify`
+snippets, with a machine-readable report.
+
+Each bank is a small adapter that walks its source files and yields
+(location, snippet) pairs plus any structural issues; the engine runs every
+bank's snippets in ONE pass through scripts/verifyRunner.py (shared worker
+pool, per-snippet limits, result cache) and reports per bank:
+
+  alg1   seeds/alg1-assessments/alg1_m*.json   module/section/group/item/version
+         ("M11/test/items/n9/v1"); KNOWN_FALSE_POSITIVES allowlisted below
+  sat    seeds/sat-math/sat_w*.json            "W3 Q12 (spr)" + answer structure
+  calc   seeds/calc-ab/calc_w*.json            MC items and FRQ parts ("W2 FRQ(b)")
+  act    seeds/fable-act/{test,topup}*.json    "test4 Q31" + answer structure
+
+ACT snippets differ from the rest: they RECOMPUTE the answer (print it, or end
+in a bare expression) rather than assert it. The adapter wraps each one so the
+recomputed value is compared with the choices, number by number: output that
+matches a DIFFERENT choice than the key is a failure; output that matches no
+choice (prose, an unrounded float) only proves the snippet runs, and passes.
+
+Equality in the asserting banks (alg1, sat, calc) is checked BY VALUE: every
+`==` at the top of an `assert` in a sympy snippet is rewritten to
+numericEquiv.numeq, which samples both sides at random points and only asks
+sympy when they disagree. sympy's own `==` is structural — Float(-3.0) != -3,
+a factored form != its expansion — which is exactly what KNOWN_FALSE_POSITIVES
+papers over; with the numeric path those snippets pass on their merits, so the
+allowlist only applies under --exact (the snippets as authored).
+
+The audit is INCREMENTAL. Every snippet is fingerprinted by the content of the
+item version it checks (prompt, choices, answer key, and the snippet itself),
+and seeds/audit-snapshot.json (git-ignored) keeps each fingerprint with its last
+outcome. A re-run diffs the banks against that snapshot: only new or changed
+item versions are rewritten and re-verified, the rest are carried forward, and
+the report says how many of each. Structural checks always run in full (they
+are cheap). The snapshot is per mode (--exact or not) and per library versions;
+--force, --profile, a bump of AUDIT_VERSION (do it when the engine changes what
+a verdict means) or any edit to numericEquiv.py re-verify everything. The same
+engine tag salts the verify-cache key, so the snippet cache cannot serve a
+verdict from before the change either.
+
+The low-volume / top-up banks are generated without verify snippets, so there
+is nothing to run for them here.
+
+Exit status: 1 on any failure or structural issue, 2 when the only problems are
+snippets that hit --timeout / --mem-mb or crashed their worker, else 0.
+
+Usage: python3 scripts/auditBanks.py [bank ...] [--json PATH] [--junit PATH]
+                                     [--profile [N]] [--cprofile] [--exact]
+                                     [--jobs N] [--timeout SEC] [--mem-mb MB] [--force]
+  bank          any of alg1, sat, calc, act (default: all)
+  --json PATH   per-snippet report: location, outcome, error class, seconds, cached, carried
+  --junit PATH  the same as JUnit XML (one testsuite per bank) for CI dashboards
+  --profile N   re-run everything (no cache) and list the N slowest snippets (default 20)
+  --cprofile    also profile each snippet and rank the sympy/numpy calls snippets make
+                ("sympy/simplify/simplify.py:simplify") by total time, with the
+                snippets that spend the most in each — what to rewrite first
+  --exact       run snippets as authored: sympy structural ==, allowlist applies
+"""
+
+import argparse
+import ast
+import contextlib
+import glob
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import time
+from collections import OrderedDict, defaultdict, namedtuple
+from xml.etree import ElementTree as ET
+
+import verifyRunner
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+ALG1_SRC = os.path.join(ROOT, "seeds", "alg1-assessments")
+SAT_SRC = os.path.join(ROOT, "seeds", "sat-math")
+CALC_SRC = os.path.join(ROOT, "seeds", "calc-ab")
+ACT_SRC = os.path.join(ROOT, "seeds", "fable-act")
+SNAPSHOT = os.path.join(ROOT, "seeds", "audit-snapshot.json")
+ALG1_MODULES = [1, 2, 3, 4, 5, 6, 7, 10, 11]
+WEEKS = [1, 2, 3, 4, 5]
+
+# Known snippet-level false-positives under --exact (answer hand-verified correct):
+#   M11 test n=9  (vertex): snippet uses float division 2.0 then compares Float == int
+#   M11 test spiral n=19 (factoring): sympy structural `==` on factored output
+KNOWN_FALSE_POSITIVES = {
+    "M11/test/items/n9/v1", "M11/test/items/n9/v2", "M11/test/items/n9/v3",
+    "M11/test/spiral/n19/v1", "M11/test/spiral/n19/v2", "M11/test/spiral/n19/v3",
+}
+
+# Bump when a change to the engine can flip a verdict, so the snapshot's
+# carried-forward results and the cached snippet verdicts are discarded.
+# numericEquiv.py is covered without a bump: its source hash is in the tag.
+AUDIT_VERSION = 1
+NUMERIC_EQUIV = os.path.join(HERE, "numericEquiv.py")
+
+# A bank's walk: every (location, snippet, fingerprint) to run, how many items
+# had none, structural issues.
+Walk = namedtuple("Walk", "snippets skipped struct")
+
+
+def fingerprint(*parts):
+    """Content hash of what a snippet's verdict depends on."""
+    blob = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:20]
+
+
+def _version(field, vi):
+    """An Alg1 field's value for version vi (per-version fields are lists)."""
+    if isinstance(field, list):
+        return field[vi] if vi < len(field) else None
+    return field
+
+
+def alg1_walk():
+    snippets, skipped = [], 0
+    for mod in ALG1_MODULES:
+        data = json.load(open(os.path.join(ALG1_SRC, "alg1_m%d.json" % mod)))
+        for section in ("quiz", "test"):
+            for grp in ("items", "spiral"):
+                for it in data.get(section, {}).get(grp, []):
+                    for vi, snip in enumerate(it.get("verify") or []):
+                        loc = "M%d/%s/%s/n%d/v%d" % (mod, section, grp, it["n"], vi + 1)
+                        if not snip:
+                            skipped += 1
+                            continue
+                        snippets.append((loc, snip, fingerprint(
+                            _version(it.get("prompt"), vi), _version(it.get("choices"), vi),
+                            _version(it.get("answer"), vi), snip)))
+    return Walk(snippets, skipped, [])
+
+
+def sat_structural_issue(it):
+    if it["type"] == "mc":
+        ch = it.get("choices") or []
+        if len(ch) < 2:
+            return "mc with <2 choices"
+        ai = it.get("answer")
+        if not isinstance(ai, int) or ai < 0 or ai >= len(ch):
+            return "mc answer index %r out of range" % (ai,)
+    else:
+        if it.get("spr_answer") in (None, ""):
+            return "spr missing spr_answer"
+    return None
+
+
+def sat_walk():
+    snippets, skipped, struct = [], 0, []
+    for wk in WEEKS:
+        data = json.load(open(os.path.join(SAT_SRC, "sat_w%d.json" % wk)))
+        for it in data["items"]:
+            loc = "W%d Q%d (%s)" % (wk, it["n"], it["type"])
+            si = sat_structural_issue(it)
+            if si:
+                struct.append((loc, si))
+            v = it.get("verify")
+            if not v:
+                skipped += 1
+                continue
+            snippets.append((loc, v, fingerprint(
+                it.get("stem"), it.get("choices"), it.get("answer"), it.get("spr_answer"),
+                it.get("equivalents"), it.get("answer_any"), v)))
+    return Walk(snippets, skipped, struct)
+
+
+def calc_walk():
+    snippets, skipped = [], 0
+    for wk in WEEKS:
+        data = json.load(open(os.path.join(CALC_SRC, "calc_w%d.json" % wk)))
+        entries = [("W%d MC%d" % (wk, it["n"]), it.get("verify"),
+                    (it.get("stem"), it.get("choices"), it.get("answer"))) for it in data["mc"]]
+        entries += [("W%d FRQ(%s)" % (wk, p["label"]), p.get("verify"),
+                     (data["frq"].get("context"), p.get("prompt"), p.get("solution")))
+                    for p in data["frq"].get("parts", [])]
+        for loc, v, content in entries:
+            if not v:
+                skipped += 1
+                continue
+            snippets.append((loc, v, fingerprint(*content + (v,))))
+    return Walk(snippets, skipped, [])
+
+
+# --- ACT: compare the recomputed value against the choices -------------------
+
+# Bump when act_key_check changes, so cached ACT results are invalidated.
+ACT_CHECK_VERSION = 2
+_NUM = re.compile(r"-?\d+(?:\.(\d+))?(?:/\d+(?:\.\d+)?)?")
+
+
+def _numbers(text):
+    """[(value, tolerance)] for each number in text, in order; [] unless the text
+    is purely numeric ("$276", "{−13, 7}", "5√2", "5*sqrt(2)") — the numbers in
+    "C(m) = 45m + 60" are coefficients, not a value. A decimal choice like
+    "12.57" tolerates rounding to its own precision."""
+    t = str(text).replace("−", "-").replace("–", "-")
+    if re.search(r"[A-Za-z]", re.sub(r"sqrt|pi|oo", "", t)):
+        return []
+    t = re.sub(r"(?<=\d),(?=\d{3}\b)", "", t)            # 1,200 -> 1200 (not [3,7])
+    out = []
+    for m in _NUM.finditer(t):
+        tok = m.group(0)
+        if "/" in tok:
+            num, den = tok.split("/")
+            if float(den) == 0:
+                continue
+            out.append((float(num) / float(den), 1e-6))
+        else:
+            places = len(m.group(1) or "")
+            out.append((float(tok), 0.5 * 10 ** -places if places else 1e-6))
+    return out
+
+
+def _same(got, want):
+    return len(got) == len(want) and all(
+        abs(g - w) <= max(tol, 1e-6 * abs(w)) for (g, _), (w, tol) in zip(got, want))
+
+
+def _recompute(snippet):
+    """Run an ACT snippet; its printed output, or the value of a final bare expression."""
+    g, tree = verifyRunner.prepare(snippet)
+    tail = None
+    if tree.body and isinstance(tree.body[-1], ast.Expr):
+        tail = ast.Expression(tree.body.pop().value)
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        exec(compile(tree, "<verify>", "exec"), g)
+        if tail is not None:
+            value = eval(compile(tail, "<verify>", "eval"), g)
+            if value is not None:
+                print(value)
+    return buf.getvalue()
+
+
+def act_key_check(snippet, choices, answer):
+    """Raise when the recomputed value matches some choice other than the key."""
+    got = _numbers(_recompute(snippet))
+    if not got:
+        return
+    matches = [i for i, c in enumerate(choices) if _same(got, _numbers(c))]
+    if matches and answer not in matches:
+        raise AssertionError("recomputes to choice %s, key is %s"
+                             % ("/".join("ABCDE"[i] for i in matches), "ABCDE"[answer]))
+
+
+def act_structural_issue(q):
+    ch = q.get("choices") or []
+    if len(ch) != 4:
+        return "expected 4 choices, got %d" % len(ch)
+    ai = q.get("answer")
+    if not isinstance(ai, int) or ai < 0 or ai >= len(ch):
+        return "answer index %r out of range" % (ai,)
+    return None
+
+
+def act_walk():
+    snippets, skipped, struct = [], 0, []
+    files = sorted(glob.glob(os.path.join(ACT_SRC, "test*.json"))) + \
+        sorted(glob.glob(os.path.join(ACT_SRC, "topup*.json")))
+    for path in files:
+        name = os.path.splitext(os.path.basename(path))[0]
+        for q in json.load(open(path))["questions"]:
+            loc = "%s Q%d" % (name, q["n"])
+            si = act_structural_issue(q)
+            if si:
+                struct.append((loc, si))
+                continue
+            if not q.get("verify"):
+                skipped += 1
+                continue
+            code = ("# act-key-check v%d\nfrom auditBanks import act_key_check\n"
+                    "act_key_check(%r, %r, %r)\n" % (ACT_CHECK_VERSION, q["verify"], q["choices"], q["answer"]))
+            snippets.append((loc, code, fingerprint(q.get("stem"), code)))
+    return Walk(snippets, skipped, struct)
+
+
+# --- value equality for asserting snippets -----------------------------------
+
+def _by_value(test):
+    """Rewrite the `a == b` comparisons an assert's truth rests on (through
+    and/or/not, never inside calls or comprehensions) to _numeq(a, b)."""
+    if isinstance(test, ast.BoolOp):
+        test.values = [_by_value(v) for v in test.values]
+    elif isinstance(test, ast.UnaryOp) and isinstance(test.op, ast.Not):
+        test.operand = _by_value(test.operand)
+    elif isinstance(test, ast.Compare) and len(test.ops) == 1 and isinstance(test.ops[0], ast.Eq):
+        return ast.copy_location(ast.Call(ast.Name("_numeq", ast.Load()),
+                                          [test.left, test.comparators[0]], []), test)
+    return test
+
+
+def numeric_rewrite(code):
+    """The snippet with its asserted equalities checked by value (sympy snippets only;
+    plain-Python ones already compare by value)."""
+    if "sympy" not in code:
+        return code
+    tree = ast.parse(code)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assert):
+            node.test = _by_value(node.test)
+    return "from numericEquiv import numeq as _numeq\n" + ast.unparse(tree)
+
+
+# bank -> (report title, walk, allowlist under --exact, asserts equality)
+BANKS = OrderedDict([
+    ("alg1", ("Algebra 1", alg1_walk, KNOWN_FALSE_POSITIVES, True)),
+    ("sat", ("Digital SAT Math", sat_walk, set(), True)),
+    ("calc", ("AP Calculus AB", calc_walk, set(), True)),
+    ("act", ("ACT Math", act_walk, set(), False)),
+])
+
+
+# --- incremental: diff against the last audited snapshot ---------------------
+
+def engine_tag():
+    """What a verdict depends on in this engine: AUDIT_VERSION and the numericEquiv source."""
+    numeq = hashlib.sha256(open(NUMERIC_EQUIV, "rb").read()).hexdigest()[:12]
+    return "audit=%d numeq=%s" % (AUDIT_VERSION, numeq)
+
+
+def _snapshot_tag():
+    return "%s %s" % (verifyRunner.env_tag(), engine_tag())
+
+
+def load_snapshot(exact, path=SNAPSHOT):
+    """{bank: {loc: {"hash", "outcome", "error", "seconds"}}} from the last audit
+    in this mode, or {} when there is none or it was made under other versions."""
+    try:
+        data = json.load(open(path))
+    except (OSError, ValueError):
+        return {}
+    mode = data.get("exact" if exact else "value") or {}
+    return mode.get("banks", {}) if mode.get("env") == _snapshot_tag() else {}
+
+
+def save_snapshot(exact, audited, path=SNAPSHOT):
+    """Record this run's fingerprints and outcomes; banks not audited keep theirs."""
+    try:
+        data = json.load(open(path))
+    except (OSError, ValueError):
+        data = {}
+    key = "exact" if exact else "value"
+    tag = _snapshot_tag()
+    banks = data[key]["banks"] if data.get(key, {}).get("env") == tag else {}
+    for bank, rows in audited.items():
+        banks[bank] = {loc: {"hash": digest, "outcome": r.outcome, "error": r.error, "seconds": r.seconds}
+                       for loc, digest, r in rows}
+    data[key] = {"env": tag, "banks": banks}
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+# What changed in one bank since its snapshot. carried: {loc: Result} reused as-is.
+Delta = namedtuple("Delta", "carried changed added retried removed")
+
+
+def diff_walk(walk, prev):
+    """Split a bank's snippets into carried-forward results and the ones to re-run.
+    Only PASS/FAIL carry; a TIMEOUT/OOM/CRASH is retried like a change."""
+    carried, changed, added, retried = {}, [], [], []
+    for loc, _code, digest in walk.snippets:
+        old = prev.get(loc)
+        if old is None:
+            added.append(loc)
+        elif old["hash"] != digest:
+            changed.append(loc)
+        elif old["outcome"] not in (verifyRunner.PASS, verifyRunner.FAIL):
+            retried.append(loc)
+        else:
+            carried[loc] = verifyRunner.Result(old["outcome"], old["error"], old["seconds"], True)
+    current = {loc for loc, _, _ in walk.snippets}
+    removed = sorted(loc for loc in prev if loc not in current)
+    return Delta(carried, changed, added, retried, removed)
+
+
+def print_delta(delta):
+    if delta is None:
+        print("  full audit: no snapshot to diff against (or --force), every snippet verified")
+        return
+    print("  since the last audit: %d changed, %d new, %d retried, %d removed | carried forward: %d"
+          % (len(delta.changed), len(delta.added), len(delta.retried), len(delta.removed),
+             len(delta.carried)))
+    for loc in delta.changed[:10]:
+        print("    Δ %s" % loc)
+    if len(delta.changed) > 10:
+        print("    … %d more" % (len(delta.changed) - 10))
+
+
+def error_class(r):
+    if r.outcome in verifyRunner.LIMITED:
+        return r.outcome.capitalize()
+    return r.error.split(":", 1)[0] if r.error else None
+
+
+def print_bank(title, walk, rows, allowlist, delta=None):
+    """Human report for one bank; returns (has failures, limited count)."""
+    passed = sum(1 for _, r in rows if r.outcome == verifyRunner.PASS)
+    fails = [(loc, r.error) for loc, r in rows if r.outcome == verifyRunner.FAIL]
+    known = [(loc, msg) for loc, msg in fails if loc in allowlist]
+    new = [(loc, msg) for loc, msg in fails if loc not in allowlist]
+
+    print("%s verify audit" % title)
+    print("  snippets run: %d | passed: %d | null-skipped: %d" % (len(rows), passed, walk.skipped))
+    print_delta(delta)
+    carried = delta.carried if delta else {}
+    verifyRunner.print_cache_note([(loc, r) for loc, r in rows if loc not in carried])
+    if allowlist:
+        print("  known false-positives (allowlisted, math verified): %d" % len(known))
+        for loc, msg in known:
+            print("    ~ %s  %s" % (loc, msg))
+        now_ok = sorted(loc for loc, r in rows if loc in allowlist and r.outcome == verifyRunner.PASS)
+        if now_ok:
+            print("  note: allowlisted snippets that now PASS (safe to drop from allowlist): %s"
+                  % ", ".join(now_ok))
+    if walk.struct:
+        print("\n  STRUCTURAL ISSUES (%d):" % len(walk.struct))
+        for loc, msg in walk.struct:
+            print("    x %s  %s" % (loc, msg))
+    if new and allowlist:
+        print("\n  NEW FAILURES (%d) — investigate before shipping:" % len(new))
+        for loc, msg in new:
+            print("    ✗ %s  %s" % (loc, msg))
+    elif new:
+        print("\n  VERIFY FAILURES (%d):" % len(new))
+        for loc, msg in new:
+            print("    x %s  %s" % (loc, msg))
+    limited = verifyRunner.print_limited(rows)
+    if not (new or walk.struct or limited):
+        print("\n  OK — %s" % ("no new failures. Bank is correctness-clean." if allowlist
+                              else "every verified answer checks out."))
+    return bool(new or walk.struct), limited
+
+
+def snippet_records(bank, rows, allowlist, carried=()):
+    recs = []
+    for loc, r in rows:
+        rec = {"bank": bank, "loc": loc, "outcome": r.outcome, "errorClass": error_class(r),
+               "error": r.error, "seconds": r.seconds, "cached": r.cached, "carried": loc in carried,
+               "allowlisted": r.outcome == verifyRunner.FAIL and loc in allowlist}
+        if r.calls is not None:
+            rec["calls"] = r.calls
+        recs.append(rec)
+    return recs
+
+
+def hot_spots(records):
+    """Library functions ranked by the time snippets spend in them directly:
+    [{"function", "seconds", "snippets", "worst": [(where, seconds)]}]."""
+    total = defaultdict(float)
+    where = defaultdict(list)
+    for s in records:
+        for fn, sec in (s.get("calls") or {}).items():
+            total[fn] += sec
+            where[fn].append(("%s %s" % (s["bank"], s["loc"]), sec))
+    return [{"function": fn, "seconds": round(total[fn], 4), "snippets": len(where[fn]),
+             "worst": sorted(where[fn], key=lambda p: -p[1])[:3]}
+            for fn in sorted(total, key=lambda f: -total[f])]
+
+
+def print_profile(records, top, spots):
+    ranked = sorted(records, key=lambda s: -s["seconds"])[:top]
+    print("\nSlowest snippets (top %d of %d, %.1fs of snippet time in all):"
+          % (len(ranked), len(records), sum(s["seconds"] for s in records)))
+    for s in ranked:
+        print("  %8.3fs  %-5s %-28s %s" % (s["seconds"], s["bank"], s["loc"], s["outcome"]))
+    if spots is None:
+        return
+    print("\nHot spots — sympy/numpy calls made directly by snippets (inclusive time):")
+    if not spots:
+        print("  (none recorded — is sympy installed?)")
+    for h in spots[:top]:
+        print("  %8.3fs  %4d snippets  %s" % (h["seconds"], h["snippets"], h["function"]))
+        print("              worst: %s" % ", ".join("%s (%.3fs)" % w for w in h["worst"]))
+
+
+def write_junit(path, report):
+    suites = ET.Element("testsuites", time="%.3f" % report["seconds"])
+    for bank, summary in report["banks"].items():
+        recs = [s for s in report["snippets"] if s["bank"] == bank]
+        suite = ET.SubElement(suites, "testsuite", name=bank, tests=str(len(recs)),
+                              failures=str(summary["failed"]), errors=str(summary["limited"]),
+                              skipped=str(summary["allowlisted"]),
+                              time="%.3f" % sum(s["seconds"] for s in recs))
+        for s in recs:
+            case = ET.SubElement(suite, "testcase", classname=bank, name=s["loc"], time="%.4f" % s["seconds"])
+            if s["allowlisted"]:
+                ET.SubElement(case, "skipped", message="known false-positive: %s" % s["error"])
+            elif s["outcome"] == verifyRunner.FAIL:
+                ET.SubElement(case, "failure", type=s["errorClass"], message=s["error"])
+            elif s["outcome"] != verifyRunner.PASS:
+                ET.SubElement(case, "error", type=s["errorClass"], message=s["error"])
+        for loc, msg in report["structural"].get(bank, []):
+            case = ET.SubElement(suite, "testcase", classname=bank, name="%s [structure]" % loc, time="0")
+            ET.SubElement(case, "failure", type="Structural", message=msg)
+    ET.ElementTree(suites).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("banks", nargs="*", metavar="bank", help="any of %s (default: all)" % ", ".join(BANKS))
+    ap.add_argument("--json", help="write the per-snippet report as JSON to PATH")
+    ap.add_argument("--junit", help="write the per-snippet report as JUnit XML to PATH")
+    ap.add_argument("--profile", type=int, nargs="?", const=20, metavar="N",
+                    help="re-run everything and list the N slowest snippets (default 20)")
+    ap.add_argument("--cprofile", action="store_true",
+                    help="with --profile, also rank the sympy/numpy calls snippets spend time in")
+    ap.add_argument("--exact", action="store_true",
+                    help="no numeric fast path: sympy structural == as authored (allowlist applies)")
+    verifyRunner.add_args(ap)
+    args = ap.parse_args(argv)
+    unknown = [b for b in args.banks if b not in BANKS]
+    if unknown:
+        ap.error("unknown bank(s) %s (expected any of %s)" % (", ".join(unknown), ", ".join(BANKS)))
+    banks = args.banks or list(BANKS)
+    if args.cprofile and args.profile is None:
+        args.profile = 20
+
+    t0 = time.perf_counter()
+    full = args.force or args.profile is not None
+    walks = OrderedDict((b, BANKS[b][1]()) for b in banks)
+    snapshot = {} if full else load_snapshot(args.exact)
+    deltas = OrderedDict((b, diff_walk(w, snapshot[b]) if b in snapshot else None) for b, w in walks.items())
+    todo = [(b, loc, code if args.exact or not BANKS[b][3] else numeric_rewrite(code))
+            for b, w in walks.items() for loc, code, _ in w.snippets
+            if not (deltas[b] and loc in deltas[b].carried)]
+    results = verifyRunner.run_all([code for _, _, code in todo], args.jobs, args.timeout,
+                                   args.mem_mb, full, profile=args.cprofile, salt=engine_tag())
+    fresh = {(b, loc): r for (b, loc, _), r in zip(todo, results)}
+    by_bank = OrderedDict((b, [(loc, deltas[b].carried[loc] if (b, loc) not in fresh else fresh[b, loc])
+                               for loc, _, _ in w.snippets]) for b, w in walks.items())
+    save_snapshot(args.exact, {b: [(loc, digest, r) for (loc, _, digest), (_, r) in zip(w.snippets, by_bank[b])]
+                               for b, w in walks.items()})
+    seconds = time.perf_counter() - t0
+
+    failed = limited = 0
+    report = {"env": verifyRunner.env_tag(), "seconds": round(seconds, 3), "banks": OrderedDict(),
+              "structural": {}, "snippets": []}
+    for i, b in enumerate(banks):
+        title, _walk, allowlist, _asserts = BANKS[b]
+        allowlist = allowlist if args.exact else set()
+        if i:
+            print()
+        bad, lim = print_bank(title, walks[b], by_bank[b], allowlist, deltas[b])
+        failed += bad
+        limited += lim
+        carried = deltas[b].carried if deltas[b] else {}
+        recs = snippet_records(b, by_bank[b], allowlist, carried)
+        report["snippets"] += recs
+        report["structural"][b] = walks[b].struct
+        report["banks"][b] = {
+            "run": len(recs), "skipped": walks[b].skipped,
+            "passed": sum(1 for s in recs if s["outcome"] == verifyRunner.PASS),
+            "failed": sum(1 for s in recs if s["outcome"] == verifyRunner.FAIL and not s["allowlisted"]),
+            "allowlisted": sum(1 for s in recs if s["allowlisted"]),
+            "limited": lim, "structural": len(walks[b].struct),
+            "cached": sum(1 for s in recs if s["cached"]),
+            "carried": len(carried),
+        }
+
+    if args.profile is not None:
+        spots = hot_spots(report["snippets"]) if args.cprofile else None
+        if spots is not None:
+            report["hotSpots"] = spots
+        print_profile(report["snippets"], args.profile, spots)
+    if len(banks) > 1:
+        print("\nAll banks: %d snippets (%d checked, %d carried forward) in %.1fs"
+              % (sum(len(r) for r in by_bank.values()), len(todo),
+                 sum(len(d.carried) for d in deltas.values() if d), seconds))
+    if args.json:
+        json.dump(report, open(args.json, "w"), indent=1, ensure_ascii=False)
+        print("  wrote %s" % args.json)
+    if args.junit:
+        write_junit(args.junit, report)
+        print("  wrote %s" % args.junit)
+
+    if failed:
+        sys.exit(1)
+    if limited:
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
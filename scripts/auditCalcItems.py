@@ -4,66 +4,17 @@ Correctness audit for the Fable AP Calculus AB bank (seeds/calc-ab/calc_w*.json)
 Runs every `verify` snippet (sympy) on the MC items and FRQ parts so a wrong
 answer key or rubric solution can't ship. Exits non-zero on any failure.
 
+The walk and the report live in scripts/auditBanks.py (one engine for every
+bank); this is the Calculus entry point, kept for `npm run calc:audit`.
+
 Requires: sympy, numpy
-Usage: python3 scripts/auditCalcItems.py
+Usage: python3 scripts/auditCalcItems.py [--jobs N] [--timeout SEC] [--mem-mb MB] [--force] [--json PATH] [--junit PATH]
+  (options as in scripts/auditBanks.py)
 """
 
-import json
-import os
-import io
 import sys
-import contextlib
-
-HERE = os.path.dirname(os.path.abspath(__file__))
-ROOT = os.path.dirname(HERE)
-SRC = os.path.join(ROOT, "seeds", "calc-ab")
-WEEKS = [1, 2, 3, 4, 5]
-
-
-def run(code):
-    with contextlib.redirect_stdout(io.StringIO()):
-        exec(code, {})
-
-
-def main():
-    total = passed = skipped = 0
-    fails = []
-    for wk in WEEKS:
-        data = json.load(open(os.path.join(SRC, "calc_w%d.json" % wk)))
-        for it in data["mc"]:
-            v = it.get("verify")
-            loc = "W%d MC%d" % (wk, it["n"])
-            if not v:
-                skipped += 1
-                continue
-            total += 1
-            try:
-                run(v)
-                passed += 1
-            except Exception as e:
-                fails.append((loc, "%s: %s" % (type(e).__name__, str(e)[:70])))
-        for p in data["frq"].get("parts", []):
-            v = p.get("verify")
-            loc = "W%d FRQ(%s)" % (wk, p["label"])
-            if not v:
-                skipped += 1
-                continue
-            total += 1
-            try:
-                run(v)
-                passed += 1
-            except Exception as e:
-                fails.append((loc, "%s: %s" % (type(e).__name__, str(e)[:70])))
-
-    print("AP Calculus AB verify audit")
-    print("  snippets run: %d | passed: %d | null-skipped: %d" % (total, passed, skipped))
-    if fails:
-        print("\n  FAILURES (%d):" % len(fails))
-        for loc, msg in fails:
-            print("    x %s  %s" % (loc, msg))
-        sys.exit(1)
-    print("\n  OK — every verified answer checks out.")
 
+import auditBanks  # scripts/ is sys.path[0] when run as a script
 
 if __name__ == "__main__":
-    main()
+    auditBanks.main(["calc"] + sys.argv[1:])
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Persistent skill/tag inverted index over every generated item bank.
+
+"Which items carry skill X across Alg1, SAT, Calc and ACT" used to mean parsing
+seven multi-MB `*.generated.json` payloads (three of them gzipped) and scanning
+them. This keeps one SQLite file (stdlib only, no new dependency) holding:
+
+  skillId -> problemIds   (primary and secondary, role recorded)
+  tag     -> problemIds
+  source  -> problemIds
+  per-bank difficulty histogram
+
+Updates are incremental and per-bank: each bank row remembers a sha256 of its
+payload file(s), so a refresh re-indexes only the banks whose payload changed.
+The Python ingesters call update_bank() right after writing their output, so the
+index is current without a separate step; the JS-built banks (top-ups, low-volume
+expansion) are picked up by `refresh()` / running this script.
+
+The index is a build artifact (git-ignored) — it can always be rebuilt from the
+committed payloads with --force.
+
+Public API:
+    connect(path=INDEX)                       -> sqlite3.Connection (schema ensured)
+    update_bank(bank, items, conn=None)       -> re-index one bank from docs in memory
+    refresh(force=False, conn=None)           -> [bank keys re-indexed]
+    problems_for_skill(skill_id, role=None)   -> [problemId]
+    problems_for_tag(tag) / problems_for_source(source) -> [problemId]
+    skill_counts(bank=None, role="primary")   -> { skillId: count }
+    canonical_ids()                           -> { legacy skillId: unified skillId }
+    unified_problems(role="primary")          -> { unified skillId: [problemId] }
+    difficulty_histogram(bank=None)           -> { difficulty: count }
+
+Usage: python3 scripts/bankIndex.py [--force] [--skill ID] [--tag TAG] [--source SRC]
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+SEEDS = os.path.join(ROOT, "seeds")
+INDEX = os.path.join(SEEDS, "bank-index.sqlite")
+TAX_DIR = os.path.join(SEEDS, "unified-taxonomy")
+
+# bank key (matches scripts/seedAll.js step keys) -> payload file(s) under seeds/
+BANKS = OrderedDict([
+    ("act-items", ["act-fable-items.generated.json"]),
+    ("alg1-items", ["alg1-items.generated.json"]),
+    ("calc-items", ["calc-items.generated.json"]),
+    ("sat-items", ["sat-items.generated.json"]),
+    ("calc-topup-items", ["calc-topup-items.generated.json"]),
+    ("bank-topup-items", ["bank-topup-items.generated.json"]),
+    ("low-volume-items", ["low-volume-items.generated.json"]),
+    ("low-volume-expansion", [
+        "low-volume-expansion/act-items.generated.json.gz",
+        "low-volume-expansion/calc3-items.generated.json.gz",
+        "low-volume-expansion/general-items.generated.json.gz",
+    ]),
+])
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS banks (
+    bank TEXT PRIMARY KEY, files TEXT, digest TEXT, items INTEGER, indexed_at TEXT);
+CREATE TABLE IF NOT EXISTS problems (
+    problem_id TEXT PRIMARY KEY, bank TEXT, skill_id TEXT, source TEXT,
+    difficulty INTEGER, answer_type TEXT, content_hash TEXT);
+CREATE TABLE IF NOT EXISTS problem_skills (skill_id TEXT, problem_id TEXT, role TEXT);
+CREATE TABLE IF NOT EXISTS problem_tags (tag TEXT, problem_id TEXT);
+CREATE INDEX IF NOT EXISTS problems_bank ON problems(bank);
+CREATE INDEX IF NOT EXISTS problems_source ON problems(source);
+CREATE INDEX IF NOT EXISTS problem_skills_skill ON problem_skills(skill_id);
+CREATE INDEX IF NOT EXISTS problem_skills_problem ON problem_skills(problem_id);
+CREATE INDEX IF NOT EXISTS problem_tags_tag ON problem_tags(tag);
+CREATE INDEX IF NOT EXISTS problem_tags_problem ON problem_tags(problem_id);
+"""
+
+
+def connect(path=INDEX):
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def load_payload(rel):
+    """Problem docs from one payload file (plain or gzipped JSON array)."""
+    path = os.path.join(SEEDS, rel)
+    opener = gzip.open if rel.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def bank_digest(bank):
+    """sha256 over the bank's payload bytes — the incremental-refresh key."""
+    h = hashlib.sha256()
+    for rel in BANKS[bank]:
+        with open(os.path.join(SEEDS, rel), "rb") as fh:
+            h.update(fh.read())
+    return h.hexdigest()
+
+
+def update_bank(bank, items, conn=None):
+    """Replace every index row for `bank` with the given Problem docs."""
+    own = conn is None
+    conn = conn or connect()
+    digest = bank_digest(bank) if bank in BANKS else None
+    with conn:
+        ids = [r[0] for r in conn.execute("SELECT problem_id FROM problems WHERE bank = ?", (bank,))]
+        ids += [it["problemId"] for it in items]   # an id that moved banks drops its old rows too
+        conn.executemany("DELETE FROM problem_skills WHERE problem_id = ?", [(i,) for i in ids])
+        conn.executemany("DELETE FROM problem_tags WHERE problem_id = ?", [(i,) for i in ids])
+        conn.execute("DELETE FROM problems WHERE bank = ?", (bank,))
+
+        problems, skills, tags = [], [], []
+        for it in items:
+            pid = it["problemId"]
+            problems.append((pid, bank, it.get("skillId"), it.get("source"), it.get("difficulty"),
+                             it.get("answerType"), it.get("contentHash")))
+            if it.get("skillId"):
+                skills.append((it["skillId"], pid, "primary"))
+            for s in it.get("secondarySkillIds") or []:
+                skills.append((s, pid, "secondary"))
+            for t in dict.fromkeys(it.get("tags") or []):
+                tags.append((t, pid))
+        conn.executemany("INSERT OR REPLACE INTO problems VALUES (?, ?, ?, ?, ?, ?, ?)", problems)
+        conn.executemany("INSERT INTO problem_skills VALUES (?, ?, ?)", skills)
+        conn.executemany("INSERT INTO problem_tags VALUES (?, ?)", tags)
+        conn.execute("INSERT OR REPLACE INTO banks VALUES (?, ?, ?, ?, ?)",
+                     (bank, json.dumps(BANKS.get(bank, [])), digest, len(problems),
+                      time.strftime("%Y-%m-%dT%H:%M:%S")))
+    if own:
+        conn.close()
+    return len(problems)
+
+
+def refresh(force=False, conn=None):
+    """Re-index every bank whose payload changed since it was last indexed."""
+    own = conn is None
+    conn = conn or connect()
+    known = dict(conn.execute("SELECT bank, digest FROM banks"))
+    done = []
+    for bank, files in BANKS.items():
+        if not all(os.path.exists(os.path.join(SEEDS, f)) for f in files):
+            continue
+        if not force and known.get(bank) == bank_digest(bank):
+            continue
+        items = [it for rel in files for it in load_payload(rel)]
+        update_bank(bank, items, conn)
+        done.append(bank)
+    if own:
+        conn.close()
+    return done
+
+
+def _ids(conn, sql, args):
+    own = conn is None
+    conn = conn or connect()
+    out = [r[0] for r in conn.execute(sql, args)]
+    if own:
+        conn.close()
+    return out
+
+
+def problems_for_skill(skill_id, role=None, conn=None):
+    if role:
+        return _ids(conn, "SELECT problem_id FROM problem_skills WHERE skill_id = ? AND role = ? "
+                          "ORDER BY problem_id", (skill_id, role))
+    return _ids(conn, "SELECT DISTINCT problem_id FROM problem_skills WHERE skill_id = ? "
+                      "ORDER BY problem_id", (skill_id,))
+
+
+def problems_for_tag(tag, conn=None):
+    return _ids(conn, "SELECT problem_id FROM problem_tags WHERE tag = ? ORDER BY problem_id", (tag,))
+
+
+def problems_for_source(source, conn=None):
+    return _ids(conn, "SELECT problem_id FROM problems WHERE source = ? ORDER BY problem_id", (source,))
+
+
+def skill_counts(bank=None, role="primary", conn=None):
+    """{ skillId: item count }, optionally restricted to one bank."""
+    own = conn is None
+    conn = conn or connect()
+    sql = ("SELECT ps.skill_id, COUNT(*) FROM problem_skills ps "
+           "JOIN problems p ON p.problem_id = ps.problem_id WHERE ps.role = ?")
+    args = [role]
+    if bank:
+        sql += " AND p.bank = ?"
+        args.append(bank)
+    out = dict(conn.execute(sql + " GROUP BY ps.skill_id", args))
+    if own:
+        conn.close()
+    return out
+
+
+def _unified_ids():
+    return {s["skill_id"] for s in json.load(open(os.path.join(TAX_DIR, "math_taxonomy.json")))["skills"]}
+
+
+def canonical_ids():
+    """{ legacy skillId: unified skillId } from the reviewed crosswalks — the same
+    rows utils/skillCanonicalizer.js collapses mastery onto: every
+    unified-taxonomy/*-crosswalk.json except pathway-crosswalk.json (bank ids,
+    not unified ones), targets that are real taxonomy ids, first file wins."""
+    unified = _unified_ids()
+    out = {}
+    for f in sorted(os.listdir(TAX_DIR)):
+        if not f.endswith("-crosswalk.json") or f == "pathway-crosswalk.json":
+            continue
+        for row in json.load(open(os.path.join(TAX_DIR, f))).get("rows") or []:
+            legacy, target = row.get("legacyId"), row.get("unifiedId")
+            if legacy and target in unified and legacy not in unified:
+                out.setdefault(legacy, target)
+    return out
+
+
+def unified_problems(role="primary", conn=None):
+    """{ unified skillId: [problemId] } — bank skill ids canonicalized through the
+    crosswalks; ids that map nowhere are left out."""
+    own = conn is None
+    conn = conn or connect()
+    canon, unified = canonical_ids(), _unified_ids()
+    out = {}
+    for skill_id, pid in conn.execute("SELECT skill_id, problem_id FROM problem_skills WHERE role = ? "
+                                      "ORDER BY problem_id", (role,)):
+        target = skill_id if skill_id in unified else canon.get(skill_id)
+        if target:
+            out.setdefault(target, []).append(pid)
+    if own:
+        conn.close()
+    return out
+
+
+def difficulty_histogram(bank=None, conn=None):
+    own = conn is None
+    conn = conn or connect()
+    sql = "SELECT difficulty, COUNT(*) FROM problems"
+    args = []
+    if bank:
+        sql += " WHERE bank = ?"
+        args.append(bank)
+    out = dict(conn.execute(sql + " GROUP BY difficulty ORDER BY difficulty", args))
+    if own:
+        conn.close()
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--force", action="store_true", help="re-index every bank, changed or not")
+    ap.add_argument("--skill", help="list problemIds carrying this skillId (primary or secondary)")
+    ap.add_argument("--tag", help="list problemIds carrying this tag")
+    ap.add_argument("--source", help="list problemIds from this Problem.source")
+    args = ap.parse_args()
+
+    conn = connect()
+    t0 = time.time()
+    done = refresh(force=args.force, conn=conn)
+
+    if args.skill or args.tag or args.source:
+        if args.skill:
+            ids = problems_for_skill(args.skill, conn=conn)
+        elif args.tag:
+            ids = problems_for_tag(args.tag, conn=conn)
+        else:
+            ids = problems_for_source(args.source, conn=conn)
+        print("\n".join(ids))
+        print("(%d problems)" % len(ids))
+        return
+
+    print("Bank index -> %s (%.2fs)" % (os.path.relpath(INDEX, os.getcwd()), time.time() - t0))
+    print("  re-indexed: %s" % (", ".join(done) or "nothing (all banks current)"))
+    for bank, n in conn.execute("SELECT bank, items FROM banks ORDER BY bank"):
+        print("  %-22s %5d items | %3d skills | difficulty %s"
+              % (bank, n, len(skill_counts(bank, conn=conn)), difficulty_histogram(bank, conn=conn)))
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,7 @@ import math
 
 import matplotlib
 matplotlib.use("Agg")
+matplotlib.rcParams["svg.hashsalt"] = "mathmatix"   # stable clip-path ids run to run
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -52,7 +53,8 @@ def _finish(fig, ax, p, axes_through_origin=True):
         s.set_visible(False)
     ax.tick_params(labelsize=6, colors=AXIS, length=2)
     buf = io.StringIO()
-    fig.savefig(buf, format="svg", bbox_inches="tight")
+    # no render date or library version in the output, so a re-ingest is byte-stable
+    fig.savefig(buf, format="svg", bbox_inches="tight", metadata={"Date": None, "Creator": None})
     plt.close(fig)
     svg = buf.getvalue()
     i = svg.find("<svg")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+One long-running classification entry point for every Python-classified bank.
+
+The Alg1 classifier, satSkillMap, calcSkillMap and the ACT slug mapping each
+lived behind a different ingester with a different call shape, so classifying a
+single new item meant knowing which script to import — and from Node, spawning a
+Python process per item. This loads every rule table (and the Alg1 -> unified
+crosswalk) ONCE and then serves NDJSON over stdin/stdout until stdin closes.
+
+Protocol — one JSON object per line each way:
+
+  startup  <- {"ready": true, "banks": ["act", "alg1", "calc", "sat"]}
+  request  -> {"id": 7, "items": [{"bank": "alg1", "item": {...}}, ...]}
+  response <- {"id": 7, "results": [{...}, ...]}     (same order as items)
+
+Item shapes, per bank (field names match the Fable source files):
+
+  alg1   {"prompt": str | [str], "module": 4, "spiral_source"?: "M2", "skill"?: str}
+  sat    {"domain": "ALG", "skill": "Linear equations in one variable"}
+  calc   {"skill": "Chain rule"}
+  act    {"skill"?: "Quadratic equations", "category": "ALG"}
+
+Each result is {"bank", "skillId", "name", "unifiedId", "confidence"}: skillId is
+the bank's own id (what the ingester would tag), unifiedId the Map of Mathmatix
+id where one is known — SAT ids already are; Alg1 goes through
+seeds/unified-taxonomy/alg1-crosswalk.json (confidence is the crosswalk's);
+Calc and ACT have no unified crosswalk yet, so unifiedId is null. A bad item
+yields {"error": ...} in its slot; a bad line yields {"id": null, "error": ...}.
+Neither stops the server.
+
+Client: utils/skillClassifierClient.js.
+
+Usage: python3 scripts/classifyServer.py   (then write NDJSON to stdin)
+"""
+
+import json
+import os
+import sys
+
+import alg1SkillClassifier as alg1
+from actSkillMap import act_skill
+from calcSkillMap import catalog_skill
+from satSkillMap import unified_skill
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+TAX = os.path.join(ROOT, "seeds", "unified-taxonomy", "math_taxonomy.json")
+ALG1_CROSSWALK = os.path.join(ROOT, "seeds", "unified-taxonomy", "alg1-crosswalk.json")
+
+
+def _load_json(path, default):
+    try:
+        return json.load(open(path))
+    except (OSError, ValueError):
+        return default
+
+
+TAX_NAME = {s["skill_id"]: s["name"] for s in _load_json(TAX, {"skills": []})["skills"]}
+ALG1_UNIFIED = {r["legacyId"]: r for r in _load_json(ALG1_CROSSWALK, {"rows": []})["rows"]}
+
+
+def _alg1(item):
+    if item.get("skill"):
+        sid, name = alg1.slug(item["skill"]), item["skill"]
+    else:
+        prompt = item.get("prompt")
+        it = dict(item, prompt=prompt if isinstance(prompt, list) else [prompt or ""])
+        sid, name = alg1.classify(it, int(item["module"]), is_spiral=bool(item.get("spiral_source")))
+    row = ALG1_UNIFIED.get(sid) or {}
+    return {"skillId": sid, "name": name, "unifiedId": row.get("unifiedId"),
+            "confidence": row.get("confidence")}
+
+
+def _sat(item):
+    sid = unified_skill(item["domain"], item["skill"])
+    return {"skillId": sid, "name": TAX_NAME.get(sid), "unifiedId": sid,
+            "confidence": "high" if sid else None}
+
+
+def _calc(item):
+    return {"skillId": catalog_skill(item["skill"]), "name": item["skill"], "unifiedId": None,
+            "confidence": None}
+
+
+def _act(item):
+    sid, name = act_skill(item.get("skill"), item.get("category"))
+    return {"skillId": sid, "name": name, "unifiedId": None, "confidence": None}
+
+
+BANKS = {"alg1": _alg1, "sat": _sat, "calc": _calc, "act": _act}
+
+
+def classify_one(entry):
+    if not isinstance(entry, dict):
+        return {"bank": None, "error": "each entry must be an object {bank, item}"}
+    bank = entry.get("bank")
+    fn = BANKS.get(bank) if isinstance(bank, str) else None
+    if fn is None:
+        return {"bank": bank, "error": "unknown bank %r (expected one of %s)" % (bank, ", ".join(sorted(BANKS)))}
+    item = entry.get("item") or {}
+    if not isinstance(item, dict):
+        return {"bank": bank, "error": "item must be an object, got %s" % type(item).__name__}
+    try:
+        return dict({"bank": bank}, **fn(item))
+    except Exception as e:  # whatever a classifier raises on odd fields, it stays in this slot
+        return {"bank": bank, "error": "%s: %s" % (type(e).__name__, e)}
+
+
+def handle(line):
+    try:
+        req = json.loads(line)
+    except ValueError as e:
+        return {"id": None, "error": "bad json: %s" % e}
+    if not isinstance(req, dict) or not isinstance(req.get("items"), list):
+        return {"id": req.get("id") if isinstance(req, dict) else None,
+                "error": "request must be an object with an items[] array"}
+    return {"id": req.get("id"), "results": [classify_one(e) for e in req["items"]]}
+
+
+def _emit(obj):
+    sys.stdout.write(json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n")
+    sys.stdout.flush()
+
+
+def main():
+    _emit({"ready": True, "banks": sorted(BANKS)})
+    for line in sys.stdin:
+        if line.strip():
+            _emit(handle(line))
+
+
+if __name__ == "__main__":
+    main()
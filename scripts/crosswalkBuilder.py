@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Generic legacy-bank -> unified taxonomy crosswalk builder.
+
+Generalizes scripts/alg1UnifiedCrosswalk.py. That script hard-coded a 64-row MAP
+and loaded the whole Alg1 bank just to count items per skill, and the next bank
+would have meant copying it. Here the mapping is data: a crosswalk spec JSON
+(seeds/unified-taxonomy/<bank>-crosswalk.json) holding
+
+  source       label ("algebra-1")
+  title        worksheet heading ("Algebra 1")
+  banks        bankIndex bank keys whose items carry the legacy ids
+  names        optional legacy id -> display name file (under the repo root)
+  review       worksheet path (under the repo root)
+  exclude      legacy ids deliberately left unmapped (strategy skills, ...)
+  rows         [{legacyId, unifiedId, confidence, alternatives, note, approved?}]
+
+The builder rewrites that same file in place: the rows stay the reviewed source
+of truth, and only the derived fields (names, itemCount, summary) are
+recomputed. A draft for a new bank needs only the header fields and minimal rows
+(alternatives may be bare ids). Every unifiedId and alternative is validated
+against the taxonomy. Every legacy skill in the banks must be mapped or
+excluded, and every mapped legacy id must occur in them, so a typo'd legacyId
+fails instead of passing as a row with 0 items. The exception is a row already
+applied by scripts/retagBank.py --write: approved, its legacy id gone from the
+banks and its unifiedId present. That row keeps the itemCount it was reviewed
+with, so the remaining rows can still be rebuilt and reviewed after a partial
+apply. Item leverage comes from the persistent count index
+(bankIndex.skill_counts), not a bank load, so a rebuild takes well under a
+second.
+
+It emits the crosswalk and the human review worksheet (med/low first, ranked
+by items moved). It never touches the banks or the database. A crosswalk file
+is picked up by utils/skillCanonicalizer.js by name, so a new bank's mapping
+takes effect once its rows are reviewed.
+
+Usage: python3 scripts/crosswalkBuilder.py SPEC [SPEC ...] [--check]
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+
+import bankIndex  # scripts/ is sys.path[0] when run as a script
+import taxonomyGraph
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+TAX = os.path.join(ROOT, "seeds", "unified-taxonomy", "math_taxonomy.json")
+
+CONFIDENCE = ("high", "med", "low")
+HEADER = ("source", "title", "banks", "names", "review", "exclude")
+
+
+def _alt_id(a):
+    return a["id"] if isinstance(a, dict) else a
+
+
+def _approved(r):
+    # high rows are pre-approved; a reviewer's explicit call is kept
+    return r.get("approved", r.get("confidence") == "high")
+
+
+def applied(r, counts):
+    """True if retagBank.py has already moved this row's items onto its unifiedId."""
+    return bool(_approved(r) and not counts.get(r["legacyId"]) and counts.get(r.get("unifiedId")))
+
+
+def validate(spec, graph, counts):
+    """Problems (strings) with the spec's rows against the taxonomy and the banks."""
+    problems = []
+    seen = Counter(r["legacyId"] for r in spec["rows"])
+    problems += ["legacy id mapped more than once: %s" % k for k, n in seen.items() if n > 1]
+    for r in spec["rows"]:
+        legacy, uid = r["legacyId"], r.get("unifiedId")
+        if graph.has(legacy):
+            problems.append("%s is already a unified id — nothing to map" % legacy)
+        elif spec.get("banks") and not counts.get(legacy) and not applied(r, counts):
+            problems.append("mapped a legacy id that isn't in the bank(s): %s" % legacy)
+        if not graph.has(uid):
+            problems.append("%s -> unknown unified id %s" % (legacy, uid))
+        for a in r.get("alternatives") or []:
+            if not graph.has(_alt_id(a)):
+                problems.append("%s alternative %s not in taxonomy" % (legacy, _alt_id(a)))
+        if r.get("confidence") not in CONFIDENCE:
+            problems.append("%s bad confidence %r" % (legacy, r.get("confidence")))
+    skip = set(spec.get("exclude") or [])
+    for legacy in sorted(counts):
+        if legacy not in seen and legacy not in skip and not graph.has(legacy):
+            problems.append("legacy skill not mapped: %s (%d items)" % (legacy, counts[legacy]))
+    return problems
+
+
+def build(spec, graph, counts, names):
+    """The crosswalk document: header, summary, rows with derived fields refreshed."""
+    rows = []
+    for r in spec["rows"]:
+        legacy, uid = r["legacyId"], r["unifiedId"]
+        rows.append({
+            "legacyId": legacy,
+            "legacyName": names.get(legacy) or r.get("legacyName") or legacy,
+            "unifiedId": uid,
+            "unifiedName": graph.get(uid)["name"],
+            "confidence": r["confidence"],
+            "itemCount": r.get("itemCount", 0) if applied(r, counts) else counts.get(legacy, 0),
+            "alternatives": [{"id": _alt_id(a), "name": graph.get(_alt_id(a))["name"]}
+                             for a in r.get("alternatives") or []],
+            "note": r.get("note"),
+            "approved": _approved(r),
+        })
+    by_conf = Counter(r["confidence"] for r in rows)
+    out = {k: spec[k] for k in HEADER if k in spec}
+    out.update({
+        "legacySkillCount": len(rows),
+        "distinctUnifiedTargets": len({r["unifiedId"] for r in rows}),
+        "totalItems": sum(counts.values()),
+        "confidenceCounts": dict(by_conf),
+        "itemsNeedingReview": sum(r["itemCount"] for r in rows if r["confidence"] != "high"),
+        "rows": rows,
+    })
+    return out
+
+
+def worksheet(cw, spec_path):
+    """Markdown review worksheet: med/low first, ranked by item leverage."""
+    rows, title = cw["rows"], cw.get("title") or cw["source"]
+    by_conf = cw["confidenceCounts"]
+
+    def block(heading, conf):
+        sel = sorted([r for r in rows if r["confidence"] == conf], key=lambda r: -r["itemCount"])
+        if not sel:
+            return []
+        out = ["", "## %s (%d skills, %d items)" % (heading, len(sel), sum(r["itemCount"] for r in sel)), ""]
+        out.append("| ✔ | items | legacy skill | → proposed unified | alternatives | note |")
+        out.append("|---|------:|--------------|--------------------|--------------|------|")
+        for r in sel:
+            alts = ", ".join("`%s` %s" % (a["id"], a["name"]) for a in r["alternatives"]) or "—"
+            out.append("| %s | %d | `%s` %s | `%s` **%s** | %s | %s |" % (
+                "☑" if r["approved"] else "☐", r["itemCount"], r["legacyId"], r["legacyName"],
+                r["unifiedId"], r["unifiedName"], alts, r["note"] or ""))
+        return out
+
+    md = [
+        "# %s → Map of Mathmatix — migration review" % title,
+        "",
+        "Migration of the %s bank onto the unified taxonomy "
+        "(`seeds/unified-taxonomy/math_taxonomy.json`). Auto-generated by "
+        "`scripts/crosswalkBuilder.py` from the machine crosswalk `%s`, which is "
+        "also the place to record review decisions." % (title, spec_path),
+        "",
+        "## Summary",
+        "",
+        "- **%d** legacy skills → **%d** distinct unified skills."
+        % (cw["legacySkillCount"], cw["distinctUnifiedTargets"]),
+        "- Confidence: **%d high** (pre-approved), **%d medium**, **%d low**."
+        % (by_conf.get("high", 0), by_conf.get("med", 0), by_conf.get("low", 0)),
+        "- **%d of %d items** sit under a medium/low mapping — that's where review matters."
+        % (cw["itemsNeedingReview"], cw["totalItems"]),
+        "",
+        "### How to review",
+        "",
+        "For each row in the **medium** and **low** tables: confirm the proposed "
+        "unified skill (set `approved: true` on its row), or change `unifiedId` "
+        "(alternatives listed), then re-run the builder. The **high** table is "
+        "included last for completeness.",
+    ]
+    md += block("🔴 LOW confidence — needs a decision", "low")
+    md += block("🟡 MEDIUM confidence — quick confirm", "med")
+    md += block("🟢 HIGH confidence — pre-approved (skim)", "high")
+    md.append("")
+    return "\n".join(md)
+
+
+def run(spec_path, check=False, graph=None, conn=None):
+    """Validate one spec and (unless check) rewrite it and its worksheet. Returns the crosswalk."""
+    spec = json.load(open(spec_path))
+    graph = graph or taxonomyGraph.SkillGraph.from_taxonomy(json.load(open(TAX)))
+    counts = Counter()
+    for bank in spec.get("banks") or []:
+        counts.update(bankIndex.skill_counts(bank, conn=conn))
+    names = json.load(open(os.path.join(ROOT, spec["names"]))) if spec.get("names") else {}
+
+    rel = os.path.relpath(spec_path, ROOT)
+    problems = validate(spec, graph, counts)
+    if problems:
+        print("%s: VALIDATION FAILED" % rel)
+        for p in problems:
+            print("  x", p)
+        raise SystemExit(1)
+
+    cw = build(spec, graph, counts, names)
+    by_conf = cw["confidenceCounts"]
+    print("%s: %d legacy skills -> %d unified skills | %d items in %s"
+          % (rel, cw["legacySkillCount"], cw["distinctUnifiedTargets"], cw["totalItems"],
+             ", ".join(spec.get("banks") or ["no bank"])))
+    print("  confidence: %d high / %d med / %d low  |  %d items under med/low (review)"
+          % (by_conf.get("high", 0), by_conf.get("med", 0), by_conf.get("low", 0), cw["itemsNeedingReview"]))
+    if check:
+        return cw
+    with open(spec_path, "w") as fh:
+        json.dump(cw, fh, indent=2, ensure_ascii=False)
+        fh.write("\n")
+    print("  wrote %s" % rel)
+    if spec.get("review"):
+        open(os.path.join(ROOT, spec["review"]), "w").write(worksheet(cw, rel))
+        print("  wrote %s" % spec["review"])
+    return cw
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("specs", nargs="+", help="crosswalk spec / crosswalk JSON files")
+    ap.add_argument("--check", action="store_true", help="validate and summarize only; write nothing")
+    args = ap.parse_args()
+
+    bankIndex.refresh()
+    graph = taxonomyGraph.SkillGraph.from_taxonomy(json.load(open(TAX)))
+    conn = bankIndex.connect()
+    for path in args.specs:
+        run(path, check=args.check, graph=graph, conn=conn)
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
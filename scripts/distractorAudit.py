@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Distractor-quality audit for the multiple-choice items of the Python-ingested
+banks. The ingesters only confirm that a correct option exists
+(parse_correct_option, the answer index); nothing checked the OTHER options.
+This does, over the Problem docs the ingesters write:
+
+  key-equivalent   a distractor that is the same value as the key in another
+                   form ("√36" vs "6", "3(n − 2)" vs "3n − 6") — the item has
+                   two right answers. An error.
+  duplicate        two distractors that are the same value — a wasted option.
+                   An error.
+  implausible      a numeric distractor more than PLAUSIBLE_RATIO times larger
+                   or smaller than a numeric key, or an option of a different
+                   kind than the key (a number among expressions) — a giveaway.
+                   Reported, never fatal.
+
+Every option is parsed once: plain numbers ("$1,200", "20%", "−13/3") exactly
+as Fractions (scripts/sprAnswers.py); math ("4x² − 6x + 9", "3√17", "8π",
+"(−4, 3)", "m ≤ 22/3") into sympy; prose is compared as normalized text. All
+symbolic pairs of a bank — key vs distractor and distractor vs distractor — are
+settled in ONE vectorized numericEquiv.check_pairs call that treats a sampled
+disagreement as final, so the ~800 MC items in the banks take about a second.
+Without sympy/numpy only the number and text comparisons run.
+
+The ingesters print the one-line summary (print_summary) on every ingest.
+
+Public API:
+    analyze(docs) -> {"items", "kinds", "keyEquivalent", "duplicates", "implausible"}
+                     docs: Problem docs with options [{label, text}] and correctOption
+    print_summary(docs)   one line for an ingester's output
+
+Usage: python3 scripts/distractorAudit.py [bank ...] [--json PATH]
+  bank   any of alg1, sat, calc, act (default: all); exit 1 on key-equivalent or
+         duplicate distractors
+"""
+
+import argparse
+import functools
+import json
+import math
+import os
+import re
+import sys
+import time
+from collections import Counter, OrderedDict
+from fractions import Fraction
+
+import sprAnswers  # scripts/ is sys.path[0] when run as a script
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+SEEDS = os.path.join(ROOT, "seeds")
+
+# bank -> (report title, Problem docs written by its ingester)
+BANKS = OrderedDict([
+    ("alg1", ("Algebra 1", "alg1-items.generated.json")),
+    ("sat", ("Digital SAT Math", "sat-items.generated.json")),
+    ("calc", ("AP Calculus AB", "calc-items.generated.json")),
+    ("act", ("ACT Math", "act-fable-items.generated.json")),
+])
+
+PLAUSIBLE_RATIO = 100.0
+NUM, EXPR, TUPLE, REL, TEXT = "number", "expression", "tuple", "relation", "text"
+
+_TRANSLATE = str.maketrans({"−": "-", "–": "-", "×": "*", "·": "*", "÷": "/", "π": "pi",
+                            "∞": "oo", "≤": "<=", "≥": ">=", "≠": "!="})
+_SUPERSCRIPT = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁻", "0123456789-")
+_POWER = re.compile(r"[⁰¹²³⁴⁵⁶⁷⁸⁹⁻]+")
+_DIMENSIONS = re.compile(r"^\d+\s*×\s*\d+$")              # "3 × 4": a matrix size, not 12
+_APPLIED = re.compile(r"(?<![A-Za-z])[A-Za-z]\s*\(")         # "f(2x)": not f*2*x
+_FUNCS = re.compile(r"sqrt|pi|oo|sin|cos|tan|log|ln|exp")
+_ROOT = re.compile(r"√\s*(\d+(?:\.\d+)?|[A-Za-z]|\([^()]*\))")
+_REL = re.compile(r"<=|>=|!=|<|>|=")
+_FLIP = {">": "<", ">=": "<="}
+
+
+def _norm_text(text):
+    return re.sub(r"\s+", " ", str(text).strip().lower())
+
+
+def _sympy():
+    try:
+        import sympy
+        from sympy.parsing.sympy_parser import (
+            parse_expr, standard_transformations, implicit_multiplication_application, convert_xor)
+    except ImportError:
+        return None
+    return sympy, parse_expr, standard_transformations + (implicit_multiplication_application, convert_xor)
+
+
+def _expr(t, sp):
+    sympy, parse_expr, transformations = sp
+    value = parse_expr(t, transformations=transformations, local_dict={"i": sympy.I, "e": sympy.E})
+    if not isinstance(value, sympy.Expr):
+        raise ValueError("not an expression")
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def parse_option(text):
+    """(kind, value): NUM Fraction, EXPR sympy expr, TUPLE [expr], REL (op, lhs - rhs),
+    or TEXT normalized string when it isn't math (or sympy is unavailable)."""
+    t = str(text).strip()
+    if _DIMENSIONS.match(t):
+        return TEXT, _norm_text(text)
+    t = _POWER.sub(lambda m: "**(%s)" % m.group(0).translate(_SUPERSCRIPT), t.translate(_TRANSLATE))
+    t = re.sub(r"(?<=[\w)])sqrt", "*sqrt", _ROOT.sub(r"sqrt(\1)", t))    # "i√65", "3√17"
+    t = re.sub(r"(?<=\d),(?=\d{3}\b)", "", t)            # 1,200 -> 1200 (not (3,7))
+    t = re.sub(r"\$(?=[\d.])", "", t)
+    t = re.sub(r"^\+(?=\S)", "", t.strip().rstrip("%°").strip())
+    value = sprAnswers.parse(t)
+    if value is not None:
+        return NUM, value
+    sp = _sympy()
+    if sp is None or not t or not t.isascii() or re.search(r"[A-Za-z]{2,}", _FUNCS.sub("", t)) \
+            or _APPLIED.search(t):
+        return TEXT, _norm_text(text)
+    try:
+        if t.startswith("(") and t.endswith(")") and "," in t:
+            parts = [p.strip() for p in t[1:-1].split(",")]
+            return TUPLE, tuple(_expr(p, sp) for p in parts)
+        ops = _REL.findall(t)
+        if len(ops) == 1:
+            lhs, rhs = (s.strip() for s in _REL.split(t))
+            diff = _expr(lhs, sp) - _expr(rhs, sp)
+            op = ops[0]
+            if op in _FLIP:
+                op, diff = _FLIP[op], -diff
+            return REL, (op, diff)
+        if ops:
+            raise ValueError("chained relation")
+        return EXPR, _expr(t, sp)
+    except Exception:  # SyntaxError, TokenError, sympy's own: not something we can parse
+        return TEXT, _norm_text(text)
+
+
+def _magnitude(kind, value):
+    """abs() of a constant option (real or complex), else None."""
+    try:
+        if kind == NUM:
+            return abs(float(value))
+        if kind == EXPR and not value.free_symbols:
+            return abs(complex(value.evalf()))
+    except (TypeError, ValueError, OverflowError):
+        pass
+    return None
+
+
+def _key_index(doc):
+    labels = [str(o.get("label", "")).upper() for o in doc["options"]]
+    key = str(doc.get("correctOption") or "").upper()
+    return labels.index(key) if key in labels else None
+
+
+def analyze(docs):
+    """Check every MC doc's options pairwise; see the module doc for the verdicts."""
+    items = [d for d in docs if d.get("options") and _key_index(d) is not None]
+    kinds = Counter()
+    parsed = {}
+    for d in items:
+        parsed[d["problemId"]] = opts = [parse_option(o.get("text", "")) for o in d["options"]]
+        kinds.update(k for k, _ in opts)
+
+    # every pair (i < j) of every item: settled directly, or queued for sampling
+    verdicts, queue = {}, []          # (pid, i, j) -> bool | [queue indices]
+    for d in items:
+        pid, opts = d["problemId"], parsed[d["problemId"]]
+        for i in range(len(opts)):
+            for j in range(i + 1, len(opts)):
+                (ka, a), (kb, b) = opts[i], opts[j]
+                if ka == NUM and kb == NUM or ka == TEXT or kb == TEXT or TUPLE in (ka, kb) and ka != kb:
+                    verdicts[pid, i, j] = ka == kb and a == b
+                elif ka == TUPLE:
+                    if len(a) != len(b):
+                        verdicts[pid, i, j] = False
+                    else:
+                        verdicts[pid, i, j] = list(range(len(queue), len(queue) + len(a)))
+                        queue += list(zip(a, b))
+                elif ka == REL or kb == REL:
+                    if ka != kb or a[0] != b[0]:
+                        verdicts[pid, i, j] = False
+                    else:
+                        verdicts[pid, i, j] = [len(queue)]
+                        queue.append((a[1], b[1]))
+                else:                   # number vs expression, or two expressions
+                    sympy = _sympy()[0]
+                    to_expr = lambda k, v: sympy.Rational(v.numerator, v.denominator) if k == NUM else v
+                    verdicts[pid, i, j] = [len(queue)]
+                    queue.append((to_expr(ka, a), to_expr(kb, b)))
+    if queue:
+        import numericEquiv
+        same = numericEquiv.check_pairs(queue, escalate=False)
+        for k, v in verdicts.items():
+            if isinstance(v, list):
+                verdicts[k] = all(same[q] for q in v)
+
+    key_equiv, duplicates, implausible = [], [], []
+    for d in items:
+        pid, opts, key = d["problemId"], parsed[d["problemId"]], _key_index(d)
+        texts = [str(o.get("text", "")) for o in d["options"]]
+        labels = [str(o.get("label", "ABCDEF"[n])) for n, o in enumerate(d["options"])]
+        for i in range(len(opts)):
+            for j in range(i + 1, len(opts)):
+                if verdicts[pid, i, j]:
+                    entry = {"problemId": pid,
+                             "options": ["%s %s" % (labels[i], texts[i]), "%s %s" % (labels[j], texts[j])]}
+                    (key_equiv if key in (i, j) else duplicates).append(entry)
+        kk, kv = opts[key]
+        key_mag = _magnitude(kk, kv)
+        for n, (k, v) in enumerate(opts):
+            if n == key:
+                continue
+            mag = _magnitude(k, v)
+            if (k == TEXT) != (kk == TEXT) or (key_mag is None) != (mag is None):
+                why = "%s option, key is %s" % (k, kk)
+            elif key_mag and mag and math.isfinite(key_mag) and math.isfinite(mag) \
+                    and not 1 / PLAUSIBLE_RATIO <= mag / key_mag <= PLAUSIBLE_RATIO:
+                why = "%g vs key %g" % (mag, key_mag)
+            else:
+                continue
+            implausible.append({"problemId": pid, "option": "%s %s" % (labels[n], texts[n]), "why": why})
+    return {"items": len(items), "kinds": dict(kinds), "keyEquivalent": key_equiv,
+            "duplicates": duplicates, "implausible": implausible}
+
+
+def print_summary(docs):
+    r = analyze(docs)
+    line = "  distractors: %d MC items | key-equivalent: %d | duplicate: %d | implausible: %d" % (
+        r["items"], len(r["keyEquivalent"]), len(r["duplicates"]), len(r["implausible"]))
+    if r["keyEquivalent"] or r["duplicates"]:
+        line += "  [warn] run scripts/distractorAudit.py for detail"
+    print(line)
+
+
+def print_bank(title, r, seconds):
+    print("%s distractor audit" % title)
+    print("  MC items: %d | options: %s | %.2fs" % (
+        r["items"], ", ".join("%s %d" % kv for kv in sorted(r["kinds"].items())), seconds))
+    for head, rows in (("KEY-EQUIVALENT DISTRACTORS — two right answers", r["keyEquivalent"]),
+                       ("DUPLICATE DISTRACTORS", r["duplicates"])):
+        if rows:
+            print("\n  %s (%d):" % (head, len(rows)))
+            for e in rows:
+                print("    x %s  %s  ≡  %s" % (e["problemId"], e["options"][0], e["options"][1]))
+    if r["implausible"]:
+        print("\n  implausible distractors (%d, informational):" % len(r["implausible"]))
+        for e in r["implausible"][:15]:
+            print("    ? %s  %s  (%s)" % (e["problemId"], e["option"], e["why"]))
+        if len(r["implausible"]) > 15:
+            print("    … %d more (see --json)" % (len(r["implausible"]) - 15))
+    if not (r["keyEquivalent"] or r["duplicates"]):
+        print("\n  OK — every distractor is distinct from the key and from each other.")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser()
+    ap.add_argument("banks", nargs="*", metavar="bank", help="any of %s (default: all)" % ", ".join(BANKS))
+    ap.add_argument("--json", help="write the per-bank findings as JSON to PATH")
+    args = ap.parse_args(argv)
+    unknown = [b for b in args.banks if b not in BANKS]
+    if unknown:
+        ap.error("unknown bank(s) %s (expected any of %s)" % (", ".join(unknown), ", ".join(BANKS)))
+
+    report, bad = OrderedDict(), False
+    for i, b in enumerate(args.banks or list(BANKS)):
+        title, path = BANKS[b]
+        t0 = time.perf_counter()
+        report[b] = r = analyze(json.load(open(os.path.join(SEEDS, path))))
+        if i:
+            print()
+        print_bank(title, r, time.perf_counter() - t0)
+        bad = bad or bool(r["keyEquivalent"] or r["duplicates"])
+    if args.json:
+        json.dump(report, open(args.json, "w"), indent=1, ensure_ascii=False)
+        print("  wrote %s" % args.json)
+    if bad:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
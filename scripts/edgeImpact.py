@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Impact simulator for proposed prerequisite-graph edits.
+
+mergeStandardsAudit.py deliberately does not apply graph changes: every new edge
+locks students behind more work, and some findings are judgment calls. This puts
+a number on that cost so reviewers can rank the candidates instead of reading
+183 of them cold. For each proposed edit it reports:
+
+  gated      skills that gain at least one transitive prerequisite (an added
+             edge) or lose one (a removed edge: "freed")
+  +prereqs   transitive prerequisites added across those skills (removed: lost)
+  +depth     mean change in the longest prerequisite chain beneath them
+  items      bank items on the affected skills (crosswalk-canonicalized, via
+             bankIndex.unified_problems): practice that moves behind or out
+             from behind the edit
+  status     ok | implied (the prerequisite is already transitive — no effect) |
+             absent (the edge to remove is already gone) | cycle (the edit would
+             close a loop) | unknown (an id not in the graph)
+
+Candidates:
+  findings   docs/SKILL_GRAPH_AUDIT_FINDINGS.json: missing_prereqs (add) and
+             bad_edges (remove the "P->S" edge)
+  fixes      applyAuditFixes.FIXES, as the edges each fix adds and removes
+             against the current taxonomy. Also simulated as one batch.
+
+Everything starts from the precomputed closure (seeds/skills-unified-closure.json,
+written by genUnifiedSkills.py). An edit touches only the edited skill and its
+descendants, so only those are re-closed. They are visited in topological order
+of the edited graph, with one bitset OR per edge. The whole candidate list takes
+a few milliseconds. A closure artifact that is stale against skills-unified.json
+is refused, because the numbers would describe a different graph.
+
+Usage: python3 scripts/edgeImpact.py [--source findings|fixes|all] [--top N] [--json PATH]
+"""
+
+import argparse
+import base64
+import json
+import os
+import time
+from collections import deque
+
+import applyAuditFixes  # scripts/ is sys.path[0] when run as a script
+import bankIndex
+import genUnifiedSkills
+import taxonomyGraph
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+SKILLS = os.path.join(ROOT, "seeds", "skills-unified.json")
+CLOSURE = os.path.join(ROOT, "seeds", "skills-unified-closure.json")
+FINDINGS = os.path.join(ROOT, "docs", "SKILL_GRAPH_AUDIT_FINDINGS.json")
+TAX = os.path.join(ROOT, "seeds", "unified-taxonomy", "math_taxonomy.json")
+
+
+class Closure:
+    """The closure artifact decoded to Python ints, plus parent lists by position."""
+
+    def __init__(self, artifact, docs):
+        self.order = artifact["order"]
+        self.pos = {sid: i for i, sid in enumerate(self.order)}
+        decode = lambda b64: int.from_bytes(base64.b64decode(b64), "little")
+        self.anc = [decode(b) for b in artifact["ancestors"]]
+        self.desc = [decode(b) for b in artifact["descendants"]]
+        self.depth = artifact["depth"]
+        self.parents = [set() for _ in self.order]
+        for d in docs:
+            self.parents[self.pos[d["skillId"]]] = {self.pos[p] for p in d["prerequisites"] + d["crossPrereqs"]
+                                                    if p in self.pos}
+
+    def simulate(self, edits):
+        """Re-close the graph under `edits` [(skill, prereq, "add"|"remove")] (ids
+        already resolved to positions). Returns {position: (anc, depth)} for every
+        skill whose closure changed, or None when the edits close a cycle."""
+        parents = {}
+        for s, p, op in edits:
+            ups = parents.setdefault(s, set(self.parents[s]))
+            (ups.add if op == "add" else ups.discard)(p)
+        affected = set()
+        for s in parents:
+            affected.add(s)
+            bits, n = self.desc[s], 0
+            while bits:
+                if bits & 1:
+                    affected.add(n)
+                bits >>= 1
+                n += 1
+        ups_of = lambda v: parents.get(v, self.parents[v])
+
+        # Kahn over the affected skills in the EDITED graph; unaffected parents are settled
+        pending = {v: sum(1 for q in ups_of(v) if q in affected) for v in affected}
+        downs = {v: [] for v in affected}
+        for v in affected:
+            for q in ups_of(v):
+                if q in affected:
+                    downs[q].append(v)
+        ready = deque(sorted(v for v, n in pending.items() if not n))
+        anc, depth, seen = {}, {}, 0
+        while ready:
+            v = ready.popleft()
+            seen += 1
+            a, d = 0, 0
+            for q in ups_of(v):
+                qa, qd = (anc[q], depth[q]) if q in anc else (self.anc[q], self.depth[q])
+                a |= qa | (1 << q)
+                d = max(d, qd + 1)
+            anc[v], depth[v] = a, d
+            for c in downs[v]:
+                pending[c] -= 1
+                if not pending[c]:
+                    ready.append(c)
+        if seen != len(affected):
+            return None
+        return {v: (anc[v], depth[v]) for v in affected if (anc[v], depth[v]) != (self.anc[v], self.depth[v])}
+
+
+def _popcount(x):
+    return bin(x).count("1")
+
+
+def impact(closure, items, edits):
+    """Metrics for one batch of edits [(skill id, prereq id, op)] (see module doc)."""
+    pos = closure.pos
+    unknown = sorted({x for s, p, _ in edits for x in (s, p) if x not in pos})
+    row = {"edits": ["%s %s %s" % (s, "+" if op == "add" else "-", p) for s, p, op in edits],
+           "status": "ok", "gated": 0, "freed": 0, "prereqsAdded": 0, "prereqsLost": 0,
+           "depthDelta": 0.0, "items": 0}
+    if unknown:
+        return dict(row, status="unknown", unknown=unknown)
+    resolved = [(pos[s], pos[p], op) for s, p, op in edits]
+    if all(op == "add" and (closure.anc[s] >> p & 1) for s, p, op in resolved):
+        return dict(row, status="implied")
+    if all(op == "remove" and p not in closure.parents[s] for s, p, op in resolved):
+        return dict(row, status="absent")
+    changed = closure.simulate(resolved)
+    if changed is None:
+        return dict(row, status="cycle")
+    for v, (a, d) in changed.items():
+        gained, lost = a & ~closure.anc[v], closure.anc[v] & ~a
+        row["gated"] += 1 if gained else 0
+        row["freed"] += 1 if lost and not gained else 0
+        row["prereqsAdded"] += _popcount(gained)
+        row["prereqsLost"] += _popcount(lost)
+        row["depthDelta"] += d - closure.depth[v]
+        row["items"] += items.get(closure.order[v], 0)
+    if changed:
+        row["depthDelta"] = round(row["depthDelta"] / len(changed), 2)
+    return row
+
+
+def finding_candidates():
+    f = json.load(open(FINDINGS))
+    out = []
+    for m in f.get("missing_prereqs") or []:
+        out.append(("finding", [(m["skill_id"], m["should_require"], "add")]))
+    for b in f.get("bad_edges") or []:
+        prereq, _, skill = (b.get("edge") or "").partition("->")
+        if prereq and skill:
+            out.append(("finding:%s" % b.get("verdict", "bad"), [(skill.strip(), prereq.strip(), "remove")]))
+    return out
+
+
+def fix_candidates():
+    """Each FIXES row as its edge delta against the current taxonomy."""
+    graph = taxonomyGraph.SkillGraph.from_taxonomy(json.load(open(TAX)))
+    out = []
+    for skill_id, field, new, _ in applyAuditFixes.FIXES:
+        old = (graph.get(skill_id) or {}).get(field) or []
+        edits = [(skill_id, p, "add") for p in new if p not in old]
+        edits += [(skill_id, p, "remove") for p in old if p not in new]
+        if edits:
+            out.append(("fix %s.%s" % (skill_id, field), edits))
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--source", choices=["findings", "fixes", "all"], default="all")
+    ap.add_argument("--top", type=int, default=25, help="rows to print (ranked by skills gated, then items)")
+    ap.add_argument("--json", help="also write every candidate's metrics to PATH")
+    args = ap.parse_args()
+
+    docs = json.load(open(SKILLS))
+    artifact = json.load(open(CLOSURE))
+    if genUnifiedSkills.graph_hash(docs) != artifact["graphHash"]:
+        raise SystemExit("closure artifact is stale against skills-unified.json — run python3 scripts/genUnifiedSkills.py")
+    closure = Closure(artifact, docs)
+    bankIndex.refresh()
+    items = {sid: len(pids) for sid, pids in bankIndex.unified_problems().items()}
+
+    candidates = []
+    if args.source in ("findings", "all"):
+        candidates += finding_candidates()
+    if args.source in ("fixes", "all"):
+        candidates += fix_candidates()
+
+    t0 = time.time()
+    rows = [dict(impact(closure, items, edits), source=source) for source, edits in candidates]
+    batch = None
+    if args.source in ("fixes", "all"):
+        fixes = [e for _, edits in fix_candidates() for e in edits]
+        batch = dict(impact(closure, items, fixes), source="applyAuditFixes.FIXES (as one batch)") if fixes else None
+    elapsed = time.time() - t0
+
+    rows.sort(key=lambda r: (-r["gated"], -r["freed"], -r["items"]))
+    print("Edge-impact simulation: %d candidates in %.1f ms (closure of %d skills, %d bank items mapped)"
+          % (len(rows), elapsed * 1000, len(closure.order), sum(items.values())))
+    status = {}
+    for r in rows:
+        status[r["status"]] = status.get(r["status"], 0) + 1
+    print("  status: %s" % ", ".join("%s %d" % kv for kv in sorted(status.items())))
+    print("\n  %-28s %6s %6s %9s %7s %6s  %s" % ("edit", "gated", "freed", "+/-prereq", "+depth", "items", "source"))
+    for r in rows[:args.top] + ([batch] if batch else []):
+        print("  %-28s %6d %6d %+9d %+7.2f %6d  %s%s" % (
+            r["edits"][0] + (" (+%d)" % (len(r["edits"]) - 1) if len(r["edits"]) > 1 else ""),
+            r["gated"], r["freed"], r["prereqsAdded"] - r["prereqsLost"], r["depthDelta"], r["items"],
+            r["source"], "" if r["status"] == "ok" else "  [%s]" % r["status"]))
+    if args.source in ("fixes", "all") and not batch:
+        print("  (applyAuditFixes.FIXES: every fix is already in the taxonomy)")
+    if len(rows) > args.top:
+        print("  ... %d more (--top N, or --json for all)" % (len(rows) - args.top))
+    if args.json:
+        json.dump({"candidates": rows, "batch": batch}, open(args.json, "w"), indent=1)
+        print("\n  wrote %s" % args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,22 +7,65 @@ Generate Skill catalog docs from the unified "Map of Mathmatix" taxonomy
 Each taxonomy skill (id COURSE.STRAND.n) becomes a Skill doc: the dotted id is
 the skillId, the strand maps to a representative category (BKT keys on category)
 and to the new `strand` field, prereq_ids + cross_prereq_ids become
-prerequisites, and grade → gradeBand by course level.
+prerequisites, and grade → gradeBand by course level (the taxonomy's own grade
+span is kept alongside as `grade`).
 
 Emits seeds/skills-unified.json (315 docs). Non-destructive: these coexist with
 the existing per-course catalog until items are migrated to the unified ids.
 
+Also emits seeds/skills-unified-closure.json, the prerequisite graph closed
+once at build time so the web tier never walks it per request (read by
+utils/skillClosureIndex.js):
+  order        skillIds in topological order (prerequisites first); a skill's
+               index here is its bit position
+  ancestors    per skill (aligned with order), the bitset of every transitive
+               prerequisite, both edge kinds — little-endian bytes, base64
+  descendants  the same for every skill it transitively unlocks
+  depth        longest prerequisite chain beneath the skill (roots are 0)
+  impact       number of descendants (downstream-impact count)
+  graphHash    sha1 of the edge list, so a reader can tell the artifact is stale
+Like the overlay below, it is compared and rewritten on its own bytes, so a
+missing or stale closure is rebuilt even when the docs are unchanged.
+
+And seeds/skills-unified-overlay.json, the student-facing fields of every skill
+(read by utils/skillOverlay.js), so a skill chip or board filter does not have
+to load full Skill docs:
+  strands      [[code, name]] — a skill's strand is an index into this
+  courses      [[code, name]] — likewise for its courseLevel
+  skills       {skillId: [studentLabel, provisional 0|1, strand, course]}
+It is rewritten whenever its content changes, whether or not the docs did.
+
+Regeneration is incremental downstream. The new docs are diffed against the
+skills-unified.json already on disk, and the per-skill change set is folded into
+seeds/skills-unified-changes.json (git-ignored):
+  base / head      sha1 of the skills-unified.json bytes the change set starts
+                   from (what the database last received) and ends at
+  graphChanged     the prerequisite graph moved, so closure caches are stale
+  skills           {skillId: {status: added|changed|removed, fields: [...],
+                   edgesAdded: [...], edgesRemoved: [...]}} — edges are the
+                   prerequisites + crossPrereqs of that skill
+Runs accumulate until scripts/seedUnifiedSkills.js applies the set (writing only
+those skills) and removes it, so two edits between seeds are one change set. An
+unchanged regeneration leaves skills-unified.json and the change set untouched.
+
 Usage: python3 scripts/genUnifiedSkills.py
 """
 
+import base64
+import hashlib
 import json
 import os
 from collections import Counter
 
+import taxonomyGraph  # scripts/ is sys.path[0] when run as a script
+
 HERE = os.path.dirname(os.path.abspath(__file__))
 ROOT = os.path.dirname(HERE)
 TAX = os.path.join(ROOT, "seeds", "unified-taxonomy", "math_taxonomy.json")
 OUT = os.path.join(ROOT, "seeds", "skills-unified.json")
+CLOSURE_OUT = os.path.join(ROOT, "seeds", "skills-unified-closure.json")
+CHANGES_OUT = os.path.join(ROOT, "seeds", "skills-unified-changes.json")
+OVERLAY_OUT = os.path.join(ROOT, "seeds", "skills-unified-overlay.json")
 STD = os.path.join(ROOT, "seeds", "unified-taxonomy", "standards-alignment.json")
 LAB = os.path.join(ROOT, "seeds", "unified-taxonomy", "student-labels.json")
 
@@ -56,10 +99,142 @@ COURSE = {
 }
 
 
+def graph_hash(docs):
+    """sha1 of "id:prereq,prereq" lines, sorted — mirrored by utils/skillClosureIndex.js."""
+    lines = sorted("%s:%s" % (d["skillId"], ",".join(sorted(set(d["prerequisites"] + d["crossPrereqs"]))))
+                   for d in docs)
+    return hashlib.sha1("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+def closure_index(docs, graph):
+    """The closure artifact (see module doc) over the graph loaded from `docs`.
+    Exits on a prerequisite cycle."""
+    order = graph.topological_order()     # Kahn in catalog order, so stable run to run
+    if order is None:
+        raise SystemExit("prerequisite cycle — run scripts/taxonomyGraph.py for the skills involved")
+
+    pos = [0] * len(order)                # interned int -> bit position
+    for n, i in enumerate(order):
+        pos[i] = n
+    anc, desc, depth = [0] * len(order), [0] * len(order), [0] * len(order)
+    for i in order:
+        for p in graph.parents[i]:
+            anc[i] |= anc[p] | (1 << pos[p])
+        depth[i] = max((depth[p] + 1 for p in graph.parents[i]), default=0)
+    for i in reversed(order):
+        for c in graph.children[i]:
+            desc[i] |= desc[c] | (1 << pos[c])
+
+    nbytes = 4 * ((len(order) + 31) // 32)     # whole 32-bit words for the JS reader
+    enc = lambda bits: base64.b64encode(bits.to_bytes(nbytes, "little")).decode("ascii")
+    return {
+        "version": 1,
+        "graphHash": graph_hash(docs),
+        "size": len(order),
+        "order": [graph.ids[i] for i in order],
+        "ancestors": [enc(anc[i]) for i in order],
+        "descendants": [enc(desc[i]) for i in order],
+        "depth": [depth[i] for i in order],
+        "impact": [bin(desc[i]).count("1") for i in order],
+    }
+
+
+def overlay(docs):
+    """The student-facing overlay artifact (see module doc) over `docs`."""
+    strands = list(dict.fromkeys(d["strand"] for d in docs))
+    courses = list(dict.fromkeys(d["courseLevel"] for d in docs))
+    return {
+        "version": 1,
+        "strands": [[c, STRAND_NAME[c]] for c in strands],
+        "courses": [[c, COURSE.get(c, (c,))[0]] for c in courses],
+        "skills": {d["skillId"]: [d["studentLabel"], int(d["provisional"]),
+                                  strands.index(d["strand"]), courses.index(d["courseLevel"])]
+                   for d in docs},
+    }
+
+
+def write_if_changed(path, data):
+    """Write `data` (bytes) unless the file already holds exactly that; returns True if written."""
+    if os.path.exists(path) and open(path, "rb").read() == data:
+        return False
+    with open(path, "wb") as fh:
+        fh.write(data)
+    return True
+
+
+def write_overlay(docs):
+    data = json.dumps(overlay(docs), separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return write_if_changed(OVERLAY_OUT, data)
+
+
+def _edges(doc):
+    return set(doc.get("prerequisites") or []) | set(doc.get("crossPrereqs") or [])
+
+
+def diff_docs(prev, docs):
+    """Per-skill change set {skillId: entry} from the previous docs to `docs`."""
+    old = {d["skillId"]: d for d in prev}
+    new = {d["skillId"]: d for d in docs}
+    out = {}
+    for sid, d in new.items():
+        o = old.get(sid)
+        if o is None:
+            out[sid] = {"status": "added", "fields": [], "edgesAdded": sorted(_edges(d)), "edgesRemoved": []}
+            continue
+        fields = sorted(k for k in set(o) | set(d) if o.get(k, None) != d.get(k, None) or (k in o) != (k in d))
+        if fields:
+            out[sid] = {"status": "changed", "fields": fields,
+                        "edgesAdded": sorted(_edges(d) - _edges(o)), "edgesRemoved": sorted(_edges(o) - _edges(d))}
+    for sid, o in old.items():
+        if sid not in new:
+            out[sid] = {"status": "removed", "fields": [], "edgesAdded": [], "edgesRemoved": sorted(_edges(o))}
+    return out
+
+
+def compose(first, then):
+    """One change set equivalent to applying `first`, then `then` (both {skillId: entry})."""
+    out = dict(first)
+    for sid, b in then.items():
+        a = out.get(sid)
+        if a is None:
+            out[sid] = b
+        elif a["status"] == "added" and b["status"] == "removed":
+            del out[sid]                     # never reached the database
+        elif b["status"] == "removed" or a["status"] == "added":
+            out[sid] = dict(b, status=b["status"] if b["status"] == "removed" else "added")
+        else:
+            a1, r1, a2, r2 = (set(a["edgesAdded"]), set(a["edgesRemoved"]),
+                              set(b["edgesAdded"]), set(b["edgesRemoved"]))
+            out[sid] = {"status": "added" if a["status"] == "removed" else "changed",
+                        "fields": sorted(set(a["fields"]) | set(b["fields"])),
+                        "edgesAdded": sorted((a1 - r2) | (a2 - r1)),
+                        "edgesRemoved": sorted((r1 - a2) | (r2 - a1))}
+    return out
+
+
+def _sha1(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def write_changes(prev_bytes, new_bytes, prev, docs, graph_changed):
+    """Fold this run's diff into the pending change set; returns the set written (or None)."""
+    base = head = _sha1(prev_bytes) if prev_bytes is not None else None
+    skills, moved = {}, False
+    if os.path.exists(CHANGES_OUT):
+        pending = json.load(open(CHANGES_OUT))
+        if pending.get("head") == head:      # still unseeded: keep accumulating
+            base, skills, moved = pending["base"], pending["skills"], pending["graphChanged"]
+    skills = compose(skills, diff_docs(prev, docs))
+    changes = {"version": 1, "base": base, "head": _sha1(new_bytes),
+               "graphChanged": moved or graph_changed, "skills": skills}
+    json.dump(changes, open(CHANGES_OUT, "w"), indent=1, sort_keys=True)
+    return changes
+
+
 def main():
     tax = json.load(open(TAX))
+    taxonomyGraph.check(tax, os.path.basename(TAX))
     skills = tax["skills"]
-    ids = {s["skill_id"] for s in skills}
 
     # Verified CCSS-M / AP alignments, keyed by skillId. Produced by the standards
     # audit (see docs/SKILL_STANDARDS_AUDIT.md) — every code traced to a published
@@ -104,28 +279,52 @@ def main():
             "difficultyLevel": diff,
             "fluencyMetadata": {"baseFluencyTime": 30, "fluencyType": "process", "toleranceFactor": 2.5},
             "source": "unified-taxonomy",
+            # The taxonomy's own grade span ("3–4"), kept verbatim beside the
+            # derived gradeBand; models/skill.js and GET /api/mastery read it.
+            "grade": s.get("grade"),
         })
 
     # Derive `enables` as the reverse of every prerequisite edge. It was previously
     # left empty for all 315 skills, which silently zeroed the downstream-impact
-    # term in utils/retentionProbe.js.
-    by_id = {d["skillId"]: d for d in docs}
+    # term in utils/retentionProbe.js. The graph model holds the reverse index
+    # as sets, so this is linear in the edges (no `not in list` scan per edge).
+    graph = taxonomyGraph.SkillGraph.from_docs(docs)
     for d in docs:
-        for p in d["prerequisites"] + d["crossPrereqs"]:
-            if p in by_id and d["skillId"] not in by_id[p]["enables"]:
-                by_id[p]["enables"].append(d["skillId"])
+        d["enables"] = graph.dependents(d["skillId"])
 
     # sanity: prereqs resolve within the taxonomy
-    bad = [(d["skillId"], p) for d in docs for p in d["prerequisites"] + d["crossPrereqs"] if p not in ids]
+    bad = [(sid, p) for sid, _, p in graph.dangling]
     no_std = [d["skillId"] for d in docs if not d["standardsAlignment"]]
 
-    json.dump(docs, open(OUT, "w"), indent=2, ensure_ascii=False)
-    print("Wrote %d unified Skill docs -> %s" % (len(docs), os.path.relpath(OUT, os.getcwd())))
+    closure = closure_index(docs, graph)
+
+    prev_bytes = open(OUT, "rb").read() if os.path.exists(OUT) else None
+    prev = json.loads(prev_bytes) if prev_bytes is not None else []
+    new_bytes = json.dumps(docs, indent=2, ensure_ascii=False).encode("utf-8") + b"\n"
+    if new_bytes == prev_bytes:
+        print("Unified Skill docs unchanged (%d) — %s left as is" % (len(docs), os.path.relpath(OUT, os.getcwd())))
+    else:
+        changes = write_changes(prev_bytes, new_bytes, prev, docs, graph_hash(prev) != closure["graphHash"])
+        with open(OUT, "wb") as fh:
+            fh.write(new_bytes)
+        print("Wrote %d unified Skill docs -> %s" % (len(docs), os.path.relpath(OUT, os.getcwd())))
+        status = Counter(e["status"] for e in changes["skills"].values())
+        print("  pending change set: %d added, %d changed, %d removed%s -> %s" % (
+            status["added"], status["changed"], status["removed"],
+            ", graph changed" if changes["graphChanged"] else "", os.path.basename(CHANGES_OUT)))
+    overlay_written = write_overlay(docs)
+    print("  overlay: %d skills, %d provisional -> %s%s" % (
+        len(docs), sum(d["provisional"] for d in docs), os.path.basename(OVERLAY_OUT),
+        "" if overlay_written else " (unchanged)"))
     print("  by course:", dict(Counter(d["courseLevel"] for d in docs)))
     print("  by strand:", dict(Counter(d["strand"] for d in docs)))
     print("  prereq edges: %d same-level, %d cross-level" % (
         sum(len(d["prerequisites"]) for d in docs), sum(len(d["crossPrereqs"]) for d in docs)))
     print("  enables edges derived:", sum(len(d["enables"]) for d in docs))
+    closure_written = write_if_changed(CLOSURE_OUT, json.dumps(closure, separators=(",", ":")).encode("utf-8"))
+    print("  closure: depth %d, widest downstream impact %d -> %s%s" % (
+        max(closure["depth"]), max(closure["impact"]), os.path.basename(CLOSURE_OUT),
+        "" if closure_written else " (unchanged)"))
     print("  unresolved prerequisite refs:", len(bad))
     if bad:
         print("   ", bad[:6])
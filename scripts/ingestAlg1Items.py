@@ -23,10 +23,18 @@ Outputs:
   seeds/alg1-skill-names.json          { fineSkillId: "Readable name" }
   seeds/alg1-assessment-map.json       module -> {quiz,test}->{core,spiral}->[{problemId,skillId}] (+points)
   seeds/alg1-skills-by-module.json     module -> [{skillId, name, inCatalog}]  (worklist for BKT wiring)
+  seeds/alg1-secondary-skills.json     itemKey -> [{skillId, confidence}]  (secondary-skill scores)
+  seeds/bank-index.sqlite              cross-bank skill/tag index (this bank re-indexed; scripts/bankIndex.py)
 
-Usage: python3 scripts/ingestAlg1Items.py
+With --trace, also writes seeds/alg1-classify-trace.ndjson (git-ignored): one
+compact line per item with the rules tried, the first match and its span offsets,
+and the time spent — the answer to "why did this item get that skill?". Traces
+never go into the Problem docs.
+
+Usage: python3 scripts/ingestAlg1Items.py [--trace]
 """
 
+import argparse
 import json
 import os
 import re
@@ -35,6 +43,8 @@ from collections import defaultdict
 
 import alg1FigureRenderer as figrender  # scripts/ is sys.path[0] when run as a script
 import alg1SkillClassifier as classifier
+import bankIndex
+import distractorAudit
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 ROOT = os.path.dirname(HERE)
@@ -44,6 +54,8 @@ ITEMS_OUT = os.path.join(ROOT, "seeds", "alg1-items.generated.json")
 NAMES_OUT = os.path.join(ROOT, "seeds", "alg1-skill-names.json")
 MAP_OUT = os.path.join(ROOT, "seeds", "alg1-assessment-map.json")
 BY_MODULE_OUT = os.path.join(ROOT, "seeds", "alg1-skills-by-module.json")
+SECONDARY_OUT = os.path.join(ROOT, "seeds", "alg1-secondary-skills.json")
+TRACE_OUT = os.path.join(ROOT, "seeds", "alg1-classify-trace.ndjson")
 CATALOG_FILE = os.path.join(ROOT, "seeds", "skills-algebra-1.json")
 
 MODULES = [1, 2, 3, 4, 5, 6, 7, 10, 11]
@@ -68,11 +80,6 @@ def _load_catalog_ids():
 CATALOG_IDS = _load_catalog_ids()
 
 
-def slug(name):
-    """kebab-case a skill name (used only for a future per-item Fable `skill` field)."""
-    return re.sub(r"-+", "-", re.sub(r"[^a-z0-9]+", "-", str(name).lower())).strip("-")
-
-
 def _norm(s):
     """Normalize for text matching: unify minus/dash glyphs, collapse spaces, lower."""
     s = str(s or "")
@@ -116,21 +123,27 @@ def difficulty_from(points, section):
     return d
 
 
-def resolve_skill(it, mod, grp):
+def resolve_skill(it, mod, grp, trace=False):
     """Fine skill for an item. Prefer a per-item `skill` field (forward-compatible
     with gold-standard Fable tags, as the ACT bank carries); otherwise classify
-    deterministically from the wording."""
+    deterministically from the wording. With trace=True a third element explains
+    the decision (see alg1SkillClassifier.classify)."""
     fable = it.get("skill")
     if fable:
-        return slug(fable), fable
-    return classifier.classify(it, mod, is_spiral=(grp == "spiral"))
+        return (classifier.slug(fable), fable) + (({"source": "fable-skill"},) if trace else ())
+    return classifier.classify(it, mod, is_spiral=(grp == "spiral"), trace=trace)
+
+
+def item_key(mod, section, grp, it):
+    """Version-independent item id: the problemId stem shared by its 3 versions."""
+    return "alg1-m%d-%s-%s-n%d" % (mod, section, "sp" if grp == "spiral" else "core", it["n"])
 
 
 def build_problem(mod, section, grp, it, vi, skill_id, secondary):
     """One Problem doc for version vi of a Fable item."""
     n = it["n"]
     itype = it.get("type", "work")
-    pid = "alg1-m%d-%s-%s-n%d-v%d" % (mod, section, "sp" if grp == "spiral" else "core", n, vi + 1)
+    pid = "%s-v%d" % (item_key(mod, section, grp, it), vi + 1)
 
     prompt = it["prompt"][vi]
     answer_val = it["answer"][vi]
@@ -189,41 +202,67 @@ def build_problem(mod, section, grp, it, vi, skill_id, secondary):
 
 
 def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--trace", action="store_true",
+                    help="write a per-item classification explain-trace sidecar")
+    args = ap.parse_args()
+
     items = []
     names = {}
     amap = {}
     by_module = defaultdict(set)   # module -> {fine skillId}
     mc_missing_key = []
     figs = 0
+    traces = []
 
+    # Pass 1: the version-independent primary skill of every item. Secondary
+    # skills are inferred in one batch afterwards — the scoring needs bank-wide
+    # co-occurrence statistics, so it can't run item by item.
+    bank = []   # (mod, section, grp, it, skill_id)
     for mod in MODULES:
         data = json.load(open(os.path.join(SRC, "alg1_m%d.json" % mod)))
         amap[str(mod)] = {"topics": data.get("topics"), "quiz": {"core": [], "spiral": []},
                           "test": {"core": [], "spiral": []}}
-
         for section in ("quiz", "test"):
             for grp in ("items", "spiral"):
-                bucket = "core" if grp == "items" else "spiral"
                 for it in data.get(section, {}).get(grp, []):
-                    skill_id, skill_name = resolve_skill(it, mod, grp)   # version-independent
+                    if args.trace:
+                        skill_id, skill_name, trace = resolve_skill(it, mod, grp, trace=True)
+                        traces.append(dict({"item": item_key(mod, section, grp, it), "skillId": skill_id},
+                                           **trace))
+                    else:
+                        skill_id, skill_name = resolve_skill(it, mod, grp)   # version-independent
                     names[skill_id] = skill_name
                     by_module[mod].add(skill_id)
-                    secondary = classifier.secondary_skills(it, mod, skill_id, is_spiral=(grp == "spiral"))
-                    for s in secondary:
-                        names.setdefault(s, classifier.NAMES.get(s, s))
-                        by_module[mod].add(s)
-                    for vi in range(3):
-                        doc = build_problem(mod, section, grp, it, vi, skill_id, secondary)
-                        if doc["figure"]:
-                            figs += 1
-                        if doc["answerType"] == "multiple-choice" and not doc["correctOption"]:
-                            mc_missing_key.append(doc["problemId"])
-                        items.append(doc)
-                        amap[str(mod)][section][bucket].append({
-                            "problemId": doc["problemId"], "n": it["n"], "skillId": skill_id,
-                            "points": it.get("points"), "type": it.get("type"),
-                            "spiralSource": it.get("spiral_source"),
-                        })
+                    bank.append((mod, section, grp, it, skill_id))
+
+    inferred, sec_stats = classifier.infer_secondary(
+        (item_key(mod, section, grp, it), it, mod, skill_id, grp == "spiral")
+        for mod, section, grp, it, skill_id in bank)
+    confidences = {}
+
+    for mod, section, grp, it, skill_id in bank:
+        bucket = "core" if grp == "items" else "spiral"
+        scored = inferred.get(item_key(mod, section, grp, it), [])
+        secondary = [sid for sid, _conf in scored]
+        for s in secondary:
+            names.setdefault(s, classifier.NAMES.get(s, s))
+            by_module[mod].add(s)
+        if scored:
+            confidences[item_key(mod, section, grp, it)] = [
+                {"skillId": sid, "confidence": conf} for sid, conf in scored]
+        for vi in range(3):
+            doc = build_problem(mod, section, grp, it, vi, skill_id, secondary)
+            if doc["figure"]:
+                figs += 1
+            if doc["answerType"] == "multiple-choice" and not doc["correctOption"]:
+                mc_missing_key.append(doc["problemId"])
+            items.append(doc)
+            amap[str(mod)][section][bucket].append({
+                "problemId": doc["problemId"], "n": it["n"], "skillId": skill_id,
+                "points": it.get("points"), "type": it.get("type"),
+                "spiralSource": it.get("spiral_source"),
+            })
 
     # de-dupe by problemId
     items = list({it["problemId"]: it for it in items}.values())
@@ -241,6 +280,13 @@ def main():
     json.dump(names, open(NAMES_OUT, "w"), indent=2, ensure_ascii=False)
     json.dump(amap, open(MAP_OUT, "w"), indent=2, ensure_ascii=False)
     json.dump(by_module_out, open(BY_MODULE_OUT, "w"), indent=2, ensure_ascii=False)
+    json.dump(confidences, open(SECONDARY_OUT, "w"), indent=2, ensure_ascii=False)
+    if args.trace:
+        with open(TRACE_OUT, "w") as fh:
+            for t in traces:
+                fh.write(json.dumps(t, ensure_ascii=False, separators=(",", ":")) + "\n")
+    # keep the cross-bank skill/tag index current (seeds/bank-index.sqlite)
+    bankIndex.update_bank("alg1-items", items)
 
     n_mc = sum(1 for i in items if i["answerType"] == "multiple-choice")
     n_expl = sum(1 for i in items if i["explanation"])
@@ -254,13 +300,22 @@ def main():
     print("  fine skills: %d (%d already in catalog, %d new) | items still on coarse module tag: %d"
           % (len(all_skills), in_cat, len(all_skills) - in_cat,
              sum(1 for s in all_skills if s.startswith("alg1-m"))))
+    print("  secondary skills: %d of %d items tagged (%d inferred of %d rule co-fires) | over rule budget: %d"
+          % (len(confidences), sec_stats["items"], sec_stats["kept"], sec_stats["candidates"],
+             sec_stats["overBudget"]))
+    if args.trace:
+        slow = max(traces, key=lambda t: t.get("us", 0))
+        print("  trace: %d items -> %s | fallbacks: %d | classify total %.1f ms (slowest %s, %d us)"
+              % (len(traces), os.path.basename(TRACE_OUT), sum(1 for t in traces if t.get("fallback")),
+                 sum(t.get("us", 0) for t in traces) / 1000.0, slow["item"], slow.get("us", 0)))
     if mc_missing_key:
         print("  [warn] %d MC items missing a parseable answer key: %s"
               % (len(mc_missing_key), ", ".join(mc_missing_key[:8])))
     else:
         print("  all MC items have a parsed correctOption")
-    print("  wrote %s, %s, %s" % (os.path.basename(NAMES_OUT), os.path.basename(MAP_OUT),
-                                   os.path.basename(BY_MODULE_OUT)))
+    distractorAudit.print_summary(items)
+    print("  wrote %s, %s, %s, %s" % (os.path.basename(NAMES_OUT), os.path.basename(MAP_OUT),
+                                       os.path.basename(BY_MODULE_OUT), os.path.basename(SECONDARY_OUT)))
 
 
 if __name__ == "__main__":
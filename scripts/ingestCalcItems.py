@@ -13,6 +13,7 @@ Outputs:
   seeds/calc-items.generated.json    MC Problem docs (array, 75)
   seeds/calc-assessment-map.json     week -> {title, mc:[...refs], frq:{...}}  (rail input)
   seeds/calc-skill-coverage.json     catalog skill -> count, unit -> [skillId]
+  seeds/bank-index.sqlite            cross-bank skill/tag index (this bank re-indexed; scripts/bankIndex.py)
 
 Usage: python3 scripts/ingestCalcItems.py   (requires matplotlib, numpy)
 """
@@ -25,6 +26,8 @@ from collections import defaultdict
 
 import calcFigureRenderer as figrender      # scripts/ is sys.path[0] when run as a script
 from calcSkillMap import catalog_skill
+import bankIndex
+import distractorAudit
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 ROOT = os.path.dirname(HERE)
@@ -136,6 +139,8 @@ def main():
         "byUnit": {u: sorted(s) for u, s in sorted(by_unit.items())},
         "categoryForUnit": UNIT_CATEGORY,
     }, open(COVERAGE_OUT, "w"), indent=2, ensure_ascii=False)
+    # keep the cross-bank skill/tag index current (seeds/bank-index.sqlite)
+    bankIndex.update_bank("calc-items", items)
 
     n_expl = sum(1 for i in items if i["explanation"])
     print("Ingested %d MC Problem docs -> %s" % (len(items), os.path.relpath(ITEMS_OUT, os.getcwd())))
@@ -145,6 +150,7 @@ def main():
         print("  [warn] %d items with an UNMAPPED skill: %s" % (len(unmapped), unmapped[:6]))
     else:
         print("  all items mapped to a catalog skillId")
+    distractorAudit.print_summary(items)
     print("  wrote %s and %s" % (os.path.basename(MAP_OUT), os.path.basename(COVERAGE_OUT)))
 
 
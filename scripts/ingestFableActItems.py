@@ -20,6 +20,7 @@ Outputs:
   seeds/act-fable-items.generated.json   Problem docs (array)
   seeds/act-skill-names.json             { skillId: "Readable name" }
   seeds/act-skills-by-category.json      { category: [skillId, ...] }
+  seeds/bank-index.sqlite                cross-bank skill/tag index (this bank re-indexed; scripts/bankIndex.py)
 
 Usage: python3 scripts/ingestFableActItems.py   (requires matplotlib)
 """
@@ -27,7 +28,6 @@ Usage: python3 scripts/ingestFableActItems.py   (requires matplotlib)
 import json
 import io
 import os
-import re
 import glob
 import hashlib
 from collections import defaultdict
@@ -36,6 +36,10 @@ import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 
+import bankIndex  # scripts/ is sys.path[0] when run as a script
+import distractorAudit
+from actSkillMap import CAT, slug
+
 HERE = os.path.dirname(os.path.abspath(__file__))
 ROOT = os.path.dirname(HERE)
 SRC = os.path.join(ROOT, "seeds", "fable-act")
@@ -43,22 +47,9 @@ OUT = os.path.join(ROOT, "seeds", "act-fable-items.generated.json")
 NAMES_OUT = os.path.join(ROOT, "seeds", "act-skill-names.json")
 CATS_OUT = os.path.join(ROOT, "seeds", "act-skills-by-category.json")
 
-# Fable category code -> our category name.
-CAT = {
-    "NQ":  "number-quantity",
-    "ALG": "algebra",
-    "FUN": "functions",
-    "GEO": "geometry",
-    "SP":  "statistics-probability",
-    "IES": "integrating-essential-skills",
-}
 LETTERS = ["A", "B", "C", "D", "E"]
 
 
-def slug(name):
-    return "act-" + re.sub(r"-+", "-", re.sub(r"[^a-z0-9]+", "-", name.lower())).strip("-")
-
-
 def render_svg(figure_code):
     if not figure_code:
         return None
@@ -139,11 +130,14 @@ def main():
     json.dump(items, open(OUT, "w"), indent=2, ensure_ascii=False)
     json.dump(names, open(NAMES_OUT, "w"), indent=2, ensure_ascii=False)
     json.dump({c: sorted(v) for c, v in by_cat.items()}, open(CATS_OUT, "w"), indent=2, ensure_ascii=False)
+    # keep the cross-bank skill/tag index current (seeds/bank-index.sqlite)
+    bankIndex.update_bank("act-items", items)
 
     print("Ingested %d items from %d source files -> %s"
           % (len(items), len(sources), os.path.relpath(OUT, os.getcwd())))
     print("  figures (SVG): %d | explanations: %d" % (figs, sum(1 for i in items if i["explanation"])))
     print("  distinct skills: %d across %d categories" % (len(names), len(by_cat)))
+    distractorAudit.print_summary(items)
     print("  wrote %s and %s" % (os.path.basename(NAMES_OUT), os.path.basename(CATS_OUT)))
 
 
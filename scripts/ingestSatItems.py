@@ -8,7 +8,10 @@ The Digital SAT Math section is fully auto-scored — no free-response/rubric st
 Two item types:
   - mc  : 4-option (A-D) multiple choice        -> answerType 'multiple-choice'
   - spr : student-produced response (grid-in)   -> answerType 'constructed-response'
-          (auto-scored by canonical value + accepted equivalents)
+          (auto-scored by canonical value + accepted equivalents; the key is
+          also parsed offline by scripts/sprAnswers.py into answer.numeric —
+          exact value, grid tolerance, alternate correct values — so grading is
+          one numeric compare)
 
 Each item's (domain, skill) label maps to a unified skill_id via
 scripts/satSkillMap.py. Figures render to SVG via scripts/satFigureRenderer.py.
@@ -17,6 +20,8 @@ Outputs:
   seeds/sat-items.generated.json    Problem docs (array: MC + SPR)
   seeds/sat-assessment-map.json     week -> {title, items:[...refs]}  (rail input)
   seeds/sat-skill-coverage.json     unified skillId -> count, domain -> [skillId]
+  seeds/sat-secondary-skills.json   problemId -> [{skillId, confidence}]  (secondary-skill scores)
+  seeds/bank-index.sqlite           cross-bank skill/tag index (this bank re-indexed; scripts/bankIndex.py)
 
 Usage: python3 scripts/ingestSatItems.py   (requires matplotlib for figures)
 """
@@ -27,7 +32,11 @@ import hashlib
 from collections import defaultdict
 
 import satFigureRenderer as figrender     # scripts/ is sys.path[0] when run as a script
-from satSkillMap import unified_skill
+from satSkillMap import unified_skill, secondary_rules
+import bankIndex
+import distractorAudit
+import secondarySkills
+import sprAnswers
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 ROOT = os.path.dirname(HERE)
@@ -36,6 +45,7 @@ SRC = os.path.join(ROOT, "seeds", "sat-math")
 ITEMS_OUT = os.path.join(ROOT, "seeds", "sat-items.generated.json")
 MAP_OUT = os.path.join(ROOT, "seeds", "sat-assessment-map.json")
 COVERAGE_OUT = os.path.join(ROOT, "seeds", "sat-skill-coverage.json")
+SECONDARY_OUT = os.path.join(ROOT, "seeds", "sat-secondary-skills.json")
 
 WEEKS = [1, 2, 3, 4, 5]
 LETTERS = ["A", "B", "C", "D"]
@@ -68,7 +78,8 @@ def _dedupe(seq):
     return out
 
 
-def problem_doc(wk, it):
+def problem_doc(wk, it, spr=None):
+    """One Problem doc. spr: sprAnswers.analyze() of a grid-in item's key."""
     n = it["n"]
     domain = it["domain"]
     label = it["skill"]
@@ -81,6 +92,7 @@ def problem_doc(wk, it):
     doc = {
         "problemId": pid,
         "skillId": skill_id,
+        "secondarySkillIds": [],               # filled in batch by main() (bank-wide scoring)
         "prompt": it["stem"],
         "svg": svg,
         "difficulty": DIFFICULTY.get(it.get("difficulty"), 3),
@@ -106,6 +118,8 @@ def problem_doc(wk, it):
         equivs = [e for e in equivs if e.strip().lower() != primary.strip().lower()]
         doc["answerType"] = "constructed-response"
         doc["answer"] = {"type": "exact", "value": primary, "equivalents": equivs}
+        if spr:
+            doc["answer"]["numeric"] = {k: spr[k] for k in ("value", "exact", "tolerance", "alternates")}
 
     return doc
 
@@ -116,14 +130,22 @@ def main():
     by_skill = defaultdict(int)
     by_domain = defaultdict(set)
     unmapped = []
+    records = []   # (problemId, label, primary, domain) for the secondary-skill stage
     figs = 0
     n_mc = n_spr = 0
+    bad_equivs = []
 
     for wk in WEEKS:
         data = json.load(open(os.path.join(SRC, "sat_w%d.json" % wk)))
         refs = []
         for it in data["items"]:
-            doc = problem_doc(wk, it)
+            spr = None
+            if it["type"] != "mc":
+                spr = sprAnswers.analyze(it["spr_answer"], it.get("equivalents") or [],
+                                         it.get("answer_any") or [])
+                if spr and spr["inconsistent"]:
+                    bad_equivs.append((wk, it["n"], it["spr_answer"], spr["inconsistent"]))
+            doc = problem_doc(wk, it, spr)
             if doc["svg"]:
                 figs += 1
             if doc["skillId"] == "unmapped":
@@ -133,6 +155,7 @@ def main():
             else:
                 n_spr += 1
             items.append(doc)
+            records.append((doc["problemId"], it["skill"].lower(), doc["skillId"], it["domain"]))
             by_skill[doc["skillId"]] += 1
             by_domain[it["domain"]].add(doc["skillId"])
             refs.append({
@@ -149,6 +172,16 @@ def main():
             "items": refs,
         }
 
+    # Secondary skills: every other label rule that fires, scored bank-wide. The
+    # rules match the label, so this is a per-label map (see satSkillMap).
+    inferred, sec_stats = secondarySkills.infer(records, secondary_rules)
+    confidences = {}
+    for doc in items:
+        scored = inferred.get(doc["problemId"], [])
+        doc["secondarySkillIds"] = [sid for sid, _conf in scored]
+        if scored:
+            confidences[doc["problemId"]] = [{"skillId": sid, "confidence": c} for sid, c in scored]
+
     json.dump(items, open(ITEMS_OUT, "w"), indent=2, ensure_ascii=False)
     json.dump(amap, open(MAP_OUT, "w"), indent=2, ensure_ascii=False)
     json.dump({
@@ -156,17 +189,29 @@ def main():
         "byDomain": {d: sorted(s) for d, s in sorted(by_domain.items())},
         "domainName": DOMAIN_NAME,
     }, open(COVERAGE_OUT, "w"), indent=2, ensure_ascii=False)
+    json.dump(confidences, open(SECONDARY_OUT, "w"), indent=2, ensure_ascii=False)
+    # keep the cross-bank skill/tag index current (seeds/bank-index.sqlite)
+    bankIndex.update_bank("sat-items", items)
 
     n_expl = sum(1 for i in items if i["explanation"])
     print("Ingested %d Problem docs (%d MC + %d SPR) -> %s"
           % (len(items), n_mc, n_spr, os.path.relpath(ITEMS_OUT, os.getcwd())))
     print("  weeks: %d | figures (svg): %d | explanations: %d | unified skills used: %d"
           % (len(WEEKS), figs, n_expl, len({i["skillId"] for i in items})))
+    print("  secondary skills: %d of %d items tagged | over rule budget: %d"
+          % (len(confidences), sec_stats["items"], sec_stats["overBudget"]))
+    print("  grid-in numeric keys: %d of %d SPR"
+          % (sum(1 for i in items if "numeric" in i["answer"]), n_spr))
+    if bad_equivs:
+        print("  [warn] %d grid-ins list equivalents that disagree with the key: %s"
+              % (len(bad_equivs), bad_equivs[:6]))
     if unmapped:
         print("  [warn] %d items with an UNMAPPED skill: %s" % (len(unmapped), unmapped[:6]))
     else:
         print("  all items mapped to a unified skillId")
-    print("  wrote %s and %s" % (os.path.basename(MAP_OUT), os.path.basename(COVERAGE_OUT)))
+    distractorAudit.print_summary(items)
+    print("  wrote %s, %s and %s" % (os.path.basename(MAP_OUT), os.path.basename(COVERAGE_OUT),
+                                    os.path.basename(SECONDARY_OUT)))
 
 
 if __name__ == "__main__":
@@ -23,6 +23,9 @@ not retrievable, so topic decimals were NOT guessed. Those skills are marked
 `provisional: true` — they exist in the graph but are withheld from
 student-facing surfaces until someone maps them against the current CED.
 
+The integrated graph is validated (scripts/taxonomyGraph.py: cycles, edges up
+the level ladder) before anything is written.
+
 Idempotent. Usage: python3 scripts/integrateStatStrand.py --source PATH [--dry-run]
 """
 
@@ -30,6 +33,8 @@ import argparse
 import json
 import os
 
+import taxonomyGraph  # scripts/ is sys.path[0] when run as a script
+
 HERE = os.path.dirname(os.path.abspath(__file__))
 ROOT = os.path.dirname(HERE)
 TAX = os.path.join(ROOT, "seeds", "unified-taxonomy", "math_taxonomy.json")
@@ -61,13 +66,14 @@ def main():
 
     expansion = json.load(open(args.source))
     tax = json.load(open(TAX))
-    by_id = {s["skill_id"]: s for s in tax["skills"]}
 
     # --- course level --------------------------------------------------------
     if "STAT" not in tax["courses"]:
         tax["courses"].insert(tax["courses"].index(STAT_AFTER) + 1, "STAT")
         print("  + course level STAT (after %s)" % STAT_AFTER)
 
+    graph = taxonomyGraph.SkillGraph.from_taxonomy(tax)
+
     # --- skills --------------------------------------------------------------
     added, skipped = [], []
     provisional = []
@@ -76,7 +82,7 @@ def main():
 
     for s in expansion["skills"]:
         sid = s["skill_id"]
-        if sid in by_id:
+        if graph.has(sid):
             skipped.append(sid)
             continue
         entry = {k: s.get(k, [] if k.endswith("_ids") or k.endswith("_desc") else "") for k in TAXONOMY_FIELDS}
@@ -86,8 +92,7 @@ def main():
         if codes and all(c.startswith("AP-") for c in codes):
             entry["provisional"] = True
             provisional.append(sid)
-        tax["skills"].append(entry)
-        by_id[sid] = entry
+        tax["skills"].append(graph.add(entry))
         added.append(sid)
 
         if s.get("student_label"):
@@ -98,14 +103,11 @@ def main():
     # --- edges onto existing skills -----------------------------------------
     edged = []
     for sid, field, prereq in NEW_EDGES:
-        skill = by_id.get(sid)
-        if skill is None:
+        if not graph.has(sid):
             raise SystemExit("new_edge targets unknown skill: %s" % sid)
-        if prereq not in by_id:
+        if not graph.has(prereq):
             raise SystemExit("new_edge references unknown prereq: %s" % prereq)
-        cur = skill.setdefault(field, [])
-        if prereq not in cur:
-            cur.append(prereq)
+        if graph.add_edge(sid, field, prereq):
             edged.append("%s.%s += %s" % (sid, field, prereq))
 
     print("  + %d skills (%d already present)" % (len(added), len(skipped)))
@@ -114,6 +116,7 @@ def main():
         print("      %s" % e)
     print("  ! %d provisional (AP unit codes only, withheld from students):" % len(provisional))
     print("      %s" % ", ".join(provisional))
+    taxonomyGraph.check(graph, "after STAT integration")
 
     if args.dry_run:
         print("\ndry run — nothing written")
@@ -15,6 +15,10 @@ The audits produce two kinds of output and they are treated very differently:
     a human to accept or reject, because some will be judgment calls the
     taxonomy author had a reason for.
 
+The merged alignment is also indexed the other way round (standard -> skills
+-> items, with parent-code prefix queries) into seeds/standards-index.json by
+scripts/standardsIndex.py, for the tutor and standards reports.
+
 Usage: python3 scripts/mergeStandardsAudit.py [--audit-dir DIR]
 """
 
@@ -24,6 +28,9 @@ import os
 import re
 from collections import Counter, defaultdict
 
+import standardsIndex  # scripts/ is sys.path[0] when run as a script
+import taxonomyGraph
+
 HERE = os.path.dirname(os.path.abspath(__file__))
 ROOT = os.path.dirname(HERE)
 TAX = os.path.join(ROOT, "seeds", "skills-unified.json")
@@ -49,7 +56,7 @@ def main():
     ap.add_argument("--audit-dir", required=True, help="directory holding the per-strand audit JSON")
     args = ap.parse_args()
 
-    skills = {d["skillId"]: d for d in json.load(open(TAX))}
+    skills = taxonomyGraph.SkillGraph.from_docs(json.load(open(TAX)))
     ccss = json.load(open(CCSS)) if os.path.exists(CCSS) else {}
 
     alignment = {}
@@ -74,7 +81,7 @@ def main():
 
         for entry in data.get("skills", []):
             sid = entry.get("skill_id")
-            if sid not in skills:
+            if not skills.has(sid):
                 print("  audit references unknown skill: %s" % sid)
                 continue
             seen[sid] += 1
@@ -109,6 +116,7 @@ def main():
 
     json.dump(alignment, open(OUT, "w"), indent=1, sort_keys=True, ensure_ascii=False)
     json.dump(findings, open(REVIEW, "w"), indent=1, ensure_ascii=False)
+    index = standardsIndex.write(alignment)
 
     covered = len(alignment)
     dupes = [s for s, n in seen.items() if n > 1]
@@ -121,6 +129,8 @@ def main():
         print("  MALFORMED codes rejected: %d distinct" % len(unknown_codes))
         for c, ids in list(unknown_codes.items())[:5]:
             print("     %r  (e.g. %s)" % (c, ids[0]))
+    print("Standards index (code trie + standard -> skills -> items) -> %s: %d items reachable"
+          % (os.path.relpath(standardsIndex.OUT, ROOT), index["trie"]["items"]))
     print("Findings for review -> %s" % os.path.relpath(REVIEW, ROOT))
     for k, v in findings.items():
         if v:
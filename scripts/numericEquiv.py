@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Numeric fast path for answer equivalence: are two expressions the same value?
+
+sympy's `==` is STRUCTURAL — Float(-3.0) == -3 is False, and so is
+3*(x - 3)*(x + 3) == 3*x**2 - 27 — and proving equivalence symbolically
+(simplify(a - b) == 0) is slow. Both failure modes are why the Alg1 audit needed
+an allowlist. Two expressions that agree at a handful of random points are,
+for the polynomial/rational/elementary expressions in our banks, equal; two
+that disagree almost certainly are not. So:
+
+  1. evaluate a - b at SAMPLES random points with NumPy (seeded: the same
+     inputs always give the same verdict); for a batch, ONE lambdified vector
+     function evaluates every pair's difference over the shared points;
+  2. all finite samples within tolerance  -> equivalent, no sympy involved.
+     The tolerance is relative (RTOL of the larger side); the absolute floor
+     ZERO_ATOL only applies when BOTH sides are within it, to absorb float
+     cancellation noise (sin(pi) vs 0). A genuinely small value is not
+     rounded to zero: numeq(1e-10, 0) is False;
+  3. any disagreement, or too few finite samples (sqrt/log domain) -> escalate
+     to sympy (simplify(a - b) == 0, then a.equals(b)) for the final word.
+
+Public API:
+    equivalent(a, b) -> bool                  one pair
+    check_pairs(pairs, escalate=True) -> [bool]
+                                              many pairs, vectorized over all of them;
+                                              escalate=False takes a sampled disagreement
+                                              as final (screening mostly-different pairs)
+    numeq(a, b) -> bool                       drop-in for `a == b` in verify snippets:
+                                              exact == first, then the above for
+                                              numbers / sympy expressions (and
+                                              same-length sequences of them)
+
+Requires: sympy, numpy.
+"""
+
+import numpy as np
+import sympy
+
+SAMPLES = 12
+LOW, HIGH = -3.0, 3.0
+MIN_FINITE = 4
+RTOL = 1e-9
+ZERO_ATOL = 1e-12     # both sides this close to 0 are both 0 (float noise)
+
+
+def _as_expr(v):
+    """A sympy expression for a number or sympy object, else None."""
+    if isinstance(v, bool):
+        return None
+    if isinstance(v, sympy.Basic):
+        return v if isinstance(v, sympy.Expr) else None
+    if isinstance(v, (int, float, complex, np.number)):
+        return sympy.sympify(v)
+    try:
+        from fractions import Fraction
+        if isinstance(v, Fraction):
+            return sympy.Rational(v.numerator, v.denominator)
+    except ImportError:
+        pass
+    return None
+
+
+def _close(a, b):
+    scale = np.maximum(np.abs(a), np.abs(b))
+    return (np.abs(a - b) <= RTOL * scale) | (scale <= ZERO_ATOL)
+
+
+def _symbolic(a, b):
+    """The slow, final word."""
+    try:
+        if sympy.simplify(a - b) == 0:
+            return True
+        return bool(a.equals(b))
+    except (TypeError, ValueError, AttributeError, NotImplementedError):
+        return False
+
+
+def check_pairs(pairs, escalate=True):
+    """[bool] per (a, b) pair of sympy expressions. Every pair's value is sampled
+    at the same seeded points in one vectorized evaluation; only the pairs the
+    samples cannot settle are handed to sympy. With escalate=False a pair that
+    disagrees at a sample is simply not equivalent — two different values at one
+    point settle it — and sympy only sees pairs with too few finite samples."""
+    pairs = [(sympy.sympify(a), sympy.sympify(b)) for a, b in pairs]
+    if not pairs:
+        return []
+    syms = sorted(set().union(*(a.free_symbols | b.free_symbols for a, b in pairs)), key=str)
+    rng = np.random.default_rng(20240607)
+    pts = rng.uniform(LOW, HIGH, size=(len(syms), SAMPLES))
+    exprs = [e for a, b in pairs for e in (a, b)]
+    try:
+        fn = sympy.lambdify(syms, exprs, modules="numpy")
+        with np.errstate(all="ignore"):
+            vals = fn(*pts)
+        vals = [np.broadcast_to(np.asarray(v, dtype=complex), (SAMPLES,)) for v in vals]
+    except Exception:
+        if len(pairs) > 1:  # an expression numpy can't evaluate: bisect to isolate it
+            mid = len(pairs) // 2
+            return check_pairs(pairs[:mid], escalate) + check_pairs(pairs[mid:], escalate)
+        vals = None
+
+    out = []
+    for i, (a, b) in enumerate(pairs):
+        if vals is not None:
+            va, vb = vals[2 * i], vals[2 * i + 1]
+            ok = np.isfinite(va) & np.isfinite(vb)
+            if ok.sum() >= MIN_FINITE:
+                same = bool(np.all(_close(va[ok], vb[ok])))
+                if same or not escalate:
+                    out.append(same)
+                    continue
+        out.append(_symbolic(a, b))
+    return out
+
+
+def equivalent(a, b):
+    return check_pairs([(a, b)])[0]
+
+
+def numeq(a, b):
+    """`a == b`, except that numbers and sympy expressions compare by value."""
+    try:
+        if bool(a == b):
+            return True
+    except (TypeError, ValueError):
+        pass  # e.g. an array comparison with no single truth value
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(numeq(x, y) for x, y in zip(a, b))
+    ea, eb = _as_expr(a), _as_expr(b)
+    if ea is None or eb is None:
+        return False
+    return equivalent(ea, eb)
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Rule-coverage profiler for the ordered first-match skill classifiers:
+alg1SkillClassifier.RULES (run over every Alg1 item prompt) and satSkillMap.RULES
+(run over every SAT item's skill label).
+
+First-match tables rot in two quiet ways, and neither shows up as an error:
+
+  DEAD       the rule's pattern fires on no item at all.
+  SHADOWED   the pattern fires, but an earlier (broader) rule in the same group
+             always wins — e.g. module 1's r"evaluate|simplify" pre-empting
+             anything after it. The rule is unreachable as written.
+
+For every rule this reports winning hits, total fires (matches whether or not it
+won), which earlier rules pre-empted it and how often, and the mean regex time
+per call. It also flags patterns with catastrophic-backtracking risk: a
+statically nested quantifier ("(a+)+"), two or more unbounded wildcards in one
+branch ("x.*=.*x" is quadratic on a failing line), or a measured probe against
+long adversarial input that runs over PROBE_LIMIT_MS.
+
+Read-only — touches neither the rule tables nor the banks.
+
+Usage: python3 scripts/profileClassifierRules.py [--repeat N] [--json PATH] [--strict]
+  --strict   exit non-zero when any rule is dead, fully shadowed or risky
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+
+import alg1SkillClassifier as alg1
+import satSkillMap
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+ALG1_SRC = os.path.join(ROOT, "seeds", "alg1-assessments")
+SAT_SRC = os.path.join(ROOT, "seeds", "sat-math")
+ALG1_MODULES = [1, 2, 3, 4, 5, 6, 7, 10, 11]
+SAT_WEEKS = [1, 2, 3, 4, 5]
+
+PROBE_LIMIT_MS = 5.0
+# A quantified group whose body is itself quantified: (x+)+, (a|b*)*, (\w+){2,}
+NESTED_QUANT = re.compile(r"\((?:[^()\\]|\\.)*[+*}](?:[^()\\]|\\.)*\)[+*{]")
+WILDCARD = re.compile(r"\.[*+]")
+
+
+def alg1_corpus():
+    """{ rules module: [(location, text)] } for every Alg1 item (version 1 prompt)."""
+    out = defaultdict(list)
+    for mod in ALG1_MODULES:
+        data = json.load(open(os.path.join(ALG1_SRC, "alg1_m%d.json" % mod)))
+        for section in ("quiz", "test"):
+            for grp in ("items", "spiral"):
+                for it in data.get(section, {}).get(grp, []):
+                    rules_mod, text = alg1.rule_context(it, mod, is_spiral=(grp == "spiral"))
+                    out[rules_mod].append(("M%d/%s/%s/n%d" % (mod, section, grp, it["n"]), text))
+    return out
+
+
+def sat_corpus():
+    """{ domain: [(location, lowercased skill label)] } for every SAT item."""
+    out = defaultdict(list)
+    for wk in SAT_WEEKS:
+        for it in json.load(open(os.path.join(SAT_SRC, "sat_w%d.json" % wk)))["items"]:
+            out[it["domain"]].append(("W%d Q%d" % (wk, it["n"]), str(it["skill"]).lower()))
+    return out
+
+
+def backtracking_risk(pattern, rx):
+    """Reasons a pattern may backtrack badly, [] when it looks safe."""
+    why = []
+    if NESTED_QUANT.search(pattern):
+        why.append("nested quantifier")
+    if any(len(WILDCARD.findall(branch)) >= 2 for branch in pattern.split("|")):
+        why.append("2+ unbounded wildcards in one branch")
+    for probe in ("a" * 5000, "x = " * 1500, "(" * 3000, "= x " * 1500 + "!"):
+        t0 = time.perf_counter()
+        rx.search(probe)
+        ms = (time.perf_counter() - t0) * 1000
+        if ms > PROBE_LIMIT_MS:
+            why.append("adversarial probe took %.1f ms" % ms)
+            break
+    return why
+
+
+def profile(rules_by_group, corpus, repeat):
+    """Per-group rule stats. rules_by_group: { group: [(skillId, compiled)] }."""
+    report = []
+    for group in sorted(rules_by_group):
+        rules = rules_by_group[group]
+        texts = corpus.get(group, [])
+        hits = Counter()
+        fires = Counter()
+        preempted = defaultdict(Counter)          # rule index -> winning rule index -> n
+        for _loc, text in texts:
+            matched = [i for i, (_sid, rx) in enumerate(rules) if rx.search(text)]
+            if not matched:
+                continue
+            winner = matched[0]
+            hits[winner] += 1
+            for i in matched:
+                fires[i] += 1
+                if i != winner:
+                    preempted[i][winner] += 1
+
+        rows = []
+        for i, (sid, rx) in enumerate(rules):
+            t0 = time.perf_counter()
+            for _ in range(repeat):
+                for _loc, text in texts:
+                    rx.search(text)
+            calls = max(1, repeat * len(texts))
+            default = rx.pattern == "."           # catch-all: last by design, never "shadowed"
+            rows.append({
+                "index": i, "skillId": sid, "pattern": rx.pattern, "default": default,
+                "hits": hits[i], "fires": fires[i],
+                "dead": fires[i] == 0,
+                "shadowed": fires[i] > 0 and hits[i] == 0 and not default,
+                "preemptedBy": {"%d:%s" % (w, rules[w][0]): n for w, n in preempted[i].most_common()},
+                "usPerCall": round((time.perf_counter() - t0) * 1e6 / calls, 2),
+                "risk": backtracking_risk(rx.pattern, rx),
+            })
+        report.append({"group": group, "items": len(texts),
+                       "unmatched": len(texts) - sum(hits.values()), "rules": rows})
+    return report
+
+
+def print_report(title, report):
+    print(title)
+    for g in report:
+        print("\n  [%s] %d items, %d unmatched" % (g["group"], g["items"], g["unmatched"]))
+        print("    %3s %5s %5s %8s  %s" % ("#", "hits", "fires", "us/call", "rule"))
+        for r in g["rules"]:
+            flag = "DEAD" if r["dead"] else "SHADOWED" if r["shadowed"] else "(default)" if r["default"] else ""
+            if r["risk"]:
+                flag = (flag + " RISK").strip()
+            print("    %3d %5d %5d %8.2f  %-44s %s" % (r["index"], r["hits"], r["fires"], r["usPerCall"],
+                                                     r["skillId"], flag))
+            if r["preemptedBy"] and not r["default"] and (r["shadowed"] or r["hits"] < r["fires"]):
+                print("              pre-empted by %s" % ", ".join(
+                    "%s (%d)" % (k, n) for k, n in r["preemptedBy"].items()))
+            for why in r["risk"]:
+                print("              risk: %s  /%s/" % (why, r["pattern"]))
+
+
+def summarize(name, report):
+    rows = [r for g in report for r in g["rules"]]
+    return {
+        "ruleSet": name,
+        "rules": len(rows),
+        "dead": sum(1 for r in rows if r["dead"]),
+        "shadowed": sum(1 for r in rows if r["shadowed"]),
+        "risky": sum(1 for r in rows if r["risk"]),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=20, help="timing passes per rule (default 20)")
+    ap.add_argument("--json", help="also write the full report as JSON to PATH")
+    ap.add_argument("--strict", action="store_true", help="exit 1 on any dead, shadowed or risky rule")
+    args = ap.parse_args()
+
+    alg1_rules = {mod: [(sid, rx) for sid, _name, rx in rules] for mod, rules in alg1.COMPILED.items()}
+    sat_rules = {dom: [(sid, rx) for rx, sid in rules] for dom, rules in satSkillMap.COMPILED.items()}
+
+    sets = [
+        ("alg1SkillClassifier.RULES (Alg1 prompts, by rules module)", "alg1",
+         profile(alg1_rules, alg1_corpus(), args.repeat)),
+        ("satSkillMap.RULES (SAT skill labels, by domain)", "sat",
+         profile(sat_rules, sat_corpus(), args.repeat)),
+    ]
+    summary = []
+    for title, name, report in sets:
+        print_report(title, report)
+        print()
+        summary.append(summarize(name, report))
+
+    print("Summary")
+    for s in summary:
+        print("  %-5s %3d rules | dead %d | shadowed %d | backtracking risk %d"
+              % (s["ruleSet"], s["rules"], s["dead"], s["shadowed"], s["risky"]))
+
+    if args.json:
+        json.dump({"summary": summary, "ruleSets": {name: report for _t, name, report in sets}},
+                  open(args.json, "w"), indent=1, ensure_ascii=False)
+        print("  wrote %s" % args.json)
+
+    if args.strict and any(s["dead"] or s["shadowed"] or s["risky"] for s in summary):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
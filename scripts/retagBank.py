@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Apply the APPROVED rows of the legacy -> unified crosswalks to a generated item
+bank, in one streaming pass.
+
+The crosswalk worksheets end with "the crosswalk is applied to the items and
+re-seeded", but nothing did the applying. This rewrites `skillId` and
+`secondarySkillIds` of every doc in a bank through the approved crosswalk rows
+(seeds/unified-taxonomy/*-crosswalk.json, the files
+utils/skillCanonicalizer.js reads, minus pathway-crosswalk.json). Only rows
+marked `approved` count. The canonicalizer collapses mastery keys through
+every row, but moving items needs the review decision. Secondary ids are
+mapped too, deduplicated, and any that collapse onto the new primary are
+dropped.
+
+contentHash: the template-built banks (scripts/lib/templateKit.js,
+buildCalcTopupItems.js) hash "skillId|prompt|value", so a re-tagged doc whose
+hash matches that recipe under its OLD skill gets it recomputed under the new
+one. The Fable ingesters hash "problemId|stem", which does not involve the
+skill and so stays as it is. Any other hash is left alone and counted.
+
+Banks are read as a stream: a JSON array (plain or .gz), parsed one doc at a
+time with raw_decode over a bounded buffer, or NDJSON. Memory is one doc plus
+one read chunk, whatever the size of the bank, so the low-volume and ACT banks
+migrate the same way as Alg1. Output:
+  --delta DIR  every CHANGED doc, one per line, as <bank>.delta.ndjson
+               (default seeds/retag-deltas/, git-ignored): what a seeder upserts
+  --write      also rewrite the bank file in place (streamed to a temp file,
+               same layout and compression), so the next re-seed carries the new ids
+
+--write is one-way: the legacy ids are gone from the bank afterwards. Review
+first, then apply: finish the worksheet, re-run scripts/crosswalkBuilder.py
+(alg1UnifiedCrosswalk.py for Alg1), then --write. The builder accepts a row
+that has already been applied and keeps its itemCount, so rows approved later
+can be applied by another run. But an applied row is settled: changing its
+unifiedId afterwards moves nothing, because no doc carries its legacy id any
+more.
+
+Usage: python3 scripts/retagBank.py BANK [BANK ...] [--crosswalk PATH ...] [--write] [--delta DIR]
+"""
+
+import argparse
+import glob
+import gzip
+import hashlib
+import json
+import os
+from collections import Counter
+
+import bankIndex  # scripts/ is sys.path[0] when run as a script
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+TAX_DIR = os.path.join(ROOT, "seeds", "unified-taxonomy")
+DELTA_DIR = os.path.join(ROOT, "seeds", "retag-deltas")
+
+CHUNK = 1 << 16
+_decoder = json.JSONDecoder()
+
+
+def approved_map(paths=None):
+    """{ legacy skillId: unified skillId } from the approved rows (first file wins)."""
+    if paths is None:
+        paths = [p for p in sorted(glob.glob(os.path.join(TAX_DIR, "*-crosswalk.json")))
+                 if os.path.basename(p) != "pathway-crosswalk.json"]
+    out = {}
+    for path in paths:
+        for row in json.load(open(path)).get("rows") or []:
+            if row.get("approved") and row.get("legacyId") and row.get("unifiedId"):
+                out.setdefault(row["legacyId"], row["unifiedId"])
+    return out
+
+
+def _open(path, mode):
+    return gzip.open(path, mode + "t", encoding="utf-8") if path.endswith(".gz") else open(path, mode, encoding="utf-8")
+
+
+class ArrayReader:
+    """Iterate the docs of a JSON-array file without loading it. Records the
+    layout (indent, trailing text) so a rewrite can reproduce it."""
+
+    def __init__(self, fh):
+        self.fh, self.buf, self.pos = fh, "", 0
+        self.indent, self.trailer = None, ""
+
+    def _fill(self):
+        data = self.fh.read(CHUNK)
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return bool(data)
+
+    def _skip(self, chars):
+        """Advance past `chars`; returns the text skipped."""
+        skipped = []
+        while True:
+            start = self.pos
+            while self.pos < len(self.buf) and self.buf[self.pos] in chars:
+                self.pos += 1
+            skipped.append(self.buf[start:self.pos])
+            if self.pos < len(self.buf) or not self._fill():
+                return "".join(skipped)
+
+    def __iter__(self):
+        self._skip(" \t\r\n")
+        if self.buf[self.pos:self.pos + 1] != "[":
+            raise ValueError("not a JSON array")
+        self.pos += 1
+        head = self._skip(" \t\r\n")
+        self.indent = len(head.split("\n")[-1]) if "\n" in head else None
+        while True:
+            self._skip(" \t\r\n,")
+            if self.buf[self.pos:self.pos + 1] == "]":
+                self.pos += 1
+                self.trailer = self.buf[self.pos:] + self.fh.read()
+                return
+            while True:
+                try:
+                    doc, end = _decoder.raw_decode(self.buf, self.pos)
+                    break
+                except json.JSONDecodeError:
+                    if not self._fill():
+                        raise
+            self.pos = end
+            yield doc
+
+
+class ArrayWriter:
+    """Write docs back in the reader's layout: json.dump(list, indent=n) or compact
+    (ndjson=True: one doc per line)."""
+
+    def __init__(self, fh, indent=None, ndjson=False):
+        self.fh, self.indent, self.ndjson, self.n = fh, indent, ndjson, 0
+
+    def write(self, doc):
+        if self.ndjson:
+            self.fh.write(json.dumps(doc, ensure_ascii=False) + "\n")
+        elif self.indent is None:
+            self.fh.write(("[" if not self.n else ", ") + json.dumps(doc, ensure_ascii=False))
+        else:
+            pad = " " * self.indent
+            text = json.dumps(doc, indent=self.indent, ensure_ascii=False).replace("\n", "\n" + pad)
+            self.fh.write(("[\n" if not self.n else ",\n") + pad + text)
+        self.n += 1
+
+    def close(self, trailer):
+        if self.ndjson:
+            return
+        if not self.n:
+            self.fh.write("[")
+        self.fh.write(("\n]" if self.indent is not None and self.n else "]") + trailer)
+
+
+def iter_docs(path, layout=None):
+    """Docs of a bank file. `layout` (a dict) gets the array's indent before the
+    first doc is yielded and its trailing text at the end."""
+    with _open(path, "r") as fh:
+        if ".ndjson" in path:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        reader = ArrayReader(fh)
+        for doc in reader:
+            if layout is not None and "indent" not in layout:
+                layout["indent"] = reader.indent
+            yield doc
+        if layout is not None:
+            layout.update(indent=reader.indent, trailer=reader.trailer)
+
+
+def _sha(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def retag(doc, mapping):
+    """(new doc, hash status) — the doc unchanged (same object) when nothing maps.
+    Status: None (unchanged), "recomputed", "kept" (skill-independent recipe) or "other"."""
+    old = doc.get("skillId")
+    new = mapping.get(old, old)
+    secondary = doc.get("secondarySkillIds")
+    new_secondary = None
+    if secondary is not None:
+        new_secondary = [s for s in dict.fromkeys(mapping.get(s, s) for s in secondary) if s != new]
+    if new == old and new_secondary == secondary:
+        return doc, None
+    out = dict(doc, skillId=new)
+    if secondary is not None:
+        out["secondarySkillIds"] = new_secondary
+    status = "other"
+    h = doc.get("contentHash")
+    value = str((doc.get("answer") or {}).get("value"))
+    if h and new != old and h == _sha("%s|%s|%s" % (old, doc.get("prompt"), value)):
+        out["contentHash"] = _sha("%s|%s|%s" % (new, doc.get("prompt"), value))
+        status = "recomputed"
+    elif h and h == _sha("%s|%s" % (doc.get("problemId"), doc.get("prompt"))):
+        status = "kept"
+    elif new == old:
+        status = "kept"                     # only secondary ids moved; no recipe involves them
+    return out, status
+
+
+def run(path, mapping, write=False, delta_dir=DELTA_DIR):
+    """Stream one bank. Returns Counter(docs, changed, hash statuses, moves)."""
+    stats = Counter()
+    base = os.path.basename(path).split(".")[0]
+    os.makedirs(delta_dir, exist_ok=True)
+    delta_path = os.path.join(delta_dir, base + ".delta.ndjson")
+    # _open picks the compression from the name, so the temp file keeps the ".gz"
+    tmp = path[:-3] + ".retag-tmp.gz" if path.endswith(".gz") else path + ".retag-tmp"
+    layout = {}
+    ndjson = ".ndjson" in path
+    with open(delta_path, "w", encoding="utf-8") as delta, (_open(tmp, "w") if write else open(os.devnull, "w")) as out:
+        writer = ArrayWriter(out, ndjson=ndjson)
+        for doc in iter_docs(path, layout):
+            writer.indent = layout.get("indent")
+            new, status = retag(doc, mapping)
+            stats["docs"] += 1
+            if status:
+                stats["changed"] += 1
+                stats["hash " + status] += 1
+                if new["skillId"] != doc.get("skillId"):
+                    stats["move %s -> %s" % (doc.get("skillId"), new["skillId"])] += 1
+                delta.write(json.dumps(new, ensure_ascii=False) + "\n")
+            writer.write(new)
+        writer.close(layout.get("trailer", ""))
+    if write and stats["changed"]:
+        os.replace(tmp, path)
+    elif os.path.exists(tmp):
+        os.remove(tmp)
+    if not stats["changed"]:
+        os.remove(delta_path)
+    return stats, delta_path
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("banks", nargs="+", help="*.generated.json[.gz] or *.ndjson[.gz] bank files")
+    ap.add_argument("--crosswalk", action="append", help="crosswalk file(s); default every reviewed *-crosswalk.json")
+    ap.add_argument("--write", action="store_true", help="rewrite the bank file(s) in place")
+    ap.add_argument("--delta", default=DELTA_DIR, help="directory for the changed-doc NDJSON deltas")
+    args = ap.parse_args()
+
+    mapping = approved_map(args.crosswalk)
+    print("Re-tag through %d approved crosswalk rows" % len(mapping))
+    for path in args.banks:
+        stats, delta_path = run(path, mapping, write=args.write, delta_dir=args.delta)
+        print("  %s: %d docs, %d re-tagged | contentHash %d recomputed, %d skill-independent, %d other"
+              % (os.path.relpath(path, ROOT), stats["docs"], stats["changed"], stats["hash recomputed"],
+                 stats["hash kept"], stats["hash other"]))
+        for k, n in sorted((k, n) for k, n in stats.items() if k.startswith("move ")):
+            print("      %4d  %s" % (n, k[5:]))
+        if stats["changed"]:
+            print("    delta -> %s%s" % (os.path.relpath(delta_path, ROOT), " | bank rewritten" if args.write else ""))
+    if args.write:
+        bankIndex.refresh()
+
+
+if __name__ == "__main__":
+    main()
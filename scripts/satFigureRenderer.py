@@ -15,6 +15,7 @@ import math
 
 import matplotlib
 matplotlib.use("Agg")
+matplotlib.rcParams["svg.hashsalt"] = "mathmatix"   # stable clip-path ids run to run
 import matplotlib.pyplot as plt
 
 import calcFigureRenderer as calc   # reuse fgraph + table
@@ -28,7 +29,8 @@ GRID = "#e2e8f0"
 
 def _mpl_svg(fig):
     buf = io.StringIO()
-    fig.savefig(buf, format="svg", bbox_inches="tight")
+    # no render date or library version in the output, so a re-ingest is byte-stable
+    fig.savefig(buf, format="svg", bbox_inches="tight", metadata={"Date": None, "Creator": None})
     plt.close(fig)
     svg = buf.getvalue()
     i = svg.find("<svg")
@@ -8,7 +8,15 @@ Labels carry parenthetical variants (e.g. "Nonlinear functions (exponential)")
 that route to different unified skills, so we match by ordered keyword rules per
 domain — most specific first.
 
-Public API: unified_skill(domain, label) -> skill_id  (or None if unmapped)
+Public API:
+    unified_skill(domain, label) -> skill_id  (or None if unmapped)
+    secondary_rules(domain)      -> [(skill_id, compiled, secondary)]  (for the batch
+                                    secondary-skill stage, secondarySkills.py)
+
+The rules read the skill LABEL, not the item text, so SAT secondary skills are
+a label map: every item with the same (domain, label) gets the same secondaries.
+The stem is not matched because these patterns describe labels ("one variable",
+"two-way") and would fire on stem wording by accident.
 """
 
 import re
@@ -71,9 +79,19 @@ RULES = {
 }
 
 
+# RULES with each pattern compiled once (shared by unified_skill and secondary_rules).
+COMPILED = {domain: [(re.compile(pat), sid) for pat, sid in rules] for domain, rules in RULES.items()}
+
+
 def unified_skill(domain, label):
     text = str(label or "").lower()
-    for pat, sid in RULES.get(domain, []):
-        if re.search(pat, text):
+    for rx, sid in COMPILED.get(domain, []):
+        if rx.search(text):
             return sid
     return None
+
+
+def secondary_rules(domain):
+    """Every rule of a domain; the "." default is a catch-all, not evidence, so it
+    never proposes a skill."""
+    return [(sid, rx, rx.pattern != ".") for rx, sid in COMPILED.get(domain, [])]
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Batch secondary-skill inference for the rule-classified banks.
+
+The first-match classifiers (alg1SkillClassifier.RULES, satSkillMap.RULES) stop
+at the first pattern that fires, so everything else an item exercises is thrown
+away — and the hand-kept alg1SkillClassifier.SECONDARY table only covers module
+3. This stage runs EVERY rule of the item's rule group (same compiled patterns
+the classifier uses) and keeps the skills whose rules fire besides the primary,
+scored by two bank-wide statistics gathered in the same pass:
+
+  specificity   1 - (share of the group's items the pattern fires on), counted
+                over every item it fires on, including the ones it wins as the
+                primary. A broad rule like r"\\bsolve\\b" fires on most of a module
+                and says nothing about the item; a narrow one is real evidence.
+  affinity      share of items WITH THIS PRIMARY on which the candidate fires.
+                A candidate that co-occurs with the primary across the bank is a
+                genuine overlap; a one-off co-fire is more likely incidental.
+
+  confidence = specificity * (0.5 + 0.5 * affinity)
+
+A rule can be marked as not a secondary source: a module's fallback (the broad
+last rule that catches whatever the specific ones missed) or a catch-all. Its
+fires still count toward the statistics, but it never proposes a skill. When a
+skill has several rules, its first (most specific) firing rule is the evidence.
+
+Only candidates at or above MIN_CONFIDENCE are kept, at most MAX_PER_ITEM per
+item. The work per item is the rule count times the text length, and the rule
+groups are small and fixed (17 rules at most), so the budget is on text: each
+rule evaluation spends len(text) of the item's BUDGET_CHARS. The committed banks
+peak near 3,100 characters scanned (a 389-character Alg1 item against an 8-rule
+module). An item whose next evaluation would overrun the budget stops there,
+keeps whatever fired so far, and is counted. The cap is a count, not a clock,
+so the generated banks do not depend on machine speed or load.
+
+Public API:
+    infer(records, rules_for, budget=BUDGET_CHARS) -> ({key: [(skillId, confidence)]}, stats)
+      records   iterable of (key, text, primary, group)
+      rules_for group -> [(skillId, compiled_pattern, secondary)]  secondary: may
+                the rule propose its skill (False for fallbacks and catch-alls)
+"""
+
+from collections import Counter, defaultdict
+
+BUDGET_CHARS = 4096    # per-item characters scanned, summed over rule evaluations
+MIN_CONFIDENCE = 0.5
+MAX_PER_ITEM = 3
+
+
+def infer(records, rules_for, budget=BUDGET_CHARS):
+    """Score every non-primary skill whose rule fires on each record (see module doc)."""
+    fired = {}                                   # key -> [(skillId, rule index), ...]
+    group_n = Counter()
+    rule_fire = defaultdict(Counter)             # group -> rule index -> items fired on
+    primary_n = Counter()
+    co = defaultdict(Counter)                    # primary -> skillId -> items co-fired
+    over_budget = 0
+    meta = {}
+
+    for key, text, primary, group in records:
+        hits = []
+        spent = 0
+        for n, (sid, rx, secondary) in enumerate(rules_for(group)):
+            spent += len(text)
+            if spent > budget:
+                over_budget += 1
+                break
+            if not rx.search(text):
+                continue
+            rule_fire[group][n] += 1
+            if secondary and sid != primary and sid not in [h for h, _n in hits]:
+                hits.append((sid, n))
+        fired[key] = hits
+        meta[key] = (primary, group)
+        group_n[group] += 1
+        primary_n[primary] += 1
+        for sid, _n in hits:
+            co[primary][sid] += 1
+
+    out = {}
+    for key, hits in fired.items():
+        primary, group = meta[key]
+        scored = []
+        for sid, n in hits:
+            specificity = 1.0 - rule_fire[group][n] / float(group_n[group])
+            affinity = co[primary][sid] / float(primary_n[primary])
+            conf = round(specificity * (0.5 + 0.5 * affinity), 2)
+            if conf >= MIN_CONFIDENCE:
+                scored.append((sid, conf))
+        scored.sort(key=lambda p: -p[1])
+        out[key] = scored[:MAX_PER_ITEM]
+
+    stats = {
+        "items": len(fired),
+        "withSecondary": sum(1 for v in out.values() if v),
+        "candidates": sum(len(v) for v in fired.values()),
+        "kept": sum(len(v) for v in out.values()),
+        "overBudget": over_budget,
+    }
+    return out, stats
@@ -4,28 +4,82 @@
 // Skill collection. Non-destructive upsert — these coexist with the existing
 // per-course catalog until items are migrated to the unified skill ids.
 //
+// Incremental by default. genUnifiedSkills.py diffs each regeneration against
+// the previous file and accumulates a per-skill change set in
+// seeds/skills-unified-changes.json. When that set ends at exactly the file on
+// disk (its `head` is the sha1 of skills-unified.json), only the added and
+// changed skills are written and the set is removed once applied. A missing or stale set means a full upsert, as
+// before. Removed skills are reported, never deleted (use --fresh).
+//
+// Updates are $set only, as they always were: a field the generator stopped
+// emitting is reported, never $unset. Skill docs carry fields other tools own
+// (and the generator has dropped fields by mistake before), so deleting one is
+// a deliberate, manual step.
+//
+// The change set describes what THIS database last received. Seeding a second
+// database (or a fresh one) needs --all.
+//
 // Usage:
-//   node scripts/seedUnifiedSkills.js            # upsert
+//   node scripts/seedUnifiedSkills.js            # apply the pending change set (or upsert all)
+//   node scripts/seedUnifiedSkills.js --all      # upsert every skill regardless
 //   node scripts/seedUnifiedSkills.js --fresh    # clear prior unified skills first
 //
 // Regenerate the JSON first if the taxonomy changed:
 //   python3 scripts/genUnifiedSkills.py
 
-require('dotenv').config();
+const crypto = require('crypto');
 const fs = require('fs');
 const path = require('path');
-const mongoose = require('mongoose');
 
 const FILE = path.join(__dirname, '..', 'seeds', 'skills-unified.json');
+const CHANGES = path.join(__dirname, '..', 'seeds', 'skills-unified-changes.json');
+
+/**
+ * What to write: { mode: 'full' | 'changes' | 'none', writes: [{ skill, dropped }],
+ * removed: [skillId], graphChanged, reason }. Pure — `changes` is the parsed
+ * change set (or null) and `fileHash` the sha1 of the skills file it must match.
+ */
+function plan(skills, changes, fileHash, { all = false } = {}) {
+  const full = (reason) => ({
+    mode: 'full', reason, removed: [], graphChanged: true,
+    writes: skills.map((skill) => ({ skill, dropped: [] })),
+  });
+  if (all) return full('--all');
+  if (!changes) return full('no pending change set');
+  if (changes.head !== fileHash) return full('change set does not match skills-unified.json');
+
+  const byId = new Map(skills.map((s) => [s.skillId, s]));
+  const writes = [];
+  const removed = [];
+  for (const [skillId, entry] of Object.entries(changes.skills).sort(([a], [b]) => (a < b ? -1 : 1))) {
+    if (entry.status === 'removed') {
+      removed.push(skillId);
+      continue;
+    }
+    const skill = byId.get(skillId);
+    if (!skill) return full(`change set names ${skillId}, which is not in the file`);
+    writes.push({ skill, dropped: entry.fields.filter((f) => !(f in skill)) });
+  }
+  return { mode: writes.length ? 'changes' : 'none', reason: 'pending change set', writes, removed,
+    graphChanged: Boolean(changes.graphChanged) };
+}
 
 async function main() {
+  require('dotenv').config();
+  const mongoose = require('mongoose');
+
   if (!process.env.MONGO_URI) { console.error('MONGO_URI not set.'); process.exit(1); }
   if (!fs.existsSync(FILE)) {
     console.error(`Missing ${path.relative(process.cwd(), FILE)} — run: python3 scripts/genUnifiedSkills.py`);
     process.exit(1);
   }
-  const skills = JSON.parse(fs.readFileSync(FILE, 'utf8'));
+  const bytes = fs.readFileSync(FILE);
+  const skills = JSON.parse(bytes.toString('utf8'));
+  const fileHash = crypto.createHash('sha1').update(bytes).digest('hex');
+  const changes = fs.existsSync(CHANGES) ? JSON.parse(fs.readFileSync(CHANGES, 'utf8')) : null;
   const fresh = process.argv.includes('--fresh');
+  const todo = plan(skills, changes, fileHash, { all: fresh || process.argv.includes('--all') });
+  console.log(`Plan: ${todo.mode === 'full' ? 'upsert all' : `${todo.writes.length} changed skill(s)`} (${todo.reason}).`);
 
   await mongoose.connect(process.env.MONGO_URI);
   const Skill = require('../models/skill');
@@ -36,26 +90,35 @@ async function main() {
   }
 
   let up = 0;
-  for (const s of skills) {
-    await Skill.updateOne(
-      { skillId: s.skillId },
-      {
-        $set: s,
-        // GET /api/mastery/map queries { isActive: true, source: 'unified-taxonomy' }
-        // and returns `seeded: false` when that finds nothing — the whole skill
-        // map goes dark. skills-unified.json does not carry isActive, so on
-        // insert it depends entirely on setDefaultsOnInsert; pinning it here
-        // means the map cannot hinge on that behaviour staying default-on.
-        //
-        // $setOnInsert, not $set: re-running this must never re-activate a
-        // skill somebody deliberately turned off.
-        $setOnInsert: { isActive: true },
-      },
-      { upsert: true }
-    );
+  const dropped = new Set();
+  for (const { skill: s, dropped: gone } of todo.writes) {
+    gone.forEach((f) => dropped.add(f));
+    await Skill.updateOne({ skillId: s.skillId }, {
+      $set: s,
+      // GET /api/mastery/map queries { isActive: true, source: 'unified-taxonomy' }
+      // and returns `seeded: false` when that finds nothing — the whole skill
+      // map goes dark. skills-unified.json does not carry isActive, so on
+      // insert it depends entirely on setDefaultsOnInsert; pinning it here
+      // means the map cannot hinge on that behaviour staying default-on.
+      //
+      // $setOnInsert, not $set: re-running this must never re-activate a
+      // skill somebody deliberately turned off.
+      $setOnInsert: { isActive: true },
+    }, { upsert: true });
     up += 1;
   }
   console.log(`Upserted ${up} unified taxonomy skills into MongoDB (source: unified-taxonomy).`);
+  if (dropped.size) {
+    console.warn(`The generator no longer emits ${[...dropped].sort().join(', ')}; existing values were left in place.`);
+  }
+  if (todo.removed.length) {
+    console.warn(`${todo.removed.length} skill(s) left the taxonomy and were NOT deleted: ${todo.removed.join(', ')}`);
+  }
+  if (todo.mode !== 'full' && todo.graphChanged) {
+    console.log('Prerequisite graph changed — restart the web tier so closure caches reload.');
+  }
+  // Applied (or superseded by a full upsert of the same file): nothing pending.
+  if (changes && changes.head === fileHash) fs.unlinkSync(CHANGES);
 
   // Say plainly whether the map will actually render, since "Upserted 349" and
   // "the map works" are not the same claim.
@@ -67,8 +130,12 @@ async function main() {
   process.exit(0);
 }
 
-main().catch(async (err) => {
-  console.error('seedUnifiedSkills failed:', err.message);
-  try { await mongoose.disconnect(); } catch { /* noop */ }
-  process.exit(1);
-});
+module.exports = { plan };
+
+if (require.main === module) {
+  main().catch(async (err) => {
+    console.error('seedUnifiedSkills failed:', err.message);
+    try { await require('mongoose').disconnect(); } catch { /* noop */ }
+    process.exit(1);
+  });
+}
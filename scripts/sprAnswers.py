@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Offline answer-equivalence stage for SAT student-produced-response (grid-in)
+items: parse every `spr_answer` and its `equivalents` into exact rationals, flag
+equivalents that disagree with the key (beyond the gridded-decimal tolerance:
+".6667" is a fine equivalent of 2/3, ".667" is not), and emit ONE canonical numeric value +
+tolerance per item. `answer_any` is different — it lists the other CORRECT
+VALUES of a multi-solution item ("one possible price": 4 or 16) — so each of
+its distinct values becomes an alternate, not an equivalence to check.
+
+Without this the runtime grader (utils/answerComparison.js) has to try every
+accepted string in turn and guess whether "0.75", "3/4" and ".75" agree. With
+`answer.numeric` on the Problem doc a grid-in is graded by a single
+|student - value| < tolerance compare.
+
+Tolerance follows the Digital SAT grid-in rule: a decimal that does not fit
+may be truncated or rounded to fill the grid (5 characters, 6 with a minus
+sign), but not shortened further — 2/3 accepts .6666 and .6667, not .667. A
+value whose decimal fits the grid exactly needs no slack (EXACT_TOL).
+
+Public API:
+    parse(s) -> Fraction | None               "7/2", "3.5", ".4", "-5", "−1/3"
+    grid_tolerance(value) -> float
+    analyze(primary, equivalents, answer_any=()) -> None when the key is not numeric, else
+        {"value", "exact", "tolerance", "alternates": [{"value", "exact", "tolerance"}],
+         "inconsistent": [equivalents != key], "unparsed": [non-numeric strings]}
+
+Usage: python3 scripts/sprAnswers.py [--json PATH]   (report over seeds/sat-math; exit 1 on inconsistencies)
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from fractions import Fraction
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+SRC = os.path.join(ROOT, "seeds", "sat-math")
+WEEKS = [1, 2, 3, 4, 5]
+
+GRID_CHARS = 5          # positive answers; a negative gets one more for the sign
+EXACT_TOL = 1e-9
+_NUMBER = re.compile(r"^-?(?:\d+(?:\.\d*)?|\.\d+)(?:/\d+)?$")
+
+
+def parse(s):
+    """Exact value of a grid-in answer string, or None if it isn't a plain number."""
+    t = str(s).strip().replace("−", "-")
+    if not _NUMBER.match(t):
+        return None
+    num, _, den = t.partition("/")
+    try:
+        value = Fraction(num)
+        return value / Fraction(den) if den else value
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _decimals(value, places):
+    """True when value has an exact decimal expansion of at most `places` digits."""
+    return (value * 10 ** places).denominator == 1
+
+
+def grid_tolerance(value):
+    """How far a gridded decimal may sit from the exact value (see module doc)."""
+    whole = len(str(abs(int(value)))) if abs(value) >= 1 else 0
+    places = GRID_CHARS - 1 - whole            # the decimal point takes one character
+    if places <= 0 or _decimals(value, places):
+        return EXACT_TOL                       # fits exactly, or must be entered as a fraction
+    return 10.0 ** -places
+
+
+def _numeric(value):
+    return {"value": float(value), "exact": str(value), "tolerance": grid_tolerance(value)}
+
+
+def analyze(primary, equivalents, answer_any=()):
+    key = parse(primary)
+    if key is None:
+        return None
+    inconsistent, unparsed, alternates = [], [], []
+    tol = grid_tolerance(key)
+    for e in equivalents:
+        v = parse(e)
+        if v is None:
+            unparsed.append(str(e))
+        elif v != key and not abs(float(v - key)) < tol:
+            inconsistent.append(str(e))
+    for e in answer_any:
+        v = parse(e)
+        if v is None:
+            unparsed.append(str(e))
+        elif v != key and v not in alternates:
+            alternates.append(v)
+    return dict(_numeric(key), alternates=[_numeric(v) for v in alternates],
+                inconsistent=inconsistent, unparsed=unparsed)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--json", help="also write { problemId: analysis } to PATH")
+    args = ap.parse_args()
+
+    out, bad, non_numeric = {}, [], []
+    for wk in WEEKS:
+        for it in json.load(open(os.path.join(SRC, "sat_w%d.json" % wk)))["items"]:
+            if it["type"] == "mc":
+                continue
+            pid = "sat-math-w%dq%d" % (wk, it["n"])
+            a = analyze(it.get("spr_answer"), it.get("equivalents") or [], it.get("answer_any") or [])
+            if a is None:
+                non_numeric.append((pid, it.get("spr_answer")))
+                continue
+            out[pid] = a
+            if a["inconsistent"]:
+                bad.append((pid, it["spr_answer"], a["inconsistent"]))
+
+    print("SAT grid-in answer equivalence")
+    print("  numeric keys: %d | non-numeric keys: %d | multi-solution: %d | with tolerance > exact: %d"
+          % (len(out), len(non_numeric), sum(1 for a in out.values() if a["alternates"]),
+             sum(1 for a in out.values() if a["tolerance"] > EXACT_TOL)))
+    for pid, key in non_numeric:
+        print("    ? %s  key %r is not a number (string-graded)" % (pid, key))
+    for pid, a in out.items():
+        if a["unparsed"]:
+            print("    ? %s  equivalents not numeric: %s" % (pid, ", ".join(a["unparsed"])))
+    if args.json:
+        json.dump(out, open(args.json, "w"), indent=1)
+        print("  wrote %s" % args.json)
+    if bad:
+        print("\n  INCONSISTENT EQUIVALENTS (%d):" % len(bad))
+        for pid, key, wrong in bad:
+            print("    x %s  key %s, but %s" % (pid, key, ", ".join(wrong)))
+        sys.exit(1)
+    print("\n  OK — every accepted equivalent equals its key.")
+
+
+if __name__ == "__main__":
+    main()
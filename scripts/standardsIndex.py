@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Reverse standards index: standard code -> unified skills -> bank problems.
+
+seeds/unified-taxonomy/standards-alignment.json answers "which codes does this
+skill carry". The tutor and the standards reports ask the reverse: which skills,
+and which items, sit under a standard. They also ask it by PARENT code, where
+"7.RP.A" covers "7.RP.A.2.b" and "HSF-IF" covers the whole cluster. Scanning the
+alignment for every request does not scale to a report over 400 codes. This
+writes the answer once, as seeds/standards-index.json (read by
+utils/standardsIndex.js):
+
+  trie           nested by code segment. Every node carries the skills of its
+                 whole subtree and the count of their distinct bank items, so a
+                 prefix query is one walk down the segments. A node whose path is
+                 itself an aligned code also lists its own skills.
+  skillProblems  unified skillId -> primary problemIds from the generated banks,
+                 crosswalk-canonicalized (bankIndex.unified_problems)
+  alignmentHash  sha1 of the standards-alignment.json bytes it was built from
+
+Segments: an "AP-CALC:" style framework prefix is one segment; the rest splits
+on "." and "-" (so "HSA-SSE.A.1" and "HSA.SSE.A.1" are the same path), and a
+lettered sub-part glued to its number ("7.RP.A.2b") becomes its own segment.
+utils/standardsIndex.js mirrors segments() for queries.
+
+mergeStandardsAudit.py rebuilds it whenever it writes the alignment. Run this
+directly after the banks change.
+
+Public API:
+    segments(code) -> [str]
+    build(alignment, skill_problems) -> artifact dict
+    write(alignment=None) -> artifact (reads the alignment file when not given)
+    lookup(artifact, prefix) -> trie node | None
+
+Usage: python3 scripts/standardsIndex.py [--query PREFIX]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+
+import bankIndex  # scripts/ is sys.path[0] when run as a script
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+ALIGNMENT = os.path.join(ROOT, "seeds", "unified-taxonomy", "standards-alignment.json")
+OUT = os.path.join(ROOT, "seeds", "standards-index.json")
+
+_GLUED = re.compile(r"^(\d+)([a-z])$")
+
+
+def segments(code):
+    framework, sep, rest = code.strip().partition(":")
+    segs = [framework] if sep else []
+    for part in re.split(r"[.\-]", rest if sep else framework):
+        m = _GLUED.match(part)
+        segs += [m.group(1), m.group(2)] if m else [part]
+    return [s for s in segs if s]
+
+
+def build(alignment, skill_problems):
+    root = {"skills": set(), "children": {}}
+    for skill_id, codes in alignment.items():
+        for code in codes:
+            node = root
+            node["skills"].add(skill_id)
+            for seg in segments(code):
+                node = node["children"].setdefault(seg, {"skills": set(), "children": {}})
+                node["skills"].add(skill_id)
+            node.setdefault("codes", set()).add(code)
+            node.setdefault("own", set()).add(skill_id)
+
+    def freeze(node):
+        pids = {p for s in node["skills"] for p in skill_problems.get(s, ())}
+        out = {"skills": sorted(node["skills"]), "items": len(pids)}
+        if "own" in node:
+            out["codes"] = sorted(node["codes"])
+            out["own"] = sorted(node["own"])
+        if node["children"]:
+            out["children"] = {seg: freeze(c) for seg, c in sorted(node["children"].items())}
+        return out
+
+    return {
+        "version": 1,
+        "links": sum(len(set(v)) for v in alignment.values()),
+        "trie": freeze(root),
+        "skillProblems": {s: sorted(skill_problems[s]) for s in sorted(alignment)
+                          if alignment[s] and skill_problems.get(s)},
+    }
+
+
+def write(alignment=None):
+    raw = open(ALIGNMENT, "rb").read()
+    if alignment is None:
+        alignment = json.loads(raw)
+    bankIndex.refresh()
+    artifact = build(alignment, bankIndex.unified_problems())
+    artifact["alignmentHash"] = hashlib.sha1(raw).hexdigest()
+    with open(OUT, "w") as fh:
+        json.dump(artifact, fh, separators=(",", ":"), sort_keys=True)
+    return artifact
+
+
+def lookup(artifact, prefix):
+    node = artifact["trie"]
+    for seg in segments(prefix):
+        node = (node.get("children") or {}).get(seg)
+        if node is None:
+            return None
+    return node
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--query", help="print the skills and item count under a code or parent code")
+    args = ap.parse_args()
+
+    artifact = write()
+    top = artifact["trie"]
+    print("Standards index -> %s" % os.path.relpath(OUT, ROOT))
+    print("  %d skill-code links | %d skills aligned | %d with bank items | %d items reachable by standard"
+          % (artifact["links"], len(top["skills"]), len(artifact["skillProblems"]), top["items"]))
+    for seg, node in top.get("children", {}).items():
+        print("    %-10s %3d skills  %4d items" % (seg, len(node["skills"]), node["items"]))
+    if args.query:
+        node = lookup(artifact, args.query)
+        if node is None:
+            print("\n  %s: no aligned skills" % args.query)
+        else:
+            print("\n  %s: %d skills, %d items" % (args.query, len(node["skills"]), node["items"]))
+            print("    %s" % ", ".join(node["skills"]))
+
+
+if __name__ == "__main__":
+    main()
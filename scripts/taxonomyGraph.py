@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+The unified taxonomy's prerequisite graph as one in-memory model, and its
+structural validation.
+
+SkillGraph is shared by every taxonomy tool (genUnifiedSkills, applyAuditFixes,
+integrateStatStrand, mergeStandardsAudit). Skill ids are interned to ints; each
+skill's prerequisites (per field) and dependents are sets of ints, kept in step
+with the source records by add_edge / set_edges. Membership, edge insertion and
+reverse lookups are O(1) and every derived index is linear in the edges — the
+tools used list scans (`if x not in enables`) that go quadratic as the taxonomy
+grows toward thousands of nodes. It loads either the taxonomy source
+(math_taxonomy.json: skill_id, prereq_ids, cross_prereq_ids) or generated Skill
+docs (skills-unified.json: skillId, prerequisites, crossPrereqs); ordered views
+come back in catalog order, so generated files stay stable.
+
+validate() makes the checks the graph's own tools assumed but never made.
+genUnifiedSkills.py only checked that prerequisite ids resolve;
+integrateStatStrand.py describes the course list as "used to validate edge
+direction", and nothing did.
+
+Errors (a bad edit the seeders must not ship):
+  unresolved    a prereq_ids / cross_prereq_ids entry that is not a skill
+  course        a skill whose course is not on the `courses` ladder
+  cycle         a strongly connected component (Tarjan, linear time) — every
+                closure walk over it is wrong, and nothing in it can be unlocked
+  level         an edge pointing UP the ladder: a skill requiring one from a
+                later course (an ALG1 skill gated behind GEO; STAT behind CALC)
+Warnings:
+  gated         a student-facing skill with a provisional skill among its
+                transitive prerequisites. Provisional skills are withheld from
+                students, so it stays locked on the board until they are verified
+                (or proved from above)
+  orphan        a skill with no prerequisites and nothing depending on it
+
+Everything is one pass over the edges plus one Tarjan pass, so it stays cheap
+as the taxonomy grows. applyAuditFixes.py and integrateStatStrand.py validate
+the edited taxonomy before writing it; genUnifiedSkills.py validates before
+generating.
+
+Public API:
+    SkillGraph.from_taxonomy(tax) / SkillGraph.from_docs(docs)
+        .has(id) .get(id) .add(record) .add_edge(id, field, prereq) .set_edges(id, field, ids)
+        .prerequisites(id) .dependents(id) .dangling .topological_order()
+    validate(tax_or_graph) -> [Finding(severity, check, skill_id, detail)]
+    check(tax_or_graph, what) -> findings; prints them and exits non-zero on any error
+
+Usage: python3 scripts/taxonomyGraph.py [--json PATH]
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import Counter, deque, namedtuple
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+TAX = os.path.join(ROOT, "seeds", "unified-taxonomy", "math_taxonomy.json")
+
+EDGE_FIELDS = ("prereq_ids", "cross_prereq_ids")
+DOC_FIELDS = ("prerequisites", "crossPrereqs")
+ERROR, WARNING = "error", "warning"
+
+Finding = namedtuple("Finding", "severity check skill_id detail")
+
+
+class SkillGraph:
+    """Prerequisite graph over interned skill ids (see module doc)."""
+
+    def __init__(self, id_key, fields, courses=()):
+        self.id_key = id_key
+        self.fields = fields
+        self.courses = list(courses)
+        self.ids = []            # int -> skill id, catalog order
+        self.index = {}          # skill id -> int
+        self.records = []        # int -> source record (mutated by add_edge / set_edges)
+        self.edges = {f: [] for f in fields}   # field -> int -> set(int)
+        self.parents = []        # int -> set(int), both fields
+        self.children = []       # int -> set(int)
+        self._pending = {}       # missing id -> [(int, field)], resolved if it is added later
+
+    @classmethod
+    def from_taxonomy(cls, tax):
+        return cls._load(cls("skill_id", EDGE_FIELDS, tax.get("courses") or []), tax["skills"])
+
+    @classmethod
+    def from_docs(cls, docs):
+        return cls._load(cls("skillId", DOC_FIELDS), docs)
+
+    @staticmethod
+    def _load(graph, records):
+        for r in records:
+            graph._intern(r)
+        for i, r in enumerate(records):
+            for f in graph.fields:
+                for p in r.get(f) or []:
+                    graph._link(i, f, p)
+        return graph
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _intern(self, record):
+        sid = record[self.id_key]
+        if sid in self.index:
+            raise ValueError("duplicate skill id %s" % sid)
+        i = self.index[sid] = len(self.ids)
+        self.ids.append(sid)
+        self.records.append(record)
+        for f in self.fields:
+            self.edges[f].append(set())
+        self.parents.append(set())
+        self.children.append(set())
+        return i
+
+    def _link(self, i, field, prereq):
+        j = self.index.get(prereq)
+        if j is None:
+            self._pending.setdefault(prereq, []).append((i, field))
+            return
+        self.edges[field][i].add(j)
+        self.parents[i].add(j)
+        self.children[j].add(i)
+
+    def has(self, sid):
+        return sid in self.index
+
+    def get(self, sid):
+        i = self.index.get(sid)
+        return None if i is None else self.records[i]
+
+    def add(self, record):
+        """Intern a new skill record (its edges included)."""
+        i = self._intern(record)
+        for f in self.fields:
+            for p in record.get(f) or []:
+                self._link(i, f, p)
+        for k, field in self._pending.pop(record[self.id_key], []):
+            self._link(k, field, record[self.id_key])
+        return record
+
+    def add_edge(self, sid, field, prereq):
+        """Append prereq to the skill's `field` list unless present; True if added."""
+        i = self.index[sid]
+        j = self.index.get(prereq)
+        if j is not None and j in self.edges[field][i]:
+            return False
+        cur = self.records[i].setdefault(field, [])
+        if prereq in cur:            # a dangling id already listed
+            return False
+        cur.append(prereq)
+        self._link(i, field, prereq)
+        return True
+
+    def set_edges(self, sid, field, prereqs):
+        """Replace the skill's `field` list (and its adjacency) wholesale."""
+        i = self.index[sid]
+        for j in self.edges[field][i]:
+            if not any(j in self.edges[f][i] for f in self.fields if f != field):
+                self.parents[i].discard(j)
+                self.children[j].discard(i)
+        self.edges[field][i] = set()
+        for missing in [m for m, refs in self._pending.items() if (i, field) in refs]:
+            self._pending[missing] = [r for r in self._pending[missing] if r != (i, field)]
+        self.records[i][field] = list(prereqs)
+        for p in prereqs:
+            self._link(i, field, p)
+
+    def prerequisites(self, sid, field=None):
+        """Prerequisite ids (one field, or both), in catalog order."""
+        i = self.index[sid]
+        return [self.ids[j] for j in sorted(self.edges[field][i] if field else self.parents[i])]
+
+    def dependents(self, sid):
+        """Ids of the skills that list this one as a prerequisite, in catalog order."""
+        return [self.ids[j] for j in sorted(self.children[self.index[sid]])]
+
+    @property
+    def dangling(self):
+        """[(skill id, field, missing id)] for every reference that does not resolve."""
+        return sorted((self.ids[i], f, m) for m, refs in self._pending.items() for i, f in refs)
+
+    def topological_order(self):
+        """Interned ints, prerequisites first (Kahn, catalog order among ties), or
+        None when the graph has a cycle."""
+        pending = [len(p) for p in self.parents]
+        ready = deque(i for i, n in enumerate(pending) if not n)
+        order = []
+        while ready:
+            i = ready.popleft()
+            order.append(i)
+            for c in sorted(self.children[i]):
+                pending[c] -= 1
+                if not pending[c]:
+                    ready.append(c)
+        return order if len(order) == len(self.ids) else None
+
+
+def strongly_connected(nodes, succ):
+    """Tarjan's SCCs, iteratively (no recursion limit at any depth). Components
+    come out dependencies-first: each after every component it can reach."""
+    index, low, on_stack = {}, {}, set()
+    stack, out = [], []
+    counter = 0
+    for root in nodes:
+        if root in index:
+            continue
+        work = [(root, iter(succ(root)))]
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            v, it = work[-1]
+            for w in it:
+                if w not in index:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack.add(w)
+                    work.append((w, iter(succ(w))))
+                    break
+                if w in on_stack:
+                    low[v] = min(low[v], index[w])
+            else:
+                work.pop()
+                if work:
+                    low[work[-1][0]] = min(low[work[-1][0]], low[v])
+                if low[v] == index[v]:
+                    comp = []
+                    while True:
+                        w = stack.pop()
+                        on_stack.discard(w)
+                        comp.append(w)
+                        if w == v:
+                            break
+                    out.append(comp)
+    return out
+
+
+def validate(tax):
+    """Findings for a taxonomy dict or a SkillGraph loaded from one."""
+    g = tax if isinstance(tax, SkillGraph) else SkillGraph.from_taxonomy(tax)
+    level = {c: n for n, c in enumerate(g.courses)}
+    course = [r.get("course") for r in g.records]
+    findings = []
+
+    for i, sid in enumerate(g.ids):
+        if course[i] not in level:
+            findings.append(Finding(ERROR, "course", sid, "course %r is not on the ladder %s"
+                                    % (course[i], g.courses)))
+    for sid, field, missing in g.dangling:
+        findings.append(Finding(ERROR, "unresolved", sid, "%s -> %s" % (field, missing)))
+    for field in g.fields:
+        for i, ups in enumerate(g.edges[field]):
+            for j in sorted(ups):
+                lp, ls = level.get(course[j]), level.get(course[i])
+                if lp is not None and ls is not None and lp > ls:
+                    findings.append(Finding(ERROR, "level", g.ids[i], "%s -> %s (%s above %s)"
+                                            % (field, g.ids[j], course[j], course[i])))
+
+    comps = strongly_connected(range(len(g)), lambda v: sorted(g.parents[v]))
+    cyclic = set()
+    for comp in comps:
+        if len(comp) > 1 or comp[0] in g.parents[comp[0]]:
+            cyclic.update(comp)
+            names = sorted(g.ids[v] for v in comp)
+            findings.append(Finding(ERROR, "cycle", names[0], "cycle through %d skill(s): %s"
+                                    % (len(comp), ", ".join(names))))
+
+    # components arrive prerequisites-first, so one pass settles "gated"
+    provisional = {i for i, r in enumerate(g.records) if r.get("provisional")}
+    behind = {}                       # skill -> a provisional skill beneath it, or None
+    for comp in comps:
+        for i in comp:
+            behind[i] = next((j if j in provisional else behind.get(j)
+                              for j in sorted(g.parents[i]) if j in provisional or behind.get(j) is not None),
+                             None)
+            if behind[i] is not None and i not in provisional and i not in cyclic:
+                findings.append(Finding(WARNING, "gated", g.ids[i], "requires provisional %s" % g.ids[behind[i]]))
+
+    for i, sid in enumerate(g.ids):
+        if not g.parents[i] and not g.children[i]:
+            findings.append(Finding(WARNING, "orphan", sid, "no prerequisites and nothing depends on it"))
+    return findings
+
+
+def print_findings(findings, what, warnings=True):
+    """Summary line plus each finding (errors only with warnings=False); returns the errors."""
+    errors = [f for f in findings if f.severity == ERROR]
+    counts = Counter(f.check for f in findings)
+    print("  graph check (%s): %d error(s), %d warning(s)%s" % (
+        what, len(errors), len(findings) - len(errors),
+        "" if not counts else " — " + ", ".join("%s %d" % kv for kv in sorted(counts.items()))))
+    for f in findings if warnings else errors:
+        print("    %s %-10s %-13s %s" % ("x" if f.severity == ERROR else "?", f.check, f.skill_id, f.detail))
+    return errors
+
+
+def check(tax, what):
+    """Validate (a taxonomy dict or SkillGraph) and report; exit before anything
+    is written when the graph is broken."""
+    findings = validate(tax)
+    if print_findings(findings, what, warnings=False):
+        raise SystemExit("taxonomy graph is invalid (%s) — nothing written" % what)
+    return findings
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--json", help="also write the findings as JSON to PATH")
+    args = ap.parse_args()
+
+    tax = json.load(open(TAX))
+    findings = validate(tax)
+    print("Taxonomy graph: %d skills, %d course levels" % (len(tax["skills"]), len(tax.get("courses") or [])))
+    errors = print_findings(findings, os.path.relpath(TAX, ROOT))
+    if args.json:
+        json.dump([f._asdict() for f in findings], open(args.json, "w"), indent=1)
+        print("  wrote %s" % args.json)
+    if errors:
+        sys.exit(1)
+    print("\n  OK — acyclic, every edge points down the course ladder.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Redundant-edge report for the unified taxonomy's prerequisite graph
+(seeds/unified-taxonomy/math_taxonomy.json): its transitive reduction.
+
+An edge A -> C is redundant when C is already reachable from A through another
+prerequisite (A -> B -> C). It adds nothing to what a skill requires, but every
+closure walk and every "locked behind" computation still follows it, and the
+audit findings (docs/SKILL_GRAPH_AUDIT_FINDINGS.json) will add more edges as
+missing prerequisites are accepted. The ones worth catching are the edges that
+went redundant as others were added.
+
+Reachability is a bitset per skill: in topological order each skill's ancestor
+set is the OR of its parents' sets plus the parents themselves. Edge
+parent -> skill is redundant iff that parent is in the ancestor set of one of
+the skill's OTHER parents. That is one pass over the edges plus one OR per
+edge, over ints of ~350 bits. The graph must be acyclic; on a cycle this exits
+and points at scripts/taxonomyGraph.py.
+
+A redundant cross_prereq_ids entry is reported separately. That field records
+the lower-course form of the same idea, so it carries meaning beyond
+reachability and is a review item, not an automatic deletion. Nothing here
+edits the taxonomy. --emit writes the reduced edge set for runtime unlock
+queries. The reduced set has the same closure and is not a replacement for the
+authored source.
+
+Usage: python3 scripts/taxonomyReduction.py [--json PATH] [--emit PATH]
+"""
+
+import argparse
+import json
+import os
+from collections import defaultdict
+
+import taxonomyGraph  # scripts/ is sys.path[0] when run as a script
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+TAX = os.path.join(ROOT, "seeds", "unified-taxonomy", "math_taxonomy.json")
+
+
+def ancestors(graph, order):
+    """Interned int -> bitset (by interned int) of every transitive prerequisite."""
+    anc = [0] * len(graph)
+    for i in order:
+        for p in graph.parents[i]:
+            anc[i] |= anc[p] | (1 << p)
+    return anc
+
+
+def redundant_edges(graph):
+    """[(skill id, field, prereq id, via prereq id)] for every edge implied by
+    another path; `via` is a sibling prerequisite that already reaches it."""
+    order = graph.topological_order()
+    if order is None:
+        raise SystemExit("prerequisite cycle — run scripts/taxonomyGraph.py for the skills involved")
+    anc = ancestors(graph, order)
+    out = []
+    for i in range(len(graph)):
+        ups = sorted(graph.parents[i])
+        for field in graph.fields:
+            for p in sorted(graph.edges[field][i]):
+                via = next((q for q in ups if q != p and anc[q] >> p & 1), None)
+                if via is not None:
+                    out.append((graph.ids[i], field, graph.ids[p], graph.ids[via]))
+    return out
+
+
+def reduced(graph, redundant):
+    """{skill id: [prereq ids]} with the redundant edges dropped, both fields merged."""
+    drop = {(sid, p) for sid, _, p, _ in redundant}
+    return {sid: [p for p in graph.prerequisites(sid) if (sid, p) not in drop] for sid in graph.ids}
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--json", help="also write the redundant edges as JSON to PATH")
+    ap.add_argument("--emit", help="write the reduced graph {skillId: [prereqIds]} to PATH")
+    args = ap.parse_args()
+
+    tax = json.load(open(TAX))
+    graph = taxonomyGraph.SkillGraph.from_taxonomy(tax)
+    redundant = redundant_edges(graph)
+    edges = sum(len(p) for p in graph.parents)
+
+    by_strand = defaultdict(list)
+    for r in redundant:
+        by_strand[graph.get(r[0]).get("strand")].append(r)
+    print("Taxonomy transitive reduction: %d skills, %d edges, %d redundant (%d same-level, %d cross-level)"
+          % (len(graph), edges, len(redundant),
+             sum(1 for r in redundant if r[1] == "prereq_ids"),
+             sum(1 for r in redundant if r[1] == "cross_prereq_ids")))
+    for strand in sorted(by_strand, key=lambda s: list(tax["strands"]).index(s) if s in tax["strands"] else 99):
+        rows = by_strand[strand]
+        print("\n  %s %s — %d redundant" % (strand, tax["strands"].get(strand, ""), len(rows)))
+        for sid, field, p, via in rows:
+            print("    %-13s %-17s %-13s (already via %s)" % (sid, field, p, via))
+
+    if args.json:
+        json.dump([{"skill_id": sid, "field": field, "prereq": p, "via": via, "strand": graph.get(sid).get("strand")}
+                   for sid, field, p, via in redundant], open(args.json, "w"), indent=1)
+        print("\n  wrote %s" % args.json)
+    if args.emit:
+        out = reduced(graph, redundant)
+        json.dump(out, open(args.emit, "w"), separators=(",", ":"))
+        print("  wrote reduced graph (%d edges) -> %s" % (sum(len(v) for v in out.values()), args.emit))
+    if not redundant:
+        print("\n  OK — no edge is implied by another path.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Shared `verify`-snippet runner for the bank audits (scripts/auditBanks.py).
+
+Each snippet is a small python/sympy program that raises (usually an
+AssertionError) when the authored answer is wrong. Snippets always run in
+worker processes — never in the audit process itself — that import sympy/numpy
+once at start-up; with --jobs N there are N of them. Results come back in the
+order the snippets were given, so reports and allowlist checks are identical
+whatever the job count.
+
+Workers are warm: besides the library imports, each keeps a snapshot of the
+namespace a snippet's leading import statements produce ("import sympy as sp",
+"from sympy import *", ...), built the first time that import header is seen.
+A snippet then runs its remaining statements in a fresh shallow copy of the
+snapshot, so re-binding names never leaks between snippets, but ~30 distinct
+headers across ~1,600 snippets are each executed once per worker instead of once
+per snippet. (As before, state hung on a module object — `sp.foo = 1` — is
+shared within a worker, exactly as sys.modules always shared it.)
+
+Every snippet is bounded, because one `solve` or `simplify` that blows up used
+to hang the whole audit:
+
+  --timeout SEC   wall-clock budget per snippet (SIGALRM in the worker). An
+                  overrun is a TIMEOUT — neither pass nor fail — with its
+                  elapsed time, so slow snippets are visible rather than hidden.
+  --mem-mb MB     address-space cap per worker (RLIMIT_AS). A snippet that
+                  exhausts it is an OOM outcome. 0 disables the cap.
+
+Both limits are POSIX-only; elsewhere snippets run unbounded, as before.
+
+SIGALRM cannot interrupt a long C call (a big sympy/gmpy operation), and a
+snippet can take its worker down with it (os._exit, a segfault, an abort under
+the memory cap). So the parent enforces the deadline too. It hands snippets to
+workers one at a time and waits on their pipes and process sentinels together.
+A worker that has not answered GRACE_S after --timeout is killed (TIMEOUT), a
+worker that dies is a CRASH, and either way a fresh worker takes its place and
+the run continues.
+
+Results are cached in seeds/verify-cache.sqlite (git-ignored), keyed by
+sha256(snippet + the sympy/numpy/python versions + the caller's `salt`), so an
+unchanged bank re-runs nothing and a library upgrade re-runs everything. The
+salt is for what the snippet text does not show: auditBanks passes its engine
+version and the numericEquiv source hash, which rewritten snippets import. Only PASS/FAIL are cached —
+a TIMEOUT, OOM or CRASH depends on the limits and the machine, so it is always
+retried.
+--force ignores the cache (and refreshes it).
+
+With profile=True every snippet is re-run (the cache is bypassed, timings are
+fresh) under cProfile, and its Result carries {function: seconds} for the
+sympy/numpy functions the snippet called DIRECTLY — "sympy/simplify/
+simplify.py:simplify", not the hundreds of internals beneath it — so a slow
+snippet can be pinned on the one call that made it slow.
+
+Public API:
+    prepare(code)        -> (globals, body)  snapshot copy + the statements after the imports
+    run_snippet(code)       exec one snippet (stdout swallowed); raises on failure
+    run_all(codes, jobs=1, timeout=TIMEOUT_S, mem_mb=MEM_MB, force=False, profile=False, salt="")
+        -> [Result]  (same order)
+      Result(outcome, error, seconds, cached, calls)   outcome: PASS | FAIL | TIMEOUT | OOM | CRASH
+                                                       calls: {function: seconds} | None
+    add_args(parser)        the shared --jobs / --timeout / --mem-mb / --force options
+    print_cache_note(rows)  one line: how many results came from the cache
+    print_limited(rows)     report [(loc, Result)] that hit a limit (LIMITED); returns how many
+"""
+
+import ast
+import contextlib
+import cProfile
+import hashlib
+import io
+import os
+import platform
+import pstats
+import signal
+import sqlite3
+import time
+from collections import deque, namedtuple
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import wait
+
+try:
+    import resource
+except ImportError:  # not POSIX
+    resource = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+CACHE = os.path.join(ROOT, "seeds", "verify-cache.sqlite")
+
+TIMEOUT_S = 60.0
+MEM_MB = 2048
+GRACE_S = 5.0       # past --timeout, how long the parent waits before killing a worker
+
+PASS, FAIL, TIMEOUT, OOM, CRASH = "pass", "fail", "timeout", "oom", "crash"
+LIMITED = (TIMEOUT, OOM, CRASH)      # hit a limit: neither pass nor fail
+Result = namedtuple("Result", "outcome error seconds cached calls", defaults=(False, None))
+PROFILED_PACKAGES = ("sympy", "numpy")
+
+_CAN_ALARM = hasattr(signal, "setitimer")
+
+
+class SnippetTimeout(BaseException):
+    """Raised in a worker when a snippet overruns its budget. BaseException so a
+    snippet's own `except Exception:` can't swallow it."""
+
+
+def _on_alarm(_signum, _frame):
+    raise SnippetTimeout()
+
+
+def _init_worker(mem_mb):
+    """Pay the sympy/numpy import once per process, then fence the process."""
+    for name in ("sympy", "numpy"):
+        try:
+            __import__(name)
+        except ImportError:
+            pass  # the snippets that need it will fail and be reported as usual
+    if mem_mb and resource is not None:
+        cap = mem_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (cap, cap))
+    if _CAN_ALARM:
+        signal.signal(signal.SIGALRM, _on_alarm)
+
+
+# worker-local: import-header source -> namespace it produces (never mutated)
+_SNAPSHOTS = {}
+
+
+def prepare(code):
+    """Split a snippet into its leading imports and the rest; return a fresh copy
+    of the imports' namespace snapshot (built once per worker) and the rest as
+    an ast.Module ready to compile. An import that fails is never cached."""
+    tree = ast.parse(code, "<verify>")
+    n = 0
+    while n < len(tree.body) and isinstance(tree.body[n], (ast.Import, ast.ImportFrom)):
+        n += 1
+    if n:
+        last = tree.body[n - 1]
+        lines = code.split("\n", last.end_lineno)
+        key = "\n".join(lines[:last.end_lineno - 1] + [lines[last.end_lineno - 1][:last.end_col_offset]])
+    else:
+        key = ""
+    base = _SNAPSHOTS.get(key)
+    if base is None:
+        base = {"__name__": "__verify__"}
+        exec(compile(ast.Module(tree.body[:n], type_ignores=[]), "<verify>", "exec"), base)
+        _SNAPSHOTS[key] = base
+    tree.body = tree.body[n:]
+    return dict(base), tree
+
+
+def run_snippet(code):
+    g, body = prepare(code)
+    with contextlib.redirect_stdout(io.StringIO()):
+        exec(compile(body, "<verify>", "exec"), g)
+
+
+def _direct_calls(prof):
+    """{ "sympy/solvers/solvers.py:solve": seconds } — inclusive time in library
+    functions called straight from snippet code (compiled as "<verify>")."""
+    out = {}
+    for (filename, _line, name), (_cc, _nc, _tt, _ct, callers) in pstats.Stats(prof).stats.items():
+        parts = filename.replace("\\", "/").split("/")
+        pkg = next((i for i in range(len(parts) - 1, -1, -1) if parts[i] in PROFILED_PACKAGES), None)
+        if pkg is None:
+            continue
+        spent = sum(c[3] for caller, c in callers.items() if caller[0] == "<verify>")
+        if spent:
+            label = "%s:%s" % ("/".join(parts[pkg:]), name)
+            out[label] = round(out.get(label, 0.0) + spent, 6)
+    return out
+
+
+def check(code, timeout=None, profile=False):
+    """Run one snippet in this (worker) process and classify the outcome."""
+    armed = bool(timeout) and _CAN_ALARM
+    prof = cProfile.Profile() if profile else None
+    t0 = time.perf_counter()
+    try:
+        if armed:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            if prof:
+                prof.enable()
+            run_snippet(code)
+        finally:
+            if prof:
+                prof.disable()
+            if armed:
+                signal.setitimer(signal.ITIMER_REAL, 0)
+        outcome, error = PASS, None
+    except SnippetTimeout:
+        outcome, error = TIMEOUT, "exceeded %gs" % timeout
+    except MemoryError:
+        outcome, error = OOM, "MemoryError: exceeded the worker memory cap"
+    except Exception as e:
+        outcome, error = FAIL, "%s: %s" % (type(e).__name__, str(e)[:70])
+    seconds = round(time.perf_counter() - t0, 4)
+    return Result(outcome, error, seconds, False, _direct_calls(prof) if prof else None)
+
+
+def _version(dist):
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        return version(dist)
+    except Exception:  # PackageNotFoundError, or no importlib.metadata
+        return "none"
+
+
+def env_tag():
+    """What a cached result depends on besides the snippet text."""
+    return "sympy=%s numpy=%s python=%s" % (_version("sympy"), _version("numpy"),
+                                           ".".join(platform.python_version_tuple()[:2]))
+
+
+def snippet_key(code, tag):
+    return hashlib.sha256((tag + "\0" + code).encode("utf-8")).hexdigest()
+
+
+def _cache_db(path=CACHE):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, outcome TEXT NOT NULL,"
+                 " error TEXT, seconds REAL NOT NULL)")
+    return conn
+
+
+def _worker(conn, mem_mb, timeout, profile):
+    """Worker loop: (index, snippet) in, (index, Result) out, until None or EOF."""
+    _init_worker(mem_mb)
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        i, code = job
+        conn.send((i, check(code, timeout, profile)))
+
+
+class _Slot:
+    """One worker process and the snippet it is running (None when idle)."""
+
+    def __init__(self, mem_mb, timeout, profile):
+        self.conn, child = Pipe()
+        self.proc = Process(target=_worker, args=(child, mem_mb, timeout, profile), daemon=True)
+        self.proc.start()
+        child.close()
+        self.job, self.started = None, 0.0
+
+    def stop(self, kill=False):
+        if kill:
+            self.proc.kill()
+        else:
+            with contextlib.suppress(OSError):
+                self.conn.send(None)
+        self.proc.join(1)
+        if self.proc.is_alive():
+            self.proc.kill()
+            self.proc.join()
+        self.conn.close()
+
+
+def _run(codes, jobs, timeout, mem_mb, profile=False):
+    jobs = min(max(1, jobs or os.cpu_count() or 1), len(codes))
+    spawn = lambda: _Slot(mem_mb, timeout, profile)
+    deadline = timeout + GRACE_S if timeout else None
+    results = [None] * len(codes)
+    queue = deque(range(len(codes)))
+    slots = [spawn() for _ in range(jobs)]
+    try:
+        while True:
+            for s in slots:
+                if s.job is None and queue:
+                    s.job, s.started = queue.popleft(), time.perf_counter()
+                    s.conn.send((s.job, codes[s.job]))
+            busy = [s for s in slots if s.job is not None]
+            if not busy:
+                return results
+            left = None
+            if deadline:
+                left = max(0.0, min(s.started for s in busy) + deadline - time.perf_counter())
+            ready = set(wait([s.conn for s in busy] + [s.proc.sentinel for s in busy], left))
+            now = time.perf_counter()
+            for n, s in enumerate(slots):
+                if s.job is None:
+                    continue
+                elapsed = round(now - s.started, 4)
+                if s.conn in ready:
+                    try:
+                        i, r = s.conn.recv()
+                    except (EOFError, OSError):
+                        pass             # died mid-reply: the sentinel says so below
+                    else:
+                        results[i], s.job = r, None
+                        continue
+                if not s.proc.is_alive():
+                    code = s.proc.exitcode
+                    results[s.job] = Result(CRASH, "worker died (%s)" % (
+                        "signal %d" % -code if code and code < 0 else "exit code %s" % code), elapsed)
+                elif deadline and now - s.started >= deadline:
+                    results[s.job] = Result(TIMEOUT, "exceeded %gs (worker killed)" % timeout, elapsed)
+                else:
+                    continue
+                s.stop(kill=True)
+                slots[n] = spawn()
+    finally:
+        for s in slots:
+            s.stop()
+
+
+def run_all(codes, jobs=1, timeout=TIMEOUT_S, mem_mb=MEM_MB, force=False, profile=False, salt=""):
+    """Check every snippet, re-running only cache misses (all of them with force
+    or profile) in worker processes; jobs 0 means os.cpu_count(). `salt` joins
+    the cache key (see module doc)."""
+    codes = list(codes)
+    if not codes:
+        return []
+    tag = env_tag() + (" " + salt if salt else "")
+    keys = [snippet_key(c, tag) for c in codes]
+    conn = _cache_db()
+    try:
+        known = {}
+        if not (force or profile):
+            for key in set(keys):
+                row = conn.execute("SELECT outcome, error, seconds FROM results WHERE key = ?",
+                                   (key,)).fetchone()
+                if row:
+                    known[key] = Result(row[0], row[1], row[2], True)
+        todo = sorted({k: c for k, c in zip(keys, codes) if k not in known}.items())
+        if todo:
+            fresh = _run([c for _, c in todo], jobs, timeout, mem_mb, profile)
+            for (key, _), r in zip(todo, fresh):
+                known[key] = r
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                                 [(key, r.outcome, r.error, r.seconds) for (key, _), r in zip(todo, fresh)
+                                  if r.outcome in (PASS, FAIL)])
+    finally:
+        conn.close()
+    return [known[k] for k in keys]
+
+
+def add_args(parser):
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="worker processes for the verify snippets (default 1; 0 = one per CPU)")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT_S,
+                        help="wall-clock seconds per snippet before it is a TIMEOUT (default %g)" % TIMEOUT_S)
+    parser.add_argument("--mem-mb", type=int, default=MEM_MB,
+                        help="address-space cap per worker in MB, 0 = none (default %d)" % MEM_MB)
+    parser.add_argument("--force", action="store_true",
+                        help="ignore the verify cache and re-run every snippet")
+
+
+def print_cache_note(rows):
+    hits = sum(1 for _, r in rows if r.cached)
+    if hits:
+        print("  from the verify cache: %d (unchanged snippets; --force to re-run)" % hits)
+
+
+def print_limited(rows):
+    """Print the snippets that hit --timeout or --mem-mb or crashed their worker
+    (neither pass nor fail)."""
+    limited = [(loc, r) for loc, r in rows if r.outcome in LIMITED]
+    if limited:
+        print("\n  HIT A RESOURCE LIMIT (%d) — unverified, not failed:" % len(limited))
+        for loc, r in limited:
+            print("    ! %s  %s  %s (%.2fs)" % (loc, r.outcome.upper(), r.error, r.seconds))
+    return len(limited)
@@ -250,6 +250,48 @@ describe('compareAnswer (the problem.checkAnswer engine)', () => {
     expect(compareAnswer('1/3', spec)).toBe(false);
   });
 
+  describe('grid-in numeric key (answer.numeric)', () => {
+    const twoThirds = {
+      value: '2/3',
+      equivalents: ['.6666', '.6667'],
+      numeric: { value: 2 / 3, exact: '2/3', tolerance: 1e-4, alternates: [] },
+    };
+
+    test('a gridded decimal inside the tolerance is correct, a shorter one is not', () => {
+      expect(compareAnswer('2/3', twoThirds)).toBe(true);
+      expect(compareAnswer('4/6', twoThirds)).toBe(true);
+      expect(compareAnswer('.6667', twoThirds)).toBe(true);
+      expect(compareAnswer('.667', twoThirds)).toBe(false);
+      expect(compareAnswer('.66', twoThirds)).toBe(false);
+    });
+
+    test('any alternate correct value of a multi-solution item grades correct', () => {
+      const spec = {
+        value: '8',
+        equivalents: ['-3'],
+        numeric: { value: 8, exact: '8', tolerance: 1e-9, alternates: [{ value: -3, exact: '-3', tolerance: 1e-9 }] },
+      };
+      expect(compareAnswer('8', spec)).toBe(true);
+      expect(compareAnswer('-3', spec)).toBe(true);
+      expect(compareAnswer('3', spec)).toBe(false);
+    });
+
+    test('non-numeric submissions still take the string cascade', () => {
+      const spec = { value: '4', numeric: { value: 4, exact: '4', tolerance: 1e-9, alternates: [] } };
+      expect(compareAnswer('x = 4', spec)).toBe(false);
+      expect(compareAnswer('four', spec)).toBe(false);
+      expect(compareAnswer(' 4 ', spec)).toBe(true);
+    });
+
+    test('a decimal numerator is not a number, so it cannot parse to its prefix', () => {
+      const spec = { value: '1.5', numeric: { value: 1.5, exact: '1.5', tolerance: 1e-9, alternates: [] } };
+      expect(compareAnswer('1.5/2', spec)).toBe(false);
+      expect(compareAnswer('1.5 1/2', spec)).toBe(false);
+      expect(compareAnswer('3/2', spec)).toBe(true);
+      expect(compareAnswer('1 1/2', spec)).toBe(true);
+    });
+  });
+
   test('free response: a missing answer key always grades false', () => {
     // The problem.correctAnswer / growth-check-0% bug class, both directions:
     // no key must never grade correct — not even for the literal string
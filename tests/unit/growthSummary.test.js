@@ -8,6 +8,10 @@
  * tutor can never tell two different stories.
  */
 
+jest.mock('../../models/skill', () => ({ find: jest.fn() }));
+
+const Skill = require('../../models/skill');
+const skillOverlay = require('../../utils/skillOverlay');
 const {
   summarizeGrowthStatus,
   buildGrowthCheckSummary,
@@ -16,6 +20,7 @@ const {
   buildDebriefInstruction,
   fallbackDebriefText,
   humanizeSkillId,
+  resolveSkillRefs,
 } = require('../../utils/growthSummary');
 
 const skill = (skillId, name) => ({ skillId, name });
@@ -248,3 +253,40 @@ describe('humanizeSkillId', () => {
     expect(humanizeSkillId('ratios')).toBe('ratios');
   });
 });
+
+describe('resolveSkillRefs', () => {
+  // The overlay ships with the code, so its first skill is a real unified id.
+  const [unifiedId, [unifiedLabel]] = Object.entries(
+    require('../../seeds/skills-unified-overlay.json').skills
+  )[0];
+
+  beforeEach(() => {
+    Skill.find.mockReset();
+    Skill.find.mockImplementation(() => ({
+      select: () => ({ lean: () => Promise.resolve([{ skillId: 'alg1-slope', studentLabel: 'Slope', displayName: 'Slope of a line' }]) }),
+    }));
+  });
+  afterEach(() => skillOverlay._reset());
+
+  test('unified ids come from the overlay; only the rest are queried', async () => {
+    const refs = await resolveSkillRefs([unifiedId, 'alg1-slope', 'ms-unseeded-skill', unifiedId]);
+    expect(refs).toEqual([
+      { skillId: unifiedId, name: unifiedLabel },
+      { skillId: 'alg1-slope', name: 'Slope' },
+      { skillId: 'ms-unseeded-skill', name: 'unseeded skill' },
+    ]);
+    expect(Skill.find).toHaveBeenCalledTimes(1);
+    expect(Skill.find.mock.calls[0][0]).toEqual({ skillId: { $in: ['alg1-slope', 'ms-unseeded-skill'] } });
+  });
+
+  test('an all-unified list never touches the Skill collection', async () => {
+    expect(await resolveSkillRefs([unifiedId])).toEqual([{ skillId: unifiedId, name: unifiedLabel }]);
+    expect(Skill.find).not.toHaveBeenCalled();
+  });
+
+  test('without an overlay every id falls back to the Skill query', async () => {
+    skillOverlay._setFile(require('path').join(require('os').tmpdir(), 'no-such-overlay.json'));
+    await resolveSkillRefs([unifiedId, 'alg1-slope']);
+    expect(Skill.find.mock.calls[0][0]).toEqual({ skillId: { $in: [unifiedId, 'alg1-slope'] } });
+  });
+});
@@ -0,0 +1,92 @@
+// tests/unit/retagBank.test.js
+// scripts/retagBank.py --write rewrites a bank IN PLACE, streamed through a temp
+// file. A rewrite that changes anything but the re-tagged ids (layout,
+// compression) corrupts or churns the bank, as it once did to every .gz bank by
+// writing plain text over it. Each layout the reader accepts must come back
+// byte-identical apart from the moved skillId and its recomputed contentHash.
+
+const crypto = require('crypto');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const zlib = require('zlib');
+const { execFileSync, spawnSync } = require('child_process');
+
+const SCRIPT = path.join(__dirname, '../../scripts/retagBank.py');
+const PYTHON = process.env.PYTHON || 'python3';
+const hasPython = spawnSync(PYTHON, ['--version']).status === 0;
+
+const sha = (text) => crypto.createHash('sha256').update(text).digest('hex');
+const recipe = (skillId, prompt, value) => sha(`${skillId}|${prompt}|${value}`);
+
+const DOCS = [
+  { problemId: 'p1', skillId: 'legacy-a', prompt: 'Solve x+1=2', answer: { value: 1 },
+    contentHash: recipe('legacy-a', 'Solve x+1=2', 1) },
+  { problemId: 'p2', skillId: 'legacy-b', prompt: 'Solve 2x=4', answer: { value: 2 } },
+  { problemId: 'p3', skillId: 'legacy-a', prompt: 'Solve x-3=0', answer: { value: 3 },
+    secondarySkillIds: ['legacy-b', 'legacy-a'] },
+];
+const CROSSWALK = { rows: [
+  { legacyId: 'legacy-a', unifiedId: 'ALG1.EQV.1', approved: true },
+  { legacyId: 'legacy-b', unifiedId: 'ALG1.EQV.2', approved: false },
+] };
+
+// What the bank should hold afterwards: only approved rows move, and the moved
+// doc's template hash is recomputed under its new skill.
+const EXPECTED = [
+  { ...DOCS[0], skillId: 'ALG1.EQV.1', contentHash: recipe('ALG1.EQV.1', 'Solve x+1=2', 1) },
+  DOCS[1],
+  { ...DOCS[2], skillId: 'ALG1.EQV.1', secondarySkillIds: ['legacy-b'] },
+];
+
+// Python's json.dumps separators, for the compact and NDJSON layouts.
+const py = (doc) => JSON.stringify(doc).replace(/":/g, '": ').replace(/,"/g, ', "');
+
+const LAYOUTS = {
+  'indented.json': (docs) => `${JSON.stringify(docs, null, 2)}\n`,
+  'compact.json': (docs) => `[${docs.map(py).join(', ')}]`,
+  'bank.ndjson': (docs) => docs.map((d) => `${py(d)}\n`).join(''),
+};
+
+const maybe = hasPython ? describe : describe.skip;
+
+maybe('retagBank --write', () => {
+  let dir;
+
+  beforeAll(() => {
+    dir = fs.mkdtempSync(path.join(os.tmpdir(), 'retag-'));
+    fs.writeFileSync(path.join(dir, 'crosswalk.json'), JSON.stringify(CROSSWALK));
+    const banks = [];
+    for (const [name, layout] of Object.entries(LAYOUTS)) {
+      fs.writeFileSync(path.join(dir, name), layout(DOCS));
+      fs.writeFileSync(path.join(dir, `${name}.gz`), zlib.gzipSync(layout(DOCS)));
+      banks.push(path.join(dir, name), path.join(dir, `${name}.gz`));
+    }
+    execFileSync(PYTHON, [SCRIPT, ...banks, '--crosswalk', path.join(dir, 'crosswalk.json'),
+      '--write', '--delta', path.join(dir, 'deltas')], { encoding: 'utf8', timeout: 60000 });
+  });
+
+  afterAll(() => fs.rmSync(dir, { recursive: true, force: true }));
+
+  for (const [name, layout] of Object.entries(LAYOUTS)) {
+    test(`${name} keeps its layout`, () => {
+      expect(fs.readFileSync(path.join(dir, name), 'utf8')).toBe(layout(EXPECTED));
+    });
+
+    test(`${name}.gz stays gzip and keeps its layout`, () => {
+      const raw = fs.readFileSync(path.join(dir, `${name}.gz`));
+      expect([raw[0], raw[1]]).toEqual([0x1f, 0x8b]);
+      expect(zlib.gunzipSync(raw).toString('utf8')).toBe(layout(EXPECTED));
+    });
+  }
+
+  test('no temp files are left behind', () => {
+    expect(fs.readdirSync(dir).filter((f) => f.includes('retag-tmp'))).toEqual([]);
+  });
+
+  test('the delta holds only the changed docs', () => {
+    const delta = fs.readFileSync(path.join(dir, 'deltas', 'indented.delta.ndjson'), 'utf8')
+      .trim().split('\n').map((l) => JSON.parse(l));
+    expect(delta).toEqual([EXPECTED[0], EXPECTED[2]]);
+  });
+});
@@ -0,0 +1,75 @@
+// tests/unit/retentionProbe.test.js
+// Skill importance for retention probes has two scoring paths: log-scaled
+// transitive impact from the precomputed closure, and the older `enables`
+// count. The closure path may only be taken when the artifact was built from
+// the catalog the database holds — a stale artifact must fall back, not
+// silently re-rank every probe.
+
+jest.mock('../../models/skill', () => ({ find: jest.fn() }));
+
+const fs = require('fs');
+const path = require('path');
+
+const Skill = require('../../models/skill');
+const closureIndex = require('../../utils/skillClosureIndex');
+const { configCache } = require('../../utils/cache');
+const { calculateSkillImportance, trustedClosureIndex } = require('../../utils/retentionProbe');
+
+const SKILLS = JSON.parse(
+  fs.readFileSync(path.join(__dirname, '../../seeds/skills-unified.json'), 'utf8')
+);
+
+function catalog(skills) {
+  Skill.find.mockImplementation(() => ({ lean: () => Promise.resolve(skills) }));
+}
+
+afterEach(() => {
+  configCache.invalidate('skills:unified');
+  closureIndex._reset();
+});
+
+describe('calculateSkillImportance', () => {
+  test('with an index: log-scaled transitive impact, saturating at IMPACT_FULL', () => {
+    const index = closureIndex.load();
+    const byImpact = [...SKILLS].sort((a, b) => index.impact(a.skillId) - index.impact(b.skillId));
+    const leaf = byImpact[0];
+    const hub = byImpact[byImpact.length - 1];
+    const mid = byImpact.find((s) => index.impact(s.skillId) > 0 && index.impact(s.skillId) < 50);
+
+    expect(calculateSkillImportance(leaf, index)).toBe(0);
+    expect(calculateSkillImportance(hub, index)).toBe(1);
+    expect(calculateSkillImportance(mid, index))
+      .toBeCloseTo(Math.log1p(index.impact(mid.skillId)) / Math.log1p(50), 6);
+  });
+
+  test('without an index: enables count, 5+ is full importance', () => {
+    expect(calculateSkillImportance({ skillId: 'x', enables: ['a', 'b', 'c'] })).toBeCloseTo(0.6, 6);
+    expect(calculateSkillImportance({ skillId: 'x', enables: Array(7).fill('a') })).toBe(1);
+    expect(calculateSkillImportance({ skillId: 'x' })).toBe(0);
+  });
+
+  test('a skill the index does not know falls back to enables', () => {
+    const index = closureIndex.load();
+    expect(calculateSkillImportance({ skillId: 'legacy-skill', enables: ['a'] }, index)).toBeCloseTo(0.2, 6);
+  });
+});
+
+describe('trustedClosureIndex', () => {
+  test('returns the index when it matches the seeded catalog', async () => {
+    catalog(SKILLS);
+    expect(await trustedClosureIndex()).toBe(closureIndex.load());
+  });
+
+  test('a stale artifact is not trusted', async () => {
+    const warn = jest.spyOn(console, 'warn').mockImplementation(() => {});
+    const moved = SKILLS.map((s, i) => (i === 0 ? { ...s, prerequisites: [...s.prerequisites, SKILLS[1].skillId] } : s));
+    catalog(moved);
+    expect(await trustedClosureIndex()).toBeNull();
+    warn.mockRestore();
+  });
+
+  test('an unseeded catalog is not trusted', async () => {
+    catalog([]);
+    expect(await trustedClosureIndex()).toBeNull();
+  });
+});
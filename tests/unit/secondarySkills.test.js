@@ -0,0 +1,50 @@
+// tests/unit/secondarySkills.test.js
+// scripts/secondarySkills.py runs every rule of an item's group, so its cost is
+// rules x text length. The per-item budget (BUDGET_CHARS) is on characters
+// scanned, the part that grows with the bank: a long item must stop at the
+// budget, keep what fired before it, and be counted, while short items in the
+// same pass are untouched.
+
+const path = require('path');
+const { execFileSync, spawnSync } = require('child_process');
+
+const SCRIPTS = path.join(__dirname, '../../scripts');
+const PYTHON = process.env.PYTHON || 'python3';
+const hasPython = spawnSync(PYTHON, ['--version']).status === 0;
+
+// Two rules that fire on every item: "P" is the primary, so only A and B can be
+// secondaries. The long item is 3000 characters, so its second evaluation would
+// take it to 6000 scanned, past the default 4096.
+const SNIPPET = `
+import json, re, sys
+import secondarySkills as S
+rules = [("A", re.compile("x"), True), ("B", re.compile("x"), True), ("P", re.compile("x"), True)]
+records = [("short%d" % i, "x" * 10, "P", "g") for i in range(3)] + [("long", "x" * 3000, "P", "g")]
+S.MIN_CONFIDENCE = 0
+out, stats = S.infer(records, lambda g: rules)
+json.dump({"budget": S.BUDGET_CHARS, "out": out, "stats": stats}, sys.stdout)
+`;
+
+const maybe = hasPython ? describe : describe.skip;
+
+maybe('secondarySkills.infer budget', () => {
+  let result;
+
+  beforeAll(() => {
+    result = JSON.parse(execFileSync(PYTHON, ['-c', SNIPPET], {
+      cwd: SCRIPTS, encoding: 'utf8', timeout: 60000, env: { ...process.env, PYTHONPATH: SCRIPTS },
+    }));
+  });
+
+  test('an item that would overrun the budget stops there and is counted', () => {
+    expect(3000 * 2).toBeGreaterThan(result.budget);
+    expect(result.stats.overBudget).toBe(1);
+    expect(result.out.long.map(([sid]) => sid)).toEqual(['A']);
+  });
+
+  test('items inside the budget run every rule', () => {
+    for (const key of ['short0', 'short1', 'short2']) {
+      expect(result.out[key].map(([sid]) => sid).sort()).toEqual(['A', 'B']);
+    }
+  });
+});
@@ -0,0 +1,62 @@
+// tests/unit/seedUnifiedSkills.test.js
+// The seeder's write plan. The script needs Mongo, but choosing which skills to
+// write from the change set genUnifiedSkills.py leaves behind is pure — and a
+// wrong choice silently leaves stale skills in the database.
+
+const { plan } = require('../../scripts/seedUnifiedSkills');
+
+const skills = [
+  { skillId: 'ALG1.EQV.1', displayName: 'Solve linear equations', prerequisites: [] },
+  { skillId: 'ALG1.EQV.2', displayName: 'Solve literal equations', prerequisites: ['ALG1.EQV.1'] },
+];
+
+const changeSet = (entries, head = 'abc') => ({ version: 1, base: 'old', head, graphChanged: false, skills: entries });
+
+describe('seedUnifiedSkills plan', () => {
+  test('no change set means a full upsert', () => {
+    const p = plan(skills, null, 'abc');
+    expect(p.mode).toBe('full');
+    expect(p.writes).toHaveLength(2);
+  });
+
+  test('a change set for a different file is ignored', () => {
+    const p = plan(skills, changeSet({}, 'other'), 'abc');
+    expect(p.mode).toBe('full');
+  });
+
+  test('--all wins over a matching change set', () => {
+    expect(plan(skills, changeSet({}), 'abc', { all: true }).mode).toBe('full');
+  });
+
+  test('only changed and added skills are written', () => {
+    const p = plan(skills, changeSet({
+      'ALG1.EQV.2': { status: 'changed', fields: ['displayName'], edgesAdded: [], edgesRemoved: [] },
+    }), 'abc');
+    expect(p.mode).toBe('changes');
+    expect(p.writes.map((w) => w.skill.skillId)).toEqual(['ALG1.EQV.2']);
+    expect(p.writes[0].dropped).toEqual([]);
+  });
+
+  test('fields the generator dropped are reported, never unset', () => {
+    const p = plan(skills, changeSet({
+      'ALG1.EQV.1': { status: 'changed', fields: ['grade'], edgesAdded: [], edgesRemoved: [] },
+    }), 'abc');
+    expect(p.writes[0].dropped).toEqual(['grade']);
+    expect(p.writes[0]).not.toHaveProperty('unset');
+  });
+
+  test('removed skills are reported, not written', () => {
+    const p = plan(skills, changeSet({
+      'ALG1.EQV.9': { status: 'removed', fields: [], edgesAdded: [], edgesRemoved: [] },
+    }), 'abc');
+    expect(p.mode).toBe('none');
+    expect(p.removed).toEqual(['ALG1.EQV.9']);
+  });
+
+  test('a change set naming a skill missing from the file falls back to full', () => {
+    const p = plan(skills, changeSet({
+      'ALG1.EQV.7': { status: 'added', fields: [], edgesAdded: [], edgesRemoved: [] },
+    }), 'abc');
+    expect(p.mode).toBe('full');
+  });
+});
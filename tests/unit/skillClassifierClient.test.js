@@ -0,0 +1,106 @@
+// tests/unit/skillClassifierClient.test.js
+// Guards the NDJSON client for scripts/classifyServer.py: ONE lazily spawned
+// server for many batches, results routed back by request id (even out of
+// order), and pending requests rejected — not hung — when the child exits.
+// The Python process is replaced by a fake with in-memory streams.
+
+const { EventEmitter } = require('events');
+const { PassThrough } = require('stream');
+
+const client = require('../../utils/skillClassifierClient');
+
+function fakeServer(respond) {
+  const proc = new EventEmitter();
+  proc.stdout = new PassThrough();
+  proc.stdin = new PassThrough();
+  proc.stdin.setEncoding('utf8');
+  proc.stdin.on('data', (chunk) => {
+    for (const line of chunk.split('\n').filter(Boolean)) respond(JSON.parse(line), proc);
+  });
+  setImmediate(() => proc.stdout.write('{"ready":true,"banks":["act","alg1","calc","sat"]}\n'));
+  return proc;
+}
+
+function reply(proc, obj) {
+  proc.stdout.write(JSON.stringify(obj) + '\n');
+}
+
+afterEach(() => client._reset());
+
+describe('skillClassifierClient', () => {
+  test('spawns once and reuses the server across batches', async () => {
+    const spawn = jest.fn(() => fakeServer((req, proc) => reply(proc, {
+      id: req.id,
+      results: req.items.map((e) => ({ bank: e.bank, skillId: `${e.bank}-x` })),
+    })));
+    client._setSpawn(spawn);
+
+    const a = await client.classify([{ bank: 'sat', item: {} }, { bank: 'act', item: {} }]);
+    const b = await client.classify([{ bank: 'calc', item: {} }]);
+
+    expect(a.map((r) => r.skillId)).toEqual(['sat-x', 'act-x']);
+    expect(b).toEqual([{ bank: 'calc', skillId: 'calc-x' }]);
+    expect(spawn).toHaveBeenCalledTimes(1);
+  });
+
+  test('routes responses by id when they arrive out of order', async () => {
+    const held = [];
+    client._setSpawn(() => fakeServer((req, proc) => {
+      held.push(req);
+      if (held.length === 2) {
+        for (const r of held.reverse()) reply(proc, { id: r.id, results: [{ skillId: r.items[0].bank }] });
+      }
+    }));
+
+    const [first, second] = await Promise.all([
+      client.classify([{ bank: 'alg1', item: {} }]),
+      client.classify([{ bank: 'sat', item: {} }]),
+    ]);
+    expect(first[0].skillId).toBe('alg1');
+    expect(second[0].skillId).toBe('sat');
+  });
+
+  test('a request-level error rejects that request only', async () => {
+    client._setSpawn(() => fakeServer((req, proc) => reply(proc, { id: req.id, error: 'request must be an object' })));
+    await expect(client.classify([{ bank: 'sat', item: {} }])).rejects.toThrow(/request must be an object/);
+  });
+
+  test('rejects pending requests when the server exits, then respawns', async () => {
+    const spawn = jest.fn()
+      .mockImplementationOnce(() => fakeServer((_req, proc) => proc.emit('exit', 1, null)))
+      .mockImplementationOnce(() => fakeServer((req, proc) => reply(proc, { id: req.id, results: [] })));
+    client._setSpawn(spawn);
+
+    await expect(client.classify([{ bank: 'sat', item: {} }])).rejects.toThrow(/exited/);
+    await expect(client.classify([{ bank: 'sat', item: {} }])).resolves.toEqual([]);
+    expect(spawn).toHaveBeenCalledTimes(2);
+  });
+
+  test('an EPIPE on stdin rejects pending requests instead of throwing', async () => {
+    // Emitted after the write returns, as the real pipe does: with no stdin
+    // listener this is an uncaught 'error' event, not a rejection.
+    client._setSpawn(() => fakeServer((_req, proc) => setImmediate(() => {
+      proc.stdin.emit('error', Object.assign(new Error('write EPIPE'), { code: 'EPIPE' }));
+    })));
+    await expect(client.classify([{ bank: 'sat', item: {} }])).rejects.toThrow(/EPIPE/);
+  });
+
+  test('close() before the server is ready rejects callers waiting on start-up', async () => {
+    client._setSpawn(() => {
+      const proc = new EventEmitter();
+      proc.stdout = new PassThrough();
+      proc.stdin = new PassThrough(); // never says {"ready": true}
+      return proc;
+    });
+    const waiting = client.classify([{ bank: 'sat', item: {} }]);
+    client.close();
+    await expect(waiting).rejects.toThrow(/closed/);
+  });
+
+  test('an empty batch resolves without spawning', async () => {
+    const spawn = jest.fn();
+    client._setSpawn(spawn);
+    await expect(client.classify([])).resolves.toEqual([]);
+    expect(spawn).not.toHaveBeenCalled();
+  });
+});
@@ -0,0 +1,80 @@
+// tests/unit/skillClosureIndex.test.js
+// The precomputed closure (seeds/skills-unified-closure.json, written by
+// scripts/genUnifiedSkills.py) must answer exactly what the graph walk in
+// utils/skillClosure.js answers — it replaces that walk for unlock and impact
+// queries — and must be keyed to the graph it was built from.
+
+const fs = require('fs');
+const path = require('path');
+
+const closureIndex = require('../../utils/skillClosureIndex');
+const { buildGraph, prerequisiteClosure } = require('../../utils/skillClosure');
+
+const SKILLS = JSON.parse(
+  fs.readFileSync(path.join(__dirname, '../../seeds/skills-unified.json'), 'utf8')
+);
+const graph = buildGraph(SKILLS);
+
+afterEach(() => closureIndex._reset());
+
+function descendantsByWalk(id) {
+  const seen = new Set();
+  const queue = [...graph.childrenOf(id)];
+  while (queue.length) {
+    const c = queue.shift();
+    if (seen.has(c)) continue;
+    seen.add(c);
+    queue.push(...graph.childrenOf(c));
+  }
+  return seen;
+}
+
+describe('skillClosureIndex', () => {
+  test('the committed artifact was built from the committed skill graph', () => {
+    const index = closureIndex.load();
+    expect(index).not.toBeNull();
+    expect(index.size).toBe(SKILLS.length);
+    expect(index.matches(SKILLS)).toBe(true);
+  });
+
+  test('ancestors and descendants agree with the graph walk for every skill', () => {
+    const index = closureIndex.load();
+    for (const { skillId } of SKILLS) {
+      expect(new Set(index.ancestors(skillId))).toEqual(new Set(prerequisiteClosure(graph, skillId)));
+      const below = descendantsByWalk(skillId);
+      expect(new Set(index.descendants(skillId))).toEqual(below);
+      expect(index.impact(skillId)).toBe(below.size);
+    }
+  });
+
+  test('requires() is a transitive bit test, not a one-hop check', () => {
+    const index = closureIndex.load();
+    const [deep] = SKILLS.filter((s) => index.depth(s.skillId) >= 3);
+    const far = prerequisiteClosure(graph, deep.skillId).find(
+      (id) => !graph.parentsOf(deep.skillId).includes(id)
+    );
+    expect(index.requires(deep.skillId, far)).toBe(true);
+    expect(index.requires(far, deep.skillId)).toBe(false);
+    expect(index.requires('NOT.A.SKILL', far)).toBe(false);
+  });
+
+  test('covered() is true exactly when every transitive prerequisite is owned', () => {
+    const index = closureIndex.load();
+    const target = SKILLS.find((s) => index.depth(s.skillId) >= 2).skillId;
+    const below = prerequisiteClosure(graph, target);
+    expect(index.covered(target, index.maskOf(below))).toBe(true);
+    expect(index.covered(target, index.maskOf(below.slice(1)))).toBe(false);
+    expect(index.covered(target, index.maskOf([]))).toBe(below.length === 0);
+  });
+
+  test('a changed edge list no longer matches', () => {
+    const index = closureIndex.load();
+    const edited = SKILLS.map((s, i) => (i === 0 ? { ...s, prerequisites: ['MS.QNT.1'] } : s));
+    expect(index.matches(edited)).toBe(false);
+  });
+
+  test('a missing artifact loads as null', () => {
+    closureIndex._setFile(path.join(__dirname, 'no-such-closure.json'));
+    expect(closureIndex.load()).toBeNull();
+  });
+});
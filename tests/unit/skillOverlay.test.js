@@ -0,0 +1,74 @@
+// tests/unit/skillOverlay.test.js
+// The overlay (seeds/skills-unified-overlay.json, written by
+// scripts/genUnifiedSkills.py) stands in for the Skill docs on student-facing
+// surfaces, so it must say exactly what the generator's sources say about every
+// skill: the reviewed student label (else the taxonomy name), the provisional
+// flag, strand and course.
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+
+const skillOverlay = require('../../utils/skillOverlay');
+
+const TAX_DIR = path.join(__dirname, '../../seeds/unified-taxonomy');
+const read = (name) => JSON.parse(fs.readFileSync(path.join(TAX_DIR, name), 'utf8'));
+const LABELS = read('student-labels.json').labels;
+const SKILLS = read('math_taxonomy.json').skills.map((s) => ({
+  skillId: s.skill_id,
+  studentLabel: LABELS[s.skill_id] || s.name,
+  provisional: Boolean(s.provisional),
+  strand: s.strand,
+  courseLevel: s.course,
+}));
+
+afterEach(() => skillOverlay._reset());
+
+describe('skillOverlay', () => {
+  test('the committed overlay agrees with the taxonomy and the reviewed labels', () => {
+    const overlay = skillOverlay.load();
+    expect(overlay).not.toBeNull();
+    expect(overlay.size).toBe(SKILLS.length);
+    for (const s of SKILLS) {
+      expect(overlay.get(s.skillId)).toMatchObject({
+        skillId: s.skillId,
+        label: s.studentLabel,
+        provisional: s.provisional,
+        strand: s.strand,
+        courseLevel: s.courseLevel,
+      });
+    }
+  });
+
+  test('storage keys resolve like logical ids; unknown ids are null', () => {
+    const overlay = skillOverlay.load();
+    const { skillId, studentLabel } = SKILLS[0];
+    expect(overlay.label(skillId.replace(/\./g, '_'))).toBe(studentLabel);
+    expect(overlay.get('order-of-operations')).toBeNull();
+    expect(overlay.label(null)).toBeNull();
+    expect(overlay.isProvisional('order-of-operations')).toBe(false);
+  });
+
+  test('visible() and band() drop provisional skills', () => {
+    const overlay = skillOverlay.load();
+    const provisional = SKILLS.filter((s) => s.provisional);
+    expect(provisional.length).toBeGreaterThan(0);
+    const ids = SKILLS.map((s) => s.skillId).concat('legacy-skill');
+    const shown = overlay.visible(ids);
+    expect(shown).toHaveLength(ids.length - provisional.length);
+    expect(shown.includes('legacy-skill')).toBe(true);
+
+    const p = provisional[0];
+    const band = overlay.band(p.strand, p.courseLevel);
+    expect(band.includes(p.skillId)).toBe(false);
+    expect(band).toEqual(
+      SKILLS.filter((s) => !s.provisional && s.strand === p.strand && s.courseLevel === p.courseLevel)
+        .map((s) => s.skillId)
+    );
+  });
+
+  test('a missing artifact loads as null', () => {
+    skillOverlay._setFile(path.join(os.tmpdir(), 'no-such-overlay.json'));
+    expect(skillOverlay.load()).toBeNull();
+  });
+});
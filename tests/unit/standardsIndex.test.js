@@ -0,0 +1,63 @@
+// tests/unit/standardsIndex.test.js
+// The reverse standards index (seeds/standards-index.json, written by
+// scripts/standardsIndex.py) must answer parent-code queries exactly as a scan
+// of the alignment file would — it replaces that scan for the tutor and reports.
+
+const fs = require('fs');
+const path = require('path');
+
+const standardsIndex = require('../../utils/standardsIndex');
+
+const ALIGNMENT = JSON.parse(
+  fs.readFileSync(path.join(__dirname, '../../seeds/unified-taxonomy/standards-alignment.json'), 'utf8')
+);
+
+afterEach(() => standardsIndex._reset());
+
+function skillsByScan(prefix) {
+  const want = standardsIndex.segments(prefix);
+  return Object.keys(ALIGNMENT).filter((s) => ALIGNMENT[s].some((code) => {
+    const segs = standardsIndex.segments(code);
+    return want.every((seg, i) => segs[i] === seg);
+  })).sort();
+}
+
+describe('standardsIndex', () => {
+  test('segments splits codes the way the Python builder does', () => {
+    expect(standardsIndex.segments('7.RP.A.2b')).toEqual(['7', 'RP', 'A', '2', 'b']);
+    expect(standardsIndex.segments('7.RP.A.2.b')).toEqual(['7', 'RP', 'A', '2', 'b']);
+    expect(standardsIndex.segments('HSA-SSE.A.1')).toEqual(['HSA', 'SSE', 'A', '1']);
+    expect(standardsIndex.segments('AP-CALC:1.10')).toEqual(['AP-CALC', '1', '10']);
+  });
+
+  test('parent-code queries match a scan of the alignment', () => {
+    const index = standardsIndex.load();
+    expect(index).not.toBeNull();
+    for (const prefix of ['7.RP.A', '7.RP', 'HSF-IF', 'HSA.SSE', 'AP-CALC:2', 'K']) {
+      expect(index.skillsUnder(prefix)).toEqual(skillsByScan(prefix));
+    }
+  });
+
+  test('a parent does not cover a sibling that merely shares a text prefix', () => {
+    const index = standardsIndex.fromArtifact({
+      trie: {
+        skills: ['A', 'B'], items: 0,
+        children: { HSF: { skills: ['A', 'B'], items: 0, children: {
+          IF: { skills: ['A'], items: 2, own: ['A'], codes: ['HSF-IF'] },
+          IFX: { skills: ['B'], items: 0, own: ['B'], codes: ['HSF-IFX'] },
+        } } },
+      },
+      skillProblems: { A: ['p1', 'p2'] },
+    });
+    expect(index.skillsUnder('HSF-IF')).toEqual(['A']);
+    expect(index.problemsUnder('HSF.IF')).toEqual(['p1', 'p2']);
+    expect(index.itemCount('HSF-IF')).toBe(2);
+    expect(index.has('HSF-IFZ')).toBe(false);
+    expect(index.skillsFor('HSF')).toEqual([]);
+  });
+
+  test('a missing artifact loads as null', () => {
+    standardsIndex._setFile(path.join(__dirname, 'no-such-standards-index.json'));
+    expect(standardsIndex.load()).toBeNull();
+  });
+});
@@ -40,10 +40,19 @@ function parseFractionOrDecimal(str) {
     return den === 0 ? null : num / den;
   }
 
+  // Any other slash ("1.5/2", "1/2/3") is not a number: parseFloat would read
+  // just the part before it.
+  if (s.includes('/')) return null;
+
   const num = parseFloat(s);
   return isNaN(num) ? null : num;
 }
 
+// A whole submission that is just a number: "-3", ".75", "2/3", "1 1/2".
+// Fractions are integer-only, as in parseFractionOrDecimal and
+// scripts/sprAnswers.py.
+const PLAIN_NUMBER = /^-?(?:\d+(?:\.\d*)?|\.\d+|\d+\s*\/\s*\d+|\d+\s+\d+\s*\/\s*\d+)$/;
+
 // Comparison-symbol synonyms: a student can select ">" where the key says
 // "greater than" (or vice versa) and still be right.
 const SYMBOL_MAP = {
@@ -202,6 +211,8 @@ function expressionMatch(userExpr, correctExpr) {
  * @param {Array}  [spec.options] - MC options ({text} objects or strings)
  * @param {String} [spec.correctOption] - MC letter label ('A'–'F')
  * @param {Object} [spec.tolerance] - see valuesMatch()
+ * @param {Object} [spec.numeric] - precomputed grid-in key (scripts/sprAnswers.py):
+ *   { value, tolerance, alternates: [{ value, tolerance }] }
  * @returns {Boolean}
  */
 function compareAnswer(userAnswer, spec = {}) {
@@ -295,6 +306,19 @@ function compareAnswer(userAnswer, spec = {}) {
     }
   }
 
+  // Grid-in fast path. SAT student-produced responses carry a numeric key
+  // resolved offline (canonical value, grid tolerance, the other correct values
+  // of a multi-solution item), so a plain-number submission is graded by one
+  // compare instead of trying every accepted string. Anything that isn't a
+  // plain number ("x = 4", "1/2 cup") still takes the string cascade below.
+  if (spec.numeric && !declaredMC && mcOptions.length === 0 && PLAIN_NUMBER.test(userStr)) {
+    const userVal = parseFractionOrDecimal(userStr);
+    if (userVal !== null) {
+      return [spec.numeric, ...(spec.numeric.alternates || [])]
+        .some((k) => Number.isFinite(k.value) && Math.abs(userVal - k.value) < (k.tolerance || 1e-9));
+    }
+  }
+
   // Value comparison for non-MC (or MC free-form fallback). A missing answer
   // key must grade FALSE, never stringify to "undefined" and match it — this
   // is the problem.correctAnswer / growth-check-0% bug class, both directions.
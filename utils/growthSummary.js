@@ -21,6 +21,7 @@
    ============================================================ */
 
 const { thetaToGradeLevel } = require('./catConfig');
+const skillOverlay = require('./skillOverlay');
 
 const round2 = (n) => Math.round(n * 100) / 100;
 
@@ -50,13 +51,26 @@ function summarizeGrowthStatus(thetaChange) {
 async function resolveSkillRefs(skillIds = []) {
   const ids = [...new Set(skillIds.filter(Boolean))];
   if (ids.length === 0) return [];
-  let byId = new Map();
+  // Unified skills resolve from the shipped overlay; only ids it does not know
+  // (legacy catalogs) cost a Skill query. The overlay is generated from
+  // student-labels.json, so an admin edit to a unified skill's studentLabel in
+  // Mongo does not show here until genUnifiedSkills.py is re-run and deployed.
+  const overlay = skillOverlay.load();
+  const byId = new Map();
+  for (const id of ids) {
+    const label = overlay && overlay.label(id);
+    if (label) byId.set(id, label);
+  }
+  const rest = ids.filter(id => !byId.has(id));
+  if (rest.length === 0) {
+    return ids.map(skillId => ({ skillId, name: byId.get(skillId) }));
+  }
   try {
     const Skill = require('../models/skill');
-    const docs = await Skill.find({ skillId: { $in: ids } })
+    const docs = await Skill.find({ skillId: { $in: rest } })
       .select('skillId displayName studentLabel')
       .lean();
-    byId = new Map(docs.map(d => [d.skillId, d.studentLabel || d.displayName || d.skillId]));
+    for (const d of docs) byId.set(d.skillId, d.studentLabel || d.displayName || d.skillId);
   } catch (err) {
     // Name lookup is decoration — never let it sink the completion response.
     console.warn('[growthSummary] skill name lookup failed:', err.message);
@@ -2,13 +2,55 @@
 // Retention Probe System: Spirals previously mastered skills to measure retention
 
 const Skill = require('../models/skill');
+const closureIndex = require('./skillClosureIndex');
+const { configCache } = require('./cache');
+
+// Downstream impact at which a skill counts as fully foundational. Impact is
+// heavy-tailed over the unified graph (median ~9, a few skills carry 300), so
+// it is scored on a log scale rather than capped linearly.
+const IMPACT_FULL = 50;
+
+// Last graphHash check, keyed by the catalog array and the index it compared.
+let verified = { skills: null, loaded: null, ok: false };
+
+/**
+ * The closure index, but only when it was built from the unified catalog the
+ * database holds. A stale artifact (an unseeded regeneration, a catalog seeded
+ * from another build) would silently re-rank every probe, so a mismatch means
+ * no index and importance falls back to the `enables` count.
+ * @returns {Promise<Object|null>}
+ */
+async function trustedClosureIndex() {
+  const index = closureIndex.load();
+  if (!index) return null;
+  const skills = await configCache.getOrSet(
+    'skills:unified',
+    () => Skill.find({ isActive: true, source: 'unified-taxonomy' }).lean(),
+    3600
+  );
+  if (verified.skills !== skills || verified.loaded !== index) {
+    const ok = skills.length > 0 && index.matches(skills);
+    if (!ok && skills.length) {
+      console.warn('[retentionProbe] skills-unified-closure.json does not match the Skill catalog; scoring by enables');
+    }
+    verified = { skills, loaded: index, ok };
+  }
+  return verified.ok ? index : null;
+}
 
 /**
  * Calculate skill importance based on how many skills depend on it
  * @param {Object} skill - Skill document from database
+ * @param {Object|null} [index] - closure index from trustedClosureIndex()
  * @returns {number} Importance score (0-1)
  */
-function calculateSkillImportance(skill) {
+function calculateSkillImportance(skill, index = null) {
+  // Unified skills: everything that transitively builds on this one, read from
+  // the precomputed closure (seeds/skills-unified-closure.json) — one lookup.
+  if (index && index.has(skill.skillId)) {
+    return Math.min(Math.log1p(index.impact(skill.skillId)) / Math.log1p(IMPACT_FULL), 1.0);
+  }
+
   // Skills that enable many other skills are more important
   const enablesCount = skill.enables?.length || 0;
 
@@ -79,6 +121,7 @@ async function selectSkillsForRetention(userSkillMastery, options = {}) {
   const skillIds = eligibleSkills.map(s => s.skillId);
   const skillDocs = await Skill.find({ skillId: { $in: skillIds } });
   const skillMap = new Map(skillDocs.map(s => [s.skillId, s]));
+  const index = prioritizeFoundational ? await trustedClosureIndex() : null;
 
   // Calculate priority scores for each skill
   const scoredSkills = eligibleSkills.map(skill => {
@@ -86,7 +129,7 @@ async function selectSkillsForRetention(userSkillMastery, options = {}) {
     if (!skillDoc) return null;
 
     const staleness = calculateStaleness(skill.lastPracticed);
-    const importance = prioritizeFoundational ? calculateSkillImportance(skillDoc) : 0.5;
+    const importance = prioritizeFoundational ? calculateSkillImportance(skillDoc, index) : 0.5;
 
     // Priority = weighted combination of staleness and importance
     // 60% staleness (time-based forgetting)
@@ -247,5 +290,6 @@ module.exports = {
   shouldInsertRetentionProbe,
   calculateRetentionMetrics,
   calculateStaleness,
-  calculateSkillImportance
+  calculateSkillImportance,
+  trustedClosureIndex
 };
@@ -0,0 +1,118 @@
+// Node-side client for scripts/classifyServer.py — skill classification for a
+// new item without a Python process per item.
+//
+// Why this exists: the bank classifiers (the Alg1 rule table, satSkillMap,
+// calcSkillMap, the ACT slug map) are Python, and each one compiles its rule
+// table at import. Shelling out once per item paid interpreter start-up plus
+// every compile on every call. The server loads everything ONCE and speaks
+// NDJSON over stdin/stdout, so this client spawns it lazily on first use, keeps
+// it alive, and multiplexes requests by id — a whole batch is one line each way.
+//
+//   const { classify } = require('./skillClassifierClient');
+//   const [r] = await classify([{ bank: 'sat', item: { domain: 'ALG', skill: '...' } }]);
+//   // r -> { bank, skillId, name, unifiedId, confidence }  or  { bank, error }
+//
+// If the child dies, every pending request rejects and the next classify()
+// spawns a fresh one. `_setSpawn` / `_reset` are test seams.
+
+const path = require('path');
+const childProcess = require('child_process');
+
+const SERVER = path.join(__dirname, '..', 'scripts', 'classifyServer.py');
+const PYTHON = process.env.PYTHON || 'python3';
+
+let spawnFn = childProcess.spawn;
+let child = null;
+let ready = null;     // Promise resolved by the server's {"ready": true} line
+let failStart = null; // rejects `ready`, so callers still waiting on start-up settle
+let nextId = 1;
+let pending = new Map(); // id -> { resolve, reject }
+
+function failAll(err) {
+  if (failStart) failStart(err);
+  for (const { reject } of pending.values()) reject(err);
+  pending = new Map();
+  child = null;
+  ready = null;
+  failStart = null;
+}
+
+function start() {
+  const proc = spawnFn(PYTHON, [SERVER], { stdio: ['pipe', 'pipe', 'inherit'] });
+  child = proc;
+  let buf = '';
+  let onReady;
+  ready = new Promise((resolve, reject) => { onReady = resolve; failStart = reject; });
+  // Never surface as an unhandled rejection when nobody is waiting on start-up.
+  ready.catch(() => {});
+
+  proc.stdout.setEncoding('utf8');
+  proc.stdout.on('data', (chunk) => {
+    buf += chunk;
+    let nl;
+    while ((nl = buf.indexOf('\n')) >= 0) {
+      const line = buf.slice(0, nl).trim();
+      buf = buf.slice(nl + 1);
+      if (!line) continue;
+      let msg;
+      try {
+        msg = JSON.parse(line);
+      } catch {
+        continue; // stray non-protocol output — ignore rather than wedge
+      }
+      if (msg.ready) { onReady(msg.banks || []); continue; }
+      const waiter = pending.get(msg.id);
+      if (!waiter) continue;
+      pending.delete(msg.id);
+      if (msg.error) waiter.reject(new Error(`classifyServer: ${msg.error}`));
+      else waiter.resolve(msg.results);
+    }
+  });
+
+  const onExit = (why) => {
+    if (child !== proc) return;
+    failAll(new Error(`classifyServer exited (${why})`));
+  };
+  proc.on('exit', (code, signal) => onExit(signal || `code ${code}`));
+  proc.on('error', (e) => onExit(e.message));
+  // A write racing the child's death fails with EPIPE on stdin; without a
+  // listener that is an unhandled 'error' event that takes down the web process.
+  proc.stdin.on('error', (e) => onExit(e.message));
+}
+
+/**
+ * Classify a batch of items in one round trip.
+ * @param {Array<{bank: string, item: object}>} items
+ * @returns {Promise<Array<object>>} one result per item, same order
+ */
+async function classify(items) {
+  if (!Array.isArray(items) || items.length === 0) return [];
+  if (!child) start();
+  const proc = child;
+  await ready;
+  // Closed (or replaced) while this call was waiting on start-up.
+  if (child !== proc) throw new Error('classifyServer closed');
+  const id = nextId++;
+  return new Promise((resolve, reject) => {
+    pending.set(id, { resolve, reject });
+    proc.stdin.write(JSON.stringify({ id, items }) + '\n');
+  });
+}
+
+/** Stop the server (closing stdin lets it exit cleanly). Safe to call twice. */
+function close() {
+  if (!child) return;
+  const proc = child;
+  failAll(new Error('classifyServer closed'));
+  proc.stdin.end();
+}
+
+function _setSpawn(fn) { spawnFn = fn || childProcess.spawn; }
+
+function _reset() {
+  close();
+  nextId = 1;
+  spawnFn = childProcess.spawn;
+}
+
+module.exports = { classify, close, _setSpawn, _reset };
@@ -0,0 +1,136 @@
+/**
+ * Precomputed prerequisite closure over the unified skill graph.
+ *
+ * WHY THIS EXISTS
+ * ---------------
+ * "Is A somewhere beneath B?", "has the student covered everything under B?"
+ * and "how much of the map sits on top of A?" were each answered by walking the
+ * graph at request time (utils/skillClosure.js, utils/retentionProbe.js). The
+ * graph only changes when scripts/genUnifiedSkills.py runs, so it now closes
+ * the graph once there and writes seeds/skills-unified-closure.json: every
+ * skill's ancestor and descendant set as a bitset, its depth, and its
+ * downstream-impact count. Here each query is a bit test or a word-wise AND
+ * over ~11 32-bit words — no walk, no allocation per edge.
+ *
+ * The artifact is keyed to the graph by `graphHash` (sha1 of the sorted edge
+ * list, computed identically on both sides). `matches(skills)` tells a caller
+ * whether the skills it loaded are the graph the artifact was built from; when
+ * they are not, callers keep using the graph walk.
+ *
+ * Loading is lazy and cached per process. `_reset` / `_setFile` are test seams.
+ */
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+
+const DEFAULT_FILE = path.join(__dirname, '..', 'seeds', 'skills-unified-closure.json');
+
+let file = DEFAULT_FILE;
+let cached; // undefined = not loaded yet; null = no artifact on disk
+
+function decode(b64, words) {
+  const buf = Buffer.from(b64, 'base64');
+  const out = new Uint32Array(words);
+  for (let w = 0; w < words && w * 4 < buf.length; w++) out[w] = buf.readUInt32LE(w * 4);
+  return out;
+}
+
+function bitsToIds(order, bits) {
+  const ids = [];
+  for (let w = 0; w < bits.length; w++) {
+    let word = bits[w];
+    while (word) {
+      const low = word & -word;
+      ids.push(order[w * 32 + 31 - Math.clz32(low)]);
+      word ^= low;
+    }
+  }
+  return ids;
+}
+
+/** sha1 of "id:prereq,prereq" lines, sorted — mirrors genUnifiedSkills.graph_hash. */
+function graphHash(skills) {
+  const lines = skills.map((s) => {
+    const ups = [...new Set([...(s.prerequisites || []), ...(s.crossPrereqs || [])])].sort();
+    return `${s.skillId}:${ups.join(',')}`;
+  }).sort();
+  return crypto.createHash('sha1').update(lines.join('\n')).digest('hex');
+}
+
+/** Build the query index from the parsed artifact. */
+function fromArtifact(artifact) {
+  const { order } = artifact;
+  const words = Math.ceil(order.length / 32);
+  const pos = new Map(order.map((id, i) => [id, i]));
+  const ancestors = artifact.ancestors.map((b) => decode(b, words));
+  const descendants = artifact.descendants.map((b) => decode(b, words));
+  const at = (id) => pos.get(id);
+  const testBit = (bits, i) => (bits[i >>> 5] >>> (i & 31)) & 1;
+
+  return {
+    graphHash: artifact.graphHash,
+    size: order.length,
+    has: (id) => pos.has(id),
+    matches: (skills) => graphHash(skills) === artifact.graphHash,
+
+    /** Is `prereqId` a transitive prerequisite of `skillId`? */
+    requires(skillId, prereqId) {
+      const a = at(skillId);
+      const b = at(prereqId);
+      return a !== undefined && b !== undefined && testBit(ancestors[a], b) === 1;
+    },
+
+    /** Skills that transitively depend on this one (0 when unknown). */
+    impact: (id) => (at(id) === undefined ? 0 : artifact.impact[at(id)]),
+    depth: (id) => (at(id) === undefined ? 0 : artifact.depth[at(id)]),
+    ancestors: (id) => (at(id) === undefined ? [] : bitsToIds(order, ancestors[at(id)])),
+    descendants: (id) => (at(id) === undefined ? [] : bitsToIds(order, descendants[at(id)])),
+
+    /** A bitset of the given skill ids (unknown ids are ignored). */
+    maskOf(ids) {
+      const mask = new Uint32Array(words);
+      for (const id of ids) {
+        const i = at(id);
+        if (i !== undefined) mask[i >>> 5] |= 1 << (i & 31);
+      }
+      return mask;
+    },
+
+    /** Is every transitive prerequisite of `skillId` in `ownedMask`? */
+    covered(skillId, ownedMask) {
+      const a = at(skillId);
+      if (a === undefined) return false;
+      const anc = ancestors[a];
+      for (let w = 0; w < words; w++) {
+        if ((anc[w] & ~ownedMask[w]) !== 0) return false;
+      }
+      return true;
+    },
+  };
+}
+
+/** The index for seeds/skills-unified-closure.json, or null when it is absent. */
+function load() {
+  if (cached === undefined) {
+    try {
+      cached = fromArtifact(JSON.parse(fs.readFileSync(file, 'utf8')));
+    } catch (err) {
+      if (err.code !== 'ENOENT') throw err;
+      cached = null;
+    }
+  }
+  return cached;
+}
+
+function _reset() {
+  cached = undefined;
+  file = DEFAULT_FILE;
+}
+
+function _setFile(p) {
+  cached = undefined;
+  file = p;
+}
+
+module.exports = { load, fromArtifact, graphHash, _reset, _setFile };
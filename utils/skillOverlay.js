@@ -0,0 +1,97 @@
+/**
+ * Student-facing skill overlay: skillId -> label, provisional, strand, course.
+ *
+ * WHY THIS EXISTS
+ * ---------------
+ * scripts/genUnifiedSkills.py merges student-labels.json, the standards
+ * alignment and the `provisional` flag into every Skill doc, so rendering a
+ * skill chip or dropping provisional skills from a board meant loading full
+ * Skill docs (a Mongo query per request, e.g. utils/growthSummary.js) just to
+ * read four fields. The generator now also writes
+ * seeds/skills-unified-overlay.json, only those four fields per skill (~18 KB
+ * for the whole catalog), with strand and course interned as indexes. It ships
+ * with the code, so lookups here are synchronous and need no database.
+ *
+ * Ids may be logical ("MS.QNT.8") or skillMastery storage keys ("MS_QNT_8").
+ * Unknown ids return null / false: callers fall back to the Skill collection
+ * for ids the overlay does not cover (legacy kebab ids).
+ *
+ * Loading is lazy and cached per process. `_reset` / `_setFile` are test seams.
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+const { decodeMasteryKey } = require('./skillCanonicalizer');
+
+const DEFAULT_FILE = path.join(__dirname, '..', 'seeds', 'skills-unified-overlay.json');
+
+let file = DEFAULT_FILE;
+let cached; // undefined = not loaded yet; null = no artifact on disk
+
+/** Build the lookup from the parsed artifact. */
+function fromArtifact(artifact) {
+  const strands = artifact.strands.map(([code, name]) => ({ code, name }));
+  const courses = artifact.courses.map(([code, name]) => ({ code, name }));
+  const skills = new Map();
+  for (const [skillId, [label, provisional, strand, course]] of Object.entries(artifact.skills)) {
+    skills.set(skillId, {
+      skillId,
+      label,
+      provisional: provisional === 1,
+      strand: strands[strand].code,
+      strandName: strands[strand].name,
+      courseLevel: courses[course].code,
+      course: courses[course].name,
+    });
+  }
+  const get = (id) => (id == null ? null : skills.get(decodeMasteryKey(id)) || null);
+
+  return {
+    size: skills.size,
+    strands,
+    courses,
+    has: (id) => get(id) !== null,
+    /** { skillId, label, provisional, strand, strandName, courseLevel, course } or null. */
+    get,
+    label: (id) => (get(id) || {}).label || null,
+    isProvisional: (id) => (get(id) || {}).provisional === true,
+
+    /** The ids safe to show a student: drops provisional skills, keeps unknown ids. */
+    visible: (ids) => ids.filter((id) => !(get(id) || {}).provisional),
+
+    /** skillIds of every non-provisional skill in a strand/course band, catalog order. */
+    band(strand, courseLevel) {
+      const out = [];
+      for (const s of skills.values()) {
+        if (!s.provisional && s.strand === strand && s.courseLevel === courseLevel) out.push(s.skillId);
+      }
+      return out;
+    },
+  };
+}
+
+/** The overlay for seeds/skills-unified-overlay.json, or null when it is absent. */
+function load() {
+  if (cached === undefined) {
+    try {
+      cached = fromArtifact(JSON.parse(fs.readFileSync(file, 'utf8')));
+    } catch (err) {
+      if (err.code !== 'ENOENT') throw err;
+      cached = null;
+    }
+  }
+  return cached;
+}
+
+function _reset() {
+  cached = undefined;
+  file = DEFAULT_FILE;
+}
+
+function _setFile(p) {
+  cached = undefined;
+  file = p;
+}
+
+module.exports = { load, fromArtifact, _reset, _setFile };
@@ -0,0 +1,101 @@
+/**
+ * Reverse standards lookup: standard code (or parent code) → unified skills →
+ * bank problems.
+ *
+ * WHY THIS EXISTS
+ * ---------------
+ * The alignment file maps skill → codes. The tutor and the standards reports
+ * ask the other way round, and usually by PARENT code ("7.RP.A" covers
+ * "7.RP.A.2.b"). Answering that used to mean scanning every skill's alignment
+ * per request. scripts/standardsIndex.py (also run by mergeStandardsAudit.py)
+ * writes seeds/standards-index.json: a trie keyed by code segment, where every
+ * node already carries its subtree's skills and distinct item count, plus the
+ * skill → problemIds join against the generated banks. A query is one walk down
+ * the segments.
+ *
+ * `segments` mirrors standardsIndex.segments() in Python: an "AP-CALC:" style
+ * framework prefix is one segment, the rest splits on "." and "-", and a
+ * lettered sub-part glued to its number ("2b") is its own segment.
+ *
+ * Loading is lazy and cached per process. `_reset` / `_setFile` are test seams.
+ */
+
+const fs = require('fs');
+const path = require('path');
+
+const DEFAULT_FILE = path.join(__dirname, '..', 'seeds', 'standards-index.json');
+
+let file = DEFAULT_FILE;
+let cached; // undefined = not loaded yet; null = no artifact on disk
+
+function segments(code) {
+  const text = String(code || '').trim();
+  const colon = text.indexOf(':');
+  const segs = colon >= 0 ? [text.slice(0, colon)] : [];
+  for (const part of (colon >= 0 ? text.slice(colon + 1) : text).split(/[.-]/)) {
+    const glued = /^(\d+)([a-z])$/.exec(part);
+    if (glued) segs.push(glued[1], glued[2]);
+    else segs.push(part);
+  }
+  return segs.filter(Boolean);
+}
+
+/** Build the query index from the parsed artifact. */
+function fromArtifact(artifact) {
+  const skillProblems = artifact.skillProblems || {};
+
+  function nodeFor(code) {
+    let node = artifact.trie;
+    for (const seg of segments(code)) {
+      node = node.children && node.children[seg];
+      if (!node) return null;
+    }
+    return node;
+  }
+
+  return {
+    alignmentHash: artifact.alignmentHash,
+    has: (code) => nodeFor(code) !== null,
+
+    /** Skills aligned to this code or to any code beneath it. */
+    skillsUnder: (code) => (nodeFor(code) || { skills: [] }).skills,
+
+    /** Skills aligned to exactly this code. */
+    skillsFor: (code) => (nodeFor(code) || {}).own || [],
+
+    /** Distinct bank items under this code (precomputed). */
+    itemCount: (code) => (nodeFor(code) || { items: 0 }).items,
+
+    /** problemIds of every bank item under this code. */
+    problemsUnder(code) {
+      const out = new Set();
+      for (const s of this.skillsUnder(code)) for (const p of skillProblems[s] || []) out.add(p);
+      return [...out];
+    },
+  };
+}
+
+/** The index for seeds/standards-index.json, or null when it is absent. */
+function load() {
+  if (cached === undefined) {
+    try {
+      cached = fromArtifact(JSON.parse(fs.readFileSync(file, 'utf8')));
+    } catch (err) {
+      if (err.code !== 'ENOENT') throw err;
+      cached = null;
+    }
+  }
+  return cached;
+}
+
+function _reset() {
+  cached = undefined;
+  file = DEFAULT_FILE;
+}
+
+function _setFile(p) {
+  cached = undefined;
+  file = p;
+}
+
+module.exports = { load, fromArtifact, segments, _reset, _setFile };